@@ -23,6 +23,7 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from .exceptions import HomeAssistantError
 from .helpers import (
@@ -36,6 +37,7 @@ from .helpers import (
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.storage import Store
 from .helpers.typing import ConfigType
 from .setup import (
     DATA_SETUP,
@@ -59,6 +61,11 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 DATA_LOGGING = "logging"
 DATA_REGISTRIES_LOADED = "bootstrap_registries_loaded"
 
+STORAGE_IMPORT_GRAPH_KEY = "core.import_graph"
+STORAGE_IMPORT_GRAPH_VERSION = 1
+STORAGE_MANIFEST_INDEX_KEY = "core.manifest_index"
+STORAGE_MANIFEST_INDEX_VERSION = 1
+
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 
@@ -536,6 +543,28 @@ async def async_setup_multi_components(
             )
 
 
+async def _async_pre_import_integrations(
+    hass: core.HomeAssistant,
+    import_graph_store: Store[dict[str, Any]],
+    integrations: list[loader.Integration],
+) -> None:
+    """Import the integrations and platforms imported during the previous start.
+
+    The graph is only used when it was recorded by the same version, so
+    the requirements of the integrations are already installed.
+    """
+    if (
+        data := await import_graph_store.async_load()
+    ) is None or data["ha_version"] != __version__:
+        return
+
+    start = monotonic()
+    await loader.async_pre_import_integrations(
+        hass, integrations, data["integrations"]
+    )
+    _LOGGER.debug("Pre-imported integrations in %.2fs", monotonic() - start)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -547,6 +576,15 @@ async def _async_set_up_integrations(
 
     domains_to_setup = _get_domains(hass, config)
 
+    # Restore the integrations resolved during the previous start, so the
+    # dependencies resolve without reading the manifests
+    manifest_index_store: Store[dict[str, Any]] = Store(
+        hass, STORAGE_MANIFEST_INDEX_VERSION, STORAGE_MANIFEST_INDEX_KEY
+    )
+    if (manifest_index := await manifest_index_store.async_load()) is not None:
+        if not await loader.async_restore_manifest_index(hass, manifest_index):
+            _LOGGER.debug("Integration manifests changed since the previous start")
+
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start rightaway
     integration_cache: dict[str, loader.Integration] = {}
@@ -583,6 +621,14 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import in the executor before the setups import in the event loop
+    import_graph_store: Store[dict[str, Any]] = Store(
+        hass, STORAGE_IMPORT_GRAPH_VERSION, STORAGE_IMPORT_GRAPH_KEY
+    )
+    await _async_pre_import_integrations(
+        hass, import_graph_store, list(integration_cache.values())
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -685,3 +731,19 @@ async def _async_set_up_integrations(
             )
         },
     )
+    _LOGGER.debug(
+        "Integration import times: %s",
+        dict(
+            sorted(
+                hass.data[loader.DATA_IMPORT_TIMES].items(), key=lambda item: item[1]
+            )
+        ),
+    )
+
+    await import_graph_store.async_save(
+        {"ha_version": __version__, "integrations": loader.async_get_import_graph(hass)}
+    )
+    if (
+        new_manifest_index := await loader.async_get_manifest_index(hass)
+    ) != manifest_index:
+        await manifest_index_store.async_save(new_manifest_index)
@@ -189,6 +189,10 @@ class BinarySensorEntity(Entity):
     _attr_device_class: BinarySensorDeviceClass | None
     _attr_is_on: bool | None = None
     _attr_state: None = None
+    _static_attribute_members = {
+        "_default_to_device_class_name": ("device_class",),
+        "device_class": (),
+    }
 
     def _default_to_device_class_name(self) -> bool:
         """Return True if an unnamed entity should be named by its device class.
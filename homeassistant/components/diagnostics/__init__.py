@@ -16,6 +16,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, integration_platform
 from homeassistant.helpers.device_registry import DeviceEntry, async_get
+from homeassistant.helpers.entity_platform import (
+    POLL_DURATION_BUCKETS,
+    async_get_platforms,
+)
 from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
@@ -150,6 +154,25 @@ def handle_get(
     )
 
 
+@callback
+def _async_get_entity_platforms_diagnostics(
+    hass: HomeAssistant, domain: str, entry_id: str
+) -> dict[str, dict[str, Any]]:
+    """Return diagnostics of the entity platforms of a config entry."""
+    return {
+        platform.domain: {
+            "skipped_state_writes": platform.skipped_state_writes,
+            "failed_updates": platform.failed_updates,
+            "poll_concurrency": platform.poll_concurrency,
+            "poll_durations": dict(
+                zip(map(str, POLL_DURATION_BUCKETS), platform.poll_durations)
+            ),
+        }
+        for platform in async_get_platforms(hass, domain)
+        if platform.config_entry and platform.config_entry.entry_id == entry_id
+    }
+
+
 async def _async_get_json_file_response(
     hass: HomeAssistant,
     data: Mapping[str, Any],
@@ -177,6 +200,9 @@ async def _async_get_json_file_response(
                 "home_assistant": hass_sys_info,
                 "custom_components": custom_components,
                 "integration_manifest": integration.manifest,
+                "entity_platforms": _async_get_entity_platforms_diagnostics(
+                    hass, domain, d_id
+                ),
                 "data": data,
             },
             indent=2,
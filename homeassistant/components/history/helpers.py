@@ -1,9 +1,12 @@
 """Helpers for the history integration."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from datetime import datetime as dt
+import math
+from typing import Any
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -21,3 +24,113 @@ def entities_may_have_state_changes_after(
             return True
 
     return False
+
+
+def downsample_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Downsample a list of compressed states to at most max_points states."""
+    if len(states) <= max_points:
+        return states
+    return [
+        states[idx]
+        for idx in _downsample_indexes(
+            [state[COMPRESSED_STATE_LAST_UPDATED] for state in states],
+            [state[COMPRESSED_STATE_STATE] for state in states],
+            max_points,
+        )
+    ]
+
+
+def downsample_columns(
+    columns: dict[str, list[Any]], max_points: int
+) -> dict[str, list[Any]]:
+    """Downsample the columns of an entity to at most max_points rows."""
+    if len(states := columns[COMPRESSED_STATE_STATE]) <= max_points:
+        return columns
+    indexes = _downsample_indexes(
+        columns[COMPRESSED_STATE_LAST_UPDATED], states, max_points
+    )
+    return {key: [column[idx] for idx in indexes] for key, column in columns.items()}
+
+
+def _float_or_none(state: str | None) -> float | None:
+    """Return the state as a finite float or None if it's not numeric.
+
+    The state of a removed entity is None.
+    """
+    try:
+        value = float(state)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _downsample_indexes(
+    timestamps: Sequence[float], states: Sequence[str | None], max_points: int
+) -> list[int]:
+    """Select the indexes of at most max_points states to keep.
+
+    Only the changes of non numeric states, like unavailable, are candidates
+    since repeating them does not change a graph. If there are too many
+    candidates, the first and last are kept and every bucket in between keeps
+    one of its candidates: its first change to a non numeric state so graphs
+    still show the gaps, or else the numeric point selected with the largest
+    triangle three buckets algorithm. That is the point forming the largest
+    triangle with the previously kept numeric point and the average of the
+    numeric points of the next bucket.
+    """
+    values = [_float_or_none(state) for state in states]
+    candidates = [
+        idx
+        for idx, state in enumerate(states)
+        if not idx or values[idx] is not None or state != states[idx - 1]
+    ]
+    count = len(candidates)
+    if count <= max_points:
+        return candidates
+
+    bucket_size = (count - 2) / (max_points - 2)
+    indexes = [candidates[0]]
+    prev_point: tuple[float, float] | None = None
+    if (first_value := values[candidates[0]]) is not None:
+        prev_point = (timestamps[candidates[0]], first_value)
+    for bucket in range(max_points - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+
+        # Average of the numeric points in the next bucket
+        sum_x = sum_y = 0.0
+        next_count = 0
+        for idx in candidates[end:next_end]:
+            if (value := values[idx]) is not None:
+                sum_x += timestamps[idx]
+                sum_y += value
+                next_count += 1
+        avg_point = (sum_x / next_count, sum_y / next_count) if next_count else None
+        prev_x, prev_y = prev_point or avg_point or (0.0, 0.0)
+        avg_x, avg_y = avg_point or prev_point or (0.0, 0.0)
+
+        best_idx: int | None = None
+        best_value = 0.0
+        best_area = -1.0
+        for idx in candidates[start:end]:
+            if (value := values[idx]) is None:
+                indexes.append(idx)
+                break
+            area = abs(
+                (prev_x - avg_x) * (value - prev_y)
+                - (prev_x - timestamps[idx]) * (avg_y - prev_y)
+            )
+            if area > best_area:
+                best_area = area
+                best_idx = idx
+                best_value = value
+        else:
+            if best_idx is not None:
+                indexes.append(best_idx)
+                prev_point = (timestamps[best_idx], best_value)
+
+    indexes.append(candidates[-1])
+    return indexes
@@ -12,6 +12,10 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.recent_history import (
+    RecentHistory,
+    async_get_recent_history,
+)
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -19,6 +23,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_CHANGED,
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -27,6 +32,7 @@ from homeassistant.core import (
     State,
     callback,
     is_callback,
+    split_entity_id,
     valid_entity_id,
 )
 from homeassistant.helpers.event import (
@@ -39,7 +45,11 @@ from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
 from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after
+from .helpers import (
+    downsample_columns,
+    downsample_states,
+    entities_may_have_state_changes_after,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,25 +82,56 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None = None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states: MutableMapping[str, list[Any]] = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
     )
+    if max_points:
+        states = {
+            entity_id: downsample_states(entity_states, max_points)
+            for entity_id, entity_states in states.items()
+        }
+    return JSON_DUMP(messages.result_message(msg_id, states))
+
+
+def _ws_get_significant_states_columns(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    max_points: int | None = None,
+) -> str:
+    """Fetch history significant_states as columns and convert them to json."""
+    columns = history.get_significant_states_columns(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        no_attributes,
+    )
+    if max_points:
+        columns = {
+            entity_id: downsample_columns(entity_columns, max_points)
+            for entity_id, entity_columns in columns.items()
+        }
+    return JSON_DUMP(messages.result_message(msg_id, columns))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +144,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=3)),
     }
 )
 @websocket_api.async_response
@@ -154,6 +197,23 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if msg["columnar"]:
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_get_significant_states_columns,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                msg.get("max_points"),
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -166,6 +226,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -311,6 +372,110 @@ def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, An
     return comp_state
 
 
+@callback
+def _async_get_recent_history_states(
+    recent_history: RecentHistory,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> MutableMapping[str, list[dict[str, Any]]]:
+    """Convert the recent history in memory to compressed states.
+
+    The caller must check the recent history covers the period first.
+    """
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+
+    def _compressed_state(state: State, with_attributes: bool) -> dict[str, Any]:
+        """Convert a state to a compressed state like the database rows are."""
+        comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state.state}
+        if with_attributes:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = (
+                {}
+                if no_attributes
+                else recent_history.async_get_recorded_attributes(state)
+            )
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = dt_util.utc_to_timestamp(
+            state.last_updated
+        )
+        if state.last_changed != state.last_updated:
+            comp_state[COMPRESSED_STATE_LAST_CHANGED] = dt_util.utc_to_timestamp(
+                state.last_changed
+            )
+        return comp_state
+
+    states: dict[str, list[dict[str, Any]]] = {}
+    for entity_id in entity_ids:
+        domain = split_entity_id(entity_id)[0]
+        significant_only = (
+            significant_changes_only and domain not in history.SIGNIFICANT_DOMAINS
+        )
+        minimal = minimal_response and domain not in history.NEED_ATTRIBUTE_DOMAINS
+        # Like the database rows, states without attributes still have an
+        # empty attributes dict unless only the first state has attributes
+        with_attributes = not minimal or not no_attributes
+        entity_states: list[dict[str, Any]] = []
+        prev_state: str | None = None
+        if include_start_time_state and (
+            start_state := recent_history.async_get_state(entity_id, start_time)
+        ):
+            comp_state = _compressed_state(start_state, with_attributes)
+            comp_state[COMPRESSED_STATE_LAST_UPDATED] = start_time_ts
+            comp_state.pop(COMPRESSED_STATE_LAST_CHANGED, None)
+            entity_states.append(comp_state)
+            prev_state = start_state.state
+        for event in recent_history.async_get_events(
+            (entity_id,), start_time, end_time
+        ):
+            if (
+                event.event_type != EVENT_STATE_CHANGED
+                or (state := event.data["new_state"]) is None
+            ):
+                continue
+            if significant_only and state.last_changed != state.last_updated:
+                continue
+            if minimal and entity_states:
+                # Only the first state has attributes with minimal
+                # response and repeated states are skipped
+                if state.state != prev_state:
+                    entity_states.append(
+                        {
+                            COMPRESSED_STATE_STATE: state.state,
+                            COMPRESSED_STATE_LAST_UPDATED: dt_util.utc_to_timestamp(
+                                state.last_updated
+                            ),
+                        }
+                    )
+                    prev_state = state.state
+                continue
+            entity_states.append(_compressed_state(state, with_attributes))
+            prev_state = state.state
+        if entity_states:
+            states[entity_id] = entity_states
+    return states
+
+
+def _generate_recent_history_websocket_response(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    states: MutableMapping[str, list[dict[str, Any]]],
+) -> str:
+    """Generate a websocket response ending at the last state like the database."""
+    if last_time_ts := max(
+        (
+            entity_states[-1][COMPRESSED_STATE_LAST_UPDATED]
+            for entity_states in states.values()
+        ),
+        default=0,
+    ):
+        end_time = dt_util.utc_from_timestamp(last_time_ts)
+    return _generate_websocket_response(msg_id, start_time, end_time, states)
+
+
 def _events_to_compressed_states(
     events: Iterable[Event], no_attributes: bool
 ) -> MutableMapping[str, list[dict[str, Any]]]:
@@ -457,6 +622,24 @@ async def ws_stream(
 
         connection.subscriptions[msg_id] = callback(lambda: None)
         connection.send_result(msg_id)
+        recent_history = async_get_recent_history(hass)
+        if recent_history.async_covers(entity_ids, start_time):
+            states = _async_get_recent_history_states(
+                recent_history,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+            connection.send_message(
+                _generate_recent_history_websocket_response(
+                    msg_id, start_time, end_time, states
+                )
+            )
+            return
         await _async_send_historical_states(
             hass,
             connection,
@@ -520,6 +703,36 @@ async def ws_stream(
     subscriptions_setup_complete_time = dt_util.utcnow()
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
+    recent_history = async_get_recent_history(hass)
+    if recent_history.async_covers(entity_ids, start_time):
+        # Everything since start_time is still in memory so
+        # there is no need to query the database
+        states = _async_get_recent_history_states(
+            recent_history,
+            start_time,
+            subscriptions_setup_complete_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        connection.send_message(
+            _generate_recent_history_websocket_response(
+                msg_id, start_time, subscriptions_setup_complete_time, states
+            )
+        )
+        live_stream.task = asyncio.create_task(
+            _async_events_consumer(
+                subscriptions_setup_complete_time,
+                connection,
+                msg_id,
+                stream_queue,
+                no_attributes,
+            )
+        )
+        return
+
     # Fetch everything from history
     last_event_time = await _async_send_historical_states(
         hass,
@@ -549,6 +762,30 @@ async def ws_stream(
         )
     )
 
+    if recent_history.async_covers(entity_ids, last_event_time or start_time):
+        # The states the recorder may not have committed yet are still
+        # in memory so there is no need to wait for it and query again
+        states = _async_get_recent_history_states(
+            recent_history,
+            last_event_time or start_time,
+            subscriptions_setup_complete_time,
+            entity_ids,
+            False,  # We don't want the start time state again
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        if states or not last_event_time:
+            connection.send_message(
+                _generate_recent_history_websocket_response(
+                    msg_id,
+                    last_event_time or start_time,
+                    subscriptions_setup_complete_time,
+                    states,
+                )
+            )
+        return
+
     live_stream.wait_sync_task = asyncio.create_task(
         get_instance(hass).async_block_till_done()
     )
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from datetime import datetime
 from typing import Any
 
+from homeassistant.components.recorder.recent_history import RecentHistory
 from homeassistant.components.sensor import ATTR_STATE_CLASS
 from homeassistant.const import (
     ATTR_DEVICE_ID,
@@ -217,6 +219,35 @@ def async_subscribe_events(
     )
 
 
+@callback
+def async_recent_events(
+    hass: HomeAssistant,
+    recent_history: RecentHistory,
+    event_types: tuple[str, ...],
+    entity_ids: list[str],
+    start_time: datetime,
+    end_time: datetime,
+) -> list[Event]:
+    """Return the recent events the live logbook stream forwards for the entities.
+
+    The caller must check the recent history covers the period first.
+    """
+    ent_reg = er.async_get(hass)
+    events: list[Event] = []
+    for event in recent_history.async_get_events(entity_ids, start_time, end_time):
+        if event.event_type == EVENT_STATE_CHANGED:
+            if (
+                (old_state := event.data["old_state"]) is None
+                or (new_state := event.data["new_state"]) is None
+                or _is_state_filtered(ent_reg, new_state, old_state)
+            ):
+                continue
+        elif event.event_type not in event_types:
+            continue
+        events.append(event)
+    return events
+
+
 def is_sensor_continuous(ent_reg: er.EntityRegistry, entity_id: str) -> bool:
     """Determine if a sensor is continuous by checking its state class.
 
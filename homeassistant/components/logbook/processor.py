@@ -10,10 +10,13 @@ from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.const import SQLITE_MAX_BIND_VARS
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
+    bytes_to_ulid_timestamp_or_none,
     bytes_to_uuid_hex_or_none,
     extract_event_type_ids,
     extract_metadata_ids,
@@ -21,6 +24,7 @@ from homeassistant.components.recorder.models import (
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import (
+    chunked,
     execute_stmt_lambda_element,
     session_scope,
 )
@@ -64,6 +68,7 @@ from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.context import context_origins_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -165,9 +170,40 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
-            )
+            rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            if self.logbook_run.memoize_new_contexts:
+                self._memoize_earlier_context_origins(session, rows, start_day)
+            return self.humanify(rows)
+
+    def _memoize_earlier_context_origins(
+        self, session: Session, rows: Sequence[Row] | Result, start_day: dt
+    ) -> None:
+        """Memoize the origin rows of contexts that started before start_day.
+
+        Context ids are ulids, so the time they were generated tells us
+        which contexts can have their origin before the rows we selected.
+        Their origins are found with the context id indexes instead of
+        selecting every row that shares a context with the rows.
+        """
+        start_day_ts = dt_util.utc_to_timestamp(start_day)
+        context_lookup = self.logbook_run.context_lookup
+        context_ids: set[bytes] = set()
+        for row in rows:
+            for context_id_bin in (row.context_id_bin, row.context_parent_id_bin):
+                if (
+                    context_id_bin not in context_lookup
+                    and (context_ts := bytes_to_ulid_timestamp_or_none(context_id_bin))
+                    is not None
+                    and context_ts < start_day_ts
+                ):
+                    context_ids.add(context_id_bin)
+        for context_ids_chunk in chunked(context_ids, SQLITE_MAX_BIND_VARS):
+            for context_row in execute_stmt_lambda_element(
+                session,
+                context_origins_stmt(start_day_ts, context_ids_chunk),
+                orm_rows=False,
+            ):
+                context_lookup.setdefault(context_row.context_id_bin, context_row)
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
@@ -0,0 +1,51 @@
+"""Context queries for logbook."""
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import lambda_stmt, union_all
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+
+def context_origins_stmt(
+    start_day: float, context_ids: Collection[bytes]
+) -> StatementLambdaElement:
+    """Generate a query for the rows of contexts before start_day.
+
+    The rows are ordered by time so the first row of each
+    context is its origin.
+    """
+    return lambda_stmt(
+        lambda: union_all(
+            apply_events_context_hints(
+                select_events_context_only()
+                .where(Events.context_id_bin.in_(context_ids))
+                .where(Events.time_fired_ts < start_day)
+                .outerjoin(
+                    EventTypes, (Events.event_type_id == EventTypes.event_type_id)
+                )
+                .outerjoin(EventData, (Events.data_id == EventData.data_id))
+            ),
+            apply_states_context_hints(
+                select_states_context_only()
+                .where(States.context_id_bin.in_(context_ids))
+                .where(States.last_updated_ts < start_day)
+                .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+            ),
+        ).order_by(Events.time_fired_ts)
+    )
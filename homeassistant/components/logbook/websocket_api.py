@@ -12,6 +12,10 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.recent_history import (
+    RecentHistory,
+    async_get_recent_history,
+)
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
@@ -23,6 +27,7 @@ from .const import DOMAIN
 from .helpers import (
     async_determine_event_types,
     async_filter_entities,
+    async_recent_events,
     async_subscribe_events,
 )
 from .models import LogbookConfig, async_event_to_row
@@ -189,6 +194,33 @@ def _generate_stream_message(
     }
 
 
+@callback
+def _async_generate_recent_events_message(
+    hass: HomeAssistant,
+    recent_history: RecentHistory,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+) -> str:
+    """Generate a logbook stream message from the recent history in memory."""
+    assert event_processor.entity_ids is not None
+    events = async_recent_events(
+        hass,
+        recent_history,
+        event_processor.event_types,
+        event_processor.entity_ids,
+        start_time,
+        end_time,
+    )
+    message = _generate_stream_message(
+        event_processor.humanify(async_event_to_row(e) for e in events),
+        start_time,
+        end_time,
+    )
+    return JSON_DUMP(messages.event_message(msg_id, message))
+
+
 def _ws_stream_get_events(
     msg_id: int,
     start_day: dt,
@@ -302,10 +334,22 @@ async def ws_event_stream(
         include_entity_name=False,
     )
 
+    # The recent history in memory only has the events of entities
+    recent_history: RecentHistory | None = None
+    if entity_ids and not device_ids:
+        recent_history = async_get_recent_history(hass)
+
     if end_time and end_time <= utc_now:
         # Not live stream but we it might be a big query
         connection.subscriptions[msg_id] = callback(lambda: None)
         connection.send_result(msg_id)
+        if recent_history and recent_history.async_covers(entity_ids, start_time):
+            connection.send_message(
+                _async_generate_recent_events_message(
+                    hass, recent_history, msg_id, start_time, end_time, event_processor
+                )
+            )
+            return
         # Fetch everything from history
         await _async_send_historical_events(
             hass,
@@ -373,6 +417,31 @@ async def ws_event_stream(
     subscriptions_setup_complete_time = dt_util.utcnow()
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
+    if recent_history and recent_history.async_covers(entity_ids, start_time):
+        # Everything since start_time is still in memory so
+        # there is no need to query the database
+        connection.send_message(
+            _async_generate_recent_events_message(
+                hass,
+                recent_history,
+                msg_id,
+                start_time,
+                subscriptions_setup_complete_time,
+                event_processor,
+            )
+        )
+        event_processor.switch_to_live()
+        live_stream.task = asyncio.create_task(
+            _async_events_consumer(
+                subscriptions_setup_complete_time,
+                connection,
+                msg_id,
+                stream_queue,
+                event_processor,
+            )
+        )
+        return
+
     # Fetch everything from history
     last_event_time = await _async_send_historical_events(
         hass,
@@ -404,6 +473,24 @@ async def ws_event_stream(
         )
     )
 
+    if recent_history and recent_history.async_covers(
+        entity_ids, last_event_time or start_time
+    ):
+        # The events the recorder may not have committed yet are still
+        # in memory so there is no need to wait for it and query again
+        connection.send_message(
+            _async_generate_recent_events_message(
+                hass,
+                recent_history,
+                msg_id,
+                last_event_time or start_time,
+                subscriptions_setup_complete_time,
+                event_processor,
+            )
+        )
+        event_processor.switch_to_live()
+        return
+
     live_stream.wait_sync_task = asyncio.create_task(
         get_instance(hass).async_block_till_done()
     )
@@ -2,9 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
-from functools import lru_cache
-from itertools import chain, groupby
+from collections.abc import Callable, Coroutine, Iterable, MutableMapping
+from itertools import groupby
 import logging
 from operator import attrgetter
 import ssl
@@ -14,6 +13,7 @@ import uuid
 
 import attr
 import certifi
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -93,6 +93,7 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+MATCHING_NODES_CACHE_SIZE = 8192
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
     "https://developers.home-assistant.io/blog/2023-057-21-change-naming-mqtt-entities/"
@@ -217,12 +218,133 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None] = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+class _SubscriptionTrieNode:
+    """A level of a topic filter in the subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Match topics with the topic filters of all subscriptions.
+
+    Each level of a topic filter is a node in the trie, so matching a topic
+    only visits the levels of the topic and the wildcards next to them.
+
+    The matching nodes of recent topics are cached. Subscribing to a filter
+    that is already in the trie or unsubscribing does not change which
+    nodes match a topic, only a new filter clears the cache.
+    """
+
+    __slots__ = ("_root", "_nodes", "_matching_nodes")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        # The nodes with subscriptions by topic filter
+        self._nodes: dict[str, _SubscriptionTrieNode] = {}
+        self._matching_nodes: MutableMapping[
+            str, list[_SubscriptionTrieNode]
+        ] = LRU(MATCHING_NODES_CACHE_SIZE)
+
+    @property
+    def subscriptions(self) -> list[Subscription]:
+        """Return all subscriptions."""
+        return [
+            subscription
+            for node in self._nodes.values()
+            for subscription in node.subscriptions
+        ]
+
+    def has_subscriptions(self, topic_filter: str) -> bool:
+        """Return if there are subscriptions to a topic filter."""
+        return topic_filter in self._nodes
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        topic_filter = subscription.topic
+        if (node := self._nodes.get(topic_filter)) is None:
+            node = self._root
+            for level in topic_filter.split("/"):
+                if (child := node.children.get(level)) is None:
+                    child = node.children[level] = _SubscriptionTrieNode()
+                node = child
+            self._nodes[topic_filter] = node
+            self._matching_nodes.clear()
+        node.subscriptions.append(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError or ValueError if the subscription was not added.
+        """
+        topic_filter = subscription.topic
+        node = self._nodes[topic_filter]
+        node.subscriptions.remove(subscription)
+        if node.subscriptions:
+            return
+
+        # Cached matches may still hold the node, but without
+        # subscriptions it does not add anything to them
+        del self._nodes[topic_filter]
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def matching_subscriptions(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        if (nodes := self._matching_nodes.get(topic)) is None:
+            nodes = self._matching_nodes[topic] = self._match(topic)
+        return [subscription for node in nodes for subscription in node.subscriptions]
+
+    def _match(self, topic: str) -> list[_SubscriptionTrieNode]:
+        """Return the nodes with subscriptions matching a topic."""
+        matches: list[_SubscriptionTrieNode] = []
+        # Wildcards at the first level do not match topics starting with $
+        wildcards = not topic.startswith("$")
+        nodes = [self._root]
+        for level in topic.split("/"):
+            next_nodes: list[_SubscriptionTrieNode] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if not wildcards:
+                    continue
+                if (child := children.get("+")) is not None:
+                    next_nodes.append(child)
+                if (child := children.get("#")) is not None and child.subscriptions:
+                    matches.append(child)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+            wildcards = True
+
+        for node in nodes:
+            if node.subscriptions:
+                matches.append(node)
+            # A multi-level wildcard also matches the parent level
+            if (child := node.children.get("#")) is not None and child.subscriptions:
+                matches.append(child)
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -284,11 +406,6 @@ class MqttClientSetup:
         return self._client
 
 
-def _is_simple_match(topic: str) -> bool:
-    """Return if a topic is a simple match."""
-    return not ("+" in topic or "#" in topic)
-
-
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -380,8 +497,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
 
-        self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -453,10 +569,7 @@ class MQTT:
     @property
     def subscriptions(self) -> list[Subscription]:
         """Return the tracked subscriptions."""
-        return [
-            *chain.from_iterable(self._simple_subscriptions.values()),
-            *self._wildcard_subscriptions,
-        ]
+        return self._subscriptions.subscriptions
 
     def cleanup(self) -> None:
         """Clean up listeners."""
@@ -484,9 +597,7 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
-        )
+        return self._subscriptions.has_subscriptions(topic)
 
     async def async_publish(
         self, topic: str, payload: PublishPayloadType, qos: int, retain: bool
@@ -566,40 +677,23 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
-        if _is_simple_match(subscription.topic):
-            self._simple_subscriptions.setdefault(subscription.topic, []).append(
-                subscription
-            )
-        else:
-            self._wildcard_subscriptions.append(subscription)
+        self._subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
-        topic = subscription.topic
         try:
-            if _is_simple_match(topic):
-                simple_subscriptions = self._simple_subscriptions
-                simple_subscriptions[topic].remove(subscription)
-                if not simple_subscriptions[topic]:
-                    del simple_subscriptions[topic]
-            else:
-                self._wildcard_subscriptions.remove(subscription)
+            self._subscriptions.remove(subscription)
         except (KeyError, ValueError) as ex:
             raise HomeAssistantError("Can't remove subscription twice") from ex
 
@@ -634,11 +728,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -648,7 +739,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -663,7 +753,7 @@ class MQTT:
         if self._is_active_subscription(topic):
             if self._max_qos[topic] == 0:
                 return
-            subs = self._matching_subscriptions(topic)
+            subs = self._subscriptions.matching_subscriptions(topic)
             self._max_qos[topic] = max(sub.qos for sub in subs)
             # Other subscriptions on topic remaining - don't unsubscribe.
             return
@@ -809,16 +899,6 @@ class MQTT:
         """Message received callback."""
         self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
-    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
-
     @callback
     def _mqtt_handle_message(self, msg: mqtt.MQTTMessage) -> None:
         _LOGGER.debug(
@@ -830,7 +910,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self._subscriptions.matching_subscriptions(msg.topic)
 
         for subscription in subscriptions:
             if msg.retain:
@@ -962,12 +1042,3 @@ def _raise_on_error(result_code: int) -> None:
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
 
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
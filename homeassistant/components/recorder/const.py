@@ -48,6 +48,7 @@ STATISTICS_ROWS_SCHEMA_VERSION = 23
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 42
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
@@ -14,7 +14,15 @@ import time
 from typing import Any, TypeVar, cast
 
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import (
+    Table,
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    text,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -57,6 +65,7 @@ from .const import (
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     STATISTICS_ROWS_SCHEMA_VERSION,
     SupportedDialect,
 )
@@ -84,11 +93,12 @@ from .queries import (
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
 )
+from .recent_history import RecentHistory
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import PendingState, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -101,6 +111,7 @@ from .tasks import (
     DatabaseLockTask,
     EntityIDMigrationTask,
     EntityIDPostMigrationTask,
+    EventBatchTask,
     EventIdMigrationTask,
     EventsContextIDMigrationTask,
     EventTask,
@@ -111,6 +122,7 @@ from .tasks import (
     PurgeTask,
     RecorderTask,
     StatesContextIDMigrationTask,
+    StatisticsRollupsTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -149,6 +161,15 @@ KEEP_ALIVE_TASK = KeepAliveTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
 
+# The maximum number of queued events that are written as one batch.
+# This must stay below the CACHE_SIZE of the state attributes and
+# event data managers so the ids resolved for a batch are not evicted
+# from the LRU before the batch is added to the session.
+MAX_EVENT_BATCH_SIZE = 1000
+
+# The maximum number of rows in a multi-row INSERT of states rows
+MAX_STATES_ROWS_PER_INSERT = 1000
+
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
@@ -215,6 +236,17 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Events and states rows are inserted in bulk at the next commit
+        self._pending_events: list[
+            tuple[dict[str, Any], EventTypes | None, EventData | None]
+        ] = []
+        self._pending_states: list[PendingState] = []
+        # Cumulative seconds spent in each stage of writing events
+        # to the database, used to find which stage falls behind
+        self.event_stage_timings: dict[str, float] = dict.fromkeys(
+            ("serialize", "lookup", "session", "commit"), 0.0
+        )
+        self.event_batches = 0
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -225,6 +257,11 @@ class Recorder(threading.Thread):
             self, exclude_attributes_by_domain
         )
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.hourly_statistics_accumulator = statistics.HourlyStatisticsAccumulator()
+        self.statistics_rollups = statistics.StatisticsRollups()
+        self.recent_history = RecentHistory(
+            hass, entity_filter, exclude_event_types, self.state_attributes_manager
+        )
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -243,6 +280,7 @@ class Recorder(threading.Thread):
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
+        self._auto_increment_increment: int | None = None
         self.enabled = True
 
     @property
@@ -339,6 +377,9 @@ class Recorder(threading.Thread):
             timedelta(minutes=10),
             name="Recorder queue watcher",
         )
+        # Keep the recent events of the entities from the start, so streams
+        # don't have to wait for them to be committed
+        self.recent_history.async_start()
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -423,6 +464,7 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        self.recent_history.async_stop()
 
     @callback
     def _async_stop_listeners(self) -> None:
@@ -581,6 +623,15 @@ class Recorder(threading.Thread):
             )
         )
 
+    def rebuild_statistics_rollups(self) -> None:
+        """Stop using the daily and monthly statistics until they are rebuilt.
+
+        This method is thread-safe.
+        """
+        if self.statistics_rollups.active:
+            self.statistics_rollups.active = False
+            self.queue_task(StatisticsRollupsTask())
+
     @callback
     def async_clear_statistics(self, statistic_ids: list[str]) -> None:
         """Clear statistics for a list of statistic_ids."""
@@ -749,6 +800,14 @@ class Recorder(threading.Thread):
         if not schema_status.valid:
             if self._migrate_schema_and_setup_run(schema_status):
                 self.schema_version = SCHEMA_VERSION
+                if (
+                    database_was_ready
+                    and schema_status.current_version
+                    < STATISTICS_ROLLUPS_SCHEMA_VERSION
+                ):
+                    # The statistics rollups were not checked before the live
+                    # migration, build them once the statistics are migrated
+                    self.queue_task(StatisticsRollupsTask())
                 if not self._event_listener:
                     # If the schema migration takes so long that the end
                     # queue watcher safety kicks in because _reached_max_backlog
@@ -829,6 +888,13 @@ class Recorder(threading.Thread):
                     ):
                         self.queue_task(EntityIDPostMigrationTask())
 
+            if self.schema_version >= STATISTICS_ROLLUPS_SCHEMA_VERSION:
+                if statistics.statistics_rollups_complete(session):
+                    _LOGGER.debug("Activating statistics rollups as they are complete")
+                    self.statistics_rollups.active = True
+                else:
+                    self.queue_task(StatisticsRollupsTask())
+
             if self.schema_version > LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION:
                 with contextlib.suppress(SQLAlchemyError):
                     # If the index of event_ids on the states table is still present
@@ -865,7 +931,32 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_recover(queue_.get())
+            task: RecorderTask | None = queue_.get()
+            if isinstance(task, EventTask) and not queue_.empty():
+                # Write consecutive events as one batch so their
+                # serialized data can be resolved in bulk
+                batch_task, task = self._gather_event_batch(task, queue_)
+                self._guarded_process_one_task_or_recover(batch_task)
+            if task is not None:
+                self._guarded_process_one_task_or_recover(task)
+
+    def _gather_event_batch(
+        self, task: EventTask, queue_: queue.SimpleQueue[RecorderTask]
+    ) -> tuple[EventBatchTask, RecorderTask | None]:
+        """Gather the events queued after task into a batch.
+
+        Returns the batch and the first non-event task that ended it, if any.
+        """
+        events = [task.event]
+        while len(events) < MAX_EVENT_BATCH_SIZE:
+            try:
+                next_task = queue_.get_nowait()
+            except queue.Empty:
+                break
+            if not isinstance(next_task, EventTask):
+                return EventBatchTask(events), next_task
+            events.append(next_task.event)
+        return EventBatchTask(events), None
 
     def _pre_process_startup_tasks(self, startup_tasks: list[RecorderTask]) -> None:
         """Pre process startup tasks."""
@@ -1019,124 +1110,364 @@ class Recorder(threading.Thread):
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
-    def _process_non_state_changed_event_into_session(self, event: Event) -> None:
-        """Process any event into the session except state changed."""
+    def _process_events(self, events: list[Event]) -> None:
+        """Process a batch of events into the session.
+
+        The state attributes and event data of the whole batch are
+        serialized first so the ids of the ones already in the database
+        can be resolved with one query per table before the rows are
+        added to the session.
+        """
+        if not self.enabled:
+            return
+        assert self.event_session is not None
+        session = self.event_session
+        state_attributes_manager = self.state_attributes_manager
+        event_data_manager = self.event_data_manager
+        timings = self.event_stage_timings
+        start = time.monotonic()
+
+        # Events which fail are dropped one at a time, like they are
+        # when processed one by one, so they do not take the batch down
+        serialized: list[bytes | None] = []
+        state_change_events: list[Event] = []
+        non_state_change_events: list[Event] = []
+        processed_events: list[Event] = []
+        for event in events:
+            try:
+                if event.event_type == EVENT_STATE_CHANGED:
+                    shared_bytes = state_attributes_manager.serialize_from_event(
+                        event
+                    )
+                else:
+                    shared_bytes = (
+                        event_data_manager.serialize_from_event(event)
+                        if event.data
+                        else None
+                    )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while processing event %s", event)
+                continue
+            if event.event_type == EVENT_STATE_CHANGED:
+                state_change_events.append(event)
+            else:
+                non_state_change_events.append(event)
+            processed_events.append(event)
+            serialized.append(shared_bytes)
+        events = processed_events
+        serialized_at = time.monotonic()
+
+        state_attributes_manager.load_from_serialized(
+            (
+                shared_bytes
+                for event, shared_bytes in zip(events, serialized)
+                if shared_bytes and event.event_type == EVENT_STATE_CHANGED
+            ),
+            session,
+        )
+        event_data_manager.load_from_serialized(
+            (
+                shared_bytes
+                for event, shared_bytes in zip(events, serialized)
+                if shared_bytes and event.event_type != EVENT_STATE_CHANGED
+            ),
+            session,
+        )
+        if state_change_events:
+            self.states_meta_manager.load(state_change_events, session)
+        if non_state_change_events:
+            self.event_type_manager.load(non_state_change_events, session)
+        looked_up_at = time.monotonic()
+
+        for event, shared_bytes in zip(events, serialized):
+            try:
+                if event.event_type == EVENT_STATE_CHANGED:
+                    self._process_state_changed_event_into_session(
+                        event, shared_bytes
+                    )
+                else:
+                    self._process_non_state_changed_event_into_session(
+                        event, shared_bytes
+                    )
+            except SQLAlchemyError:
+                raise
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while processing event %s", event)
+        finished_at = time.monotonic()
+
+        self.event_batches += 1
+        timings["serialize"] += serialized_at - start
+        timings["lookup"] += looked_up_at - serialized_at
+        timings["session"] += finished_at - looked_up_at
+
+        # Commit if the commit interval is zero
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _process_non_state_changed_event_into_session(
+        self,
+        event: Event,
+        shared_data_bytes: bytes | None | UndefinedType = UNDEFINED,
+    ) -> None:
+        """Process any event into the session except state changed.
+
+        If shared_data_bytes is passed, the event data was serialized
+        and looked up as part of a batch.
+        """
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
+        values = Events.values_from_event(event)
+        event_types: EventTypes | None = None
+        event_data: EventData | None = None
 
         # Map the event_type to the EventTypes table
         event_type_manager = self.event_type_manager
         if pending_event_types := event_type_manager.get_pending(event.event_type):
-            dbevent.event_type_rel = pending_event_types
+            event_types = pending_event_types
         elif event_type_id := event_type_manager.get(event.event_type, session, True):
-            dbevent.event_type_id = event_type_id
+            values["event_type_id"] = event_type_id
         else:
             event_types = EventTypes(event_type=event.event_type)
             event_type_manager.add_pending(event_types)
             self._add_to_session(session, event_types)
-            dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_event(values, event_types, event_data)
             return
 
         event_data_manager = self.event_data_manager
-        if not (shared_data_bytes := event_data_manager.serialize_from_event(event)):
+        batched = shared_data_bytes is not UNDEFINED
+        if not batched:
+            shared_data_bytes = event_data_manager.serialize_from_event(event)
+        if not shared_data_bytes:
             return
+        assert isinstance(shared_data_bytes, bytes)
 
         # Map the event data to the EventData table
         shared_data = shared_data_bytes.decode("utf-8")
         # Matching attributes found in the pending commit
         if pending_event_data := event_data_manager.get_pending(shared_data):
-            dbevent.event_data_rel = pending_event_data
+            event_data = pending_event_data
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
             (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
+            and not batched
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
-            dbevent.data_id = data_id
+            values["data_id"] = data_id
         else:
             # No matching attributes found, save them in the DB
-            dbevent_data = EventData(shared_data=shared_data, hash=hash_)
-            event_data_manager.add_pending(dbevent_data)
-            self._add_to_session(session, dbevent_data)
-            dbevent.event_data_rel = dbevent_data
+            event_data = EventData(shared_data=shared_data, hash=hash_)
+            event_data_manager.add_pending(event_data)
+            self._add_to_session(session, event_data)
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_event(values, event_types, event_data)
 
-    def _process_state_changed_event_into_session(self, event: Event) -> None:
-        """Process a state_changed event into the session."""
+    def _add_pending_event(
+        self,
+        values: dict[str, Any],
+        event_types: EventTypes | None,
+        event_data: EventData | None,
+    ) -> None:
+        """Add an events row to be inserted at the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_events.append((values, event_types, event_data))
+
+    def _process_state_changed_event_into_session(
+        self,
+        event: Event,
+        shared_attrs_bytes: bytes | None | UndefinedType = UNDEFINED,
+    ) -> None:
+        """Process a state_changed event into the session.
+
+        If shared_attrs_bytes is passed, the state attributes were
+        serialized and looked up as part of a batch.
+        """
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
+        states_manager = self.states_manager
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
-
-        states_manager = self.states_manager
-        if old_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = old_state
-        elif old_state_id := states_manager.pop_committed(entity_id):
-            dbstate.old_state_id = old_state_id
-        if entity_removed:
-            dbstate.state = None
-        else:
-            states_manager.add_pending(entity_id, dbstate)
+        pending_state = PendingState(States.values_from_event(event))
+        values = pending_state.values
 
         if states_meta_manager.active:
-            dbstate.entity_id = None
+            values["entity_id"] = None
 
-        if entity_id is None or not (
-            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
-        ):
+        if entity_id is None:
+            return
+        batched = shared_attrs_bytes is not UNDEFINED
+        if not batched:
+            shared_attrs_bytes = state_attributes_manager.serialize_from_event(event)
+        if not shared_attrs_bytes:
             return
+        assert isinstance(shared_attrs_bytes, bytes)
 
         assert self.event_session is not None
         session = self.event_session
         # Map the entity_id to the StatesMeta table
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
-            dbstate.states_meta_rel = pending_states_meta
+            pending_state.states_meta = pending_states_meta
         elif metadata_id := states_meta_manager.get(entity_id, session, True):
-            dbstate.metadata_id = metadata_id
+            values["metadata_id"] = metadata_id
         elif states_meta_manager.active and entity_removed:
             # If the entity was removed, we don't need to add it to the
             # StatesMeta table or record it in the pending commit
             # if it does not have a metadata_id allocated to it as
             # it either never existed or was just renamed.
+            states_manager.pop_pending(entity_id)
+            states_manager.pop_committed(entity_id)
             return
         else:
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
             self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
+            pending_state.states_meta = states_meta
 
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
+            pending_state.state_attributes = pending_event_data
         # Matching attributes id found in the cache
         elif (
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
         ) or (
             (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+            and not batched
             and (
                 attributes_id := state_attributes_manager.get(
                     shared_attrs, hash_, session
                 )
             )
         ):
-            dbstate.attributes_id = attributes_id
+            values["attributes_id"] = attributes_id
         else:
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
             state_attributes_manager.add_pending(dbstate_attributes)
             self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
+            pending_state.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if old_state := states_manager.pop_pending(entity_id):
+            pending_state.old_state = old_state
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            values["old_state_id"] = old_state_id
+        if entity_removed:
+            values["state"] = None
+        else:
+            states_manager.add_pending(entity_id, pending_state)
+
+        self._event_session_has_pending_writes = True
+        self._pending_states.append(pending_state)
+
+    def _insert_pending_rows(self, session: Session) -> None:
+        """Insert the pending events and states rows in bulk.
+
+        The pending StatesMeta, EventTypes, StateAttributes and EventData
+        objects are flushed first so the ids they were assigned can be
+        used by the rows that reference them.
+        """
+        session.flush()
+        if pending_events := self._pending_events:
+            for values, event_types, event_data in pending_events:
+                if event_types is not None:
+                    values["event_type_id"] = event_types.event_type_id
+                if event_data is not None:
+                    values["data_id"] = event_data.data_id
+            session.execute(
+                insert(cast(Table, Events.__table__)),
+                [values for values, _, _ in pending_events],
+            )
+        if pending_states := self._pending_states:
+            self._insert_pending_states(session, pending_states)
+
+    def _insert_pending_states(
+        self, session: Session, pending_states: list[PendingState]
+    ) -> None:
+        """Insert the pending states rows in bulk.
+
+        A state that has its old state in the same commit can only be
+        linked once the old state has been assigned its state_id, so
+        the rows are inserted in rounds where every row can be linked.
+        """
+        while pending_states:
+            ready: list[PendingState] = []
+            deferred: list[PendingState] = []
+            for pending_state in pending_states:
+                values = pending_state.values
+                if (old_state := pending_state.old_state) is not None:
+                    if old_state.state_id is None:
+                        deferred.append(pending_state)
+                        continue
+                    values["old_state_id"] = old_state.state_id
+                if (states_meta := pending_state.states_meta) is not None:
+                    values["metadata_id"] = states_meta.metadata_id
+                if (state_attributes := pending_state.state_attributes) is not None:
+                    values["attributes_id"] = state_attributes.attributes_id
+                ready.append(pending_state)
+
+            state_ids = self._insert_states_rows(
+                session, [pending_state.values for pending_state in ready]
+            )
+            for pending_state, state_id in zip(ready, state_ids):
+                pending_state.state_id = state_id
+
+            pending_states = deferred
+
+    def _insert_states_rows(
+        self, session: Session, rows: list[dict[str, Any]]
+    ) -> list[int]:
+        """Insert states rows in bulk and return the state_ids they were assigned."""
+        assert self.engine is not None
+        dialect = self.engine.dialect
+        states_table = cast(Table, States.__table__)
+        if dialect.insert_executemany_returning_sort_by_parameter_order:
+            return list(
+                session.execute(
+                    insert(states_table).returning(
+                        states_table.c.state_id, sort_by_parameter_order=True
+                    ),
+                    rows,
+                ).scalars()
+            )
+
+        state_ids: list[int] = []
+        for start in range(0, len(rows), MAX_STATES_ROWS_PER_INSERT):
+            chunk = rows[start : start + MAX_STATES_ROWS_PER_INSERT]
+            if dialect.insert_returning:
+                # A single multi-row INSERT (MariaDB) returns
+                # the rows in the order they were inserted
+                state_ids.extend(
+                    session.execute(
+                        insert(states_table)
+                        .values(chunk)
+                        .returning(states_table.c.state_id)
+                    ).scalars()
+                )
+            elif self.dialect_name == SupportedDialect.MYSQL:
+                # MySQL assigns the rows of a multi-row INSERT consecutive
+                # ids starting at LAST_INSERT_ID() since the recorder is
+                # the only writer of the states table
+                first_id = session.execute(insert(states_table).values(chunk)).lastrowid
+                step = self._get_auto_increment_increment(session)
+                state_ids.extend(range(first_id, first_id + len(chunk) * step, step))
+            else:
+                # Without RETURNING support each row has to be inserted
+                # on its own to find out the state_id it was assigned
+                for values in chunk:
+                    result = session.execute(insert(states_table), values)
+                    state_ids.append(result.inserted_primary_key[0])
+        return state_ids
+
+    def _get_auto_increment_increment(self, session: Session) -> int:
+        """Return the step between auto increment ids of the MySQL server."""
+        if self._auto_increment_increment is None:
+            self._auto_increment_increment = session.execute(
+                text("SELECT @@auto_increment_increment")
+            ).scalar_one()
+        return self._auto_increment_increment
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1167,6 +1498,10 @@ class Recorder(threading.Thread):
                 if tries == self.db_max_retries:
                     raise
 
+                # The state_ids assigned by the rolled back
+                # insert must not be used to link old states
+                for pending_state in self._pending_states:
+                    pending_state.state_id = None
                 tries += 1
                 time.sleep(self.db_retry_wait)
 
@@ -1175,8 +1510,13 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        start = time.monotonic()
+        self._insert_pending_rows(session)
         session.commit()
+        self.event_stage_timings["commit"] += time.monotonic() - start
         self._event_session_has_pending_writes = False
+        self._pending_events.clear()
+        self._pending_states.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1207,6 +1547,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_events.clear()
+        self._pending_states.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
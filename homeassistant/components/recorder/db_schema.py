@@ -68,7 +68,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 41
+SCHEMA_VERSION = 42
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +84,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -105,6 +107,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -287,19 +291,29 @@ class Events(Base):
     @staticmethod
     def from_event(event: Event) -> Events:
         """Create an event database object from a native event."""
-        return Events(
-            event_type=None,
-            event_data=None,
-            origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
-            time_fired=None,
-            time_fired_ts=dt_util.utc_to_timestamp(event.time_fired),
-            context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(event.context.id),
-            context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(event.context.user_id),
-            context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(event.context.parent_id),
-        )
+        return Events(**Events.values_from_event(event))
+
+    @staticmethod
+    def values_from_event(event: Event) -> dict[str, Any]:
+        """Create the column values of an event row from a native event.
+
+        The values can be inserted in bulk without creating an ORM object.
+        """
+        return {
+            "event_type": None,
+            "event_data": None,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "time_fired": None,
+            "time_fired_ts": dt_util.utc_to_timestamp(event.time_fired),
+            "context_id": None,
+            "context_id_bin": ulid_to_bytes_or_none(event.context.id),
+            "context_user_id": None,
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(event.context.user_id),
+            "context_parent_id": None,
+            "context_parent_id_bin": ulid_to_bytes_or_none(event.context.parent_id),
+            "data_id": None,
+            "event_type_id": None,
+        }
 
     def to_native(self, validate_entity_id: bool = True) -> Event | None:
         """Convert to a native HA Event."""
@@ -473,36 +487,46 @@ class States(Base):
     @staticmethod
     def from_event(event: Event) -> States:
         """Create object from a state_changed event."""
-        entity_id = event.data["entity_id"]
+        return States(**States.values_from_event(event))
+
+    @staticmethod
+    def values_from_event(event: Event) -> dict[str, Any]:
+        """Create the column values of a state row from a state_changed event.
+
+        The values can be inserted in bulk without creating an ORM object.
+        """
         state: State | None = event.data.get("new_state")
-        dbstate = States(
-            entity_id=entity_id,
-            attributes=None,
-            context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(event.context.id),
-            context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(event.context.user_id),
-            context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(event.context.parent_id),
-            origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
-            last_updated=None,
-            last_changed=None,
-        )
+        values: dict[str, Any] = {
+            "entity_id": event.data["entity_id"],
+            "attributes": None,
+            "context_id": None,
+            "context_id_bin": ulid_to_bytes_or_none(event.context.id),
+            "context_user_id": None,
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(event.context.user_id),
+            "context_parent_id": None,
+            "context_parent_id_bin": ulid_to_bytes_or_none(event.context.parent_id),
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "last_updated": None,
+            "last_changed": None,
+            "old_state_id": None,
+            "attributes_id": None,
+            "metadata_id": None,
+        }
         # None state means the state was removed from the state machine
         if state is None:
-            dbstate.state = ""
-            dbstate.last_updated_ts = dt_util.utc_to_timestamp(event.time_fired)
-            dbstate.last_changed_ts = None
-            return dbstate
+            values["state"] = ""
+            values["last_updated_ts"] = dt_util.utc_to_timestamp(event.time_fired)
+            values["last_changed_ts"] = None
+            return values
 
-        dbstate.state = state.state
-        dbstate.last_updated_ts = dt_util.utc_to_timestamp(state.last_updated)
+        values["state"] = state.state
+        values["last_updated_ts"] = dt_util.utc_to_timestamp(state.last_updated)
         if state.last_updated == state.last_changed:
-            dbstate.last_changed_ts = None
+            values["last_changed_ts"] = None
         else:
-            dbstate.last_changed_ts = dt_util.utc_to_timestamp(state.last_changed)
+            values["last_changed_ts"] = dt_util.utc_to_timestamp(state.last_changed)
 
-        return dbstate
+        return values
 
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
@@ -568,6 +592,18 @@ class StateAttributes(Base):
         # None state means the state was removed from the state machine
         if state is None:
             return b"{}"
+        return StateAttributes.shared_attrs_bytes_from_state(
+            state, entity_sources, exclude_attrs_by_domain, dialect
+        )
+
+    @staticmethod
+    def shared_attrs_bytes_from_state(
+        state: State,
+        entity_sources: dict[str, EntityInfo],
+        exclude_attrs_by_domain: dict[str, set[str]],
+        dialect: SupportedDialect | None,
+    ) -> bytes:
+        """Create shared_attrs from a state."""
         domain = split_entity_id(state.entity_id)[0]
         exclude_attrs = set(ALL_DOMAIN_EXCLUDE_ATTRS)
         if base_platform_attrs := exclude_attrs_by_domain.get(domain):
@@ -721,6 +757,49 @@ class StatisticsShortTerm(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsRollupBase(StatisticsBase):
+    """Statistics data reduced from the long term statistics."""
+
+    # Number of hourly means the mean is computed from
+    mean_count: Mapped[int | None] = mapped_column(Integer)
+
+
+class StatisticsDaily(Base, StatisticsRollupBase):
+    """Daily statistics, reduced from the long term statistics."""
+
+    # Days are 23, 24 or 25 hours long, the end of a day is found in local time
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsRollupBase):
+    """Monthly statistics, reduced from the daily statistics."""
+
+    # Months are 28 to 31 days long, the end of a month is found in local time
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class StatisticsMeta(Base):
     """Statistics meta data."""
 
@@ -3,10 +3,15 @@ from __future__ import annotations
 
 from collections.abc import MutableMapping
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
@@ -16,6 +21,7 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columns as _modern_get_significant_states_columns,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -27,6 +33,7 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columns",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +122,59 @@ def get_significant_states(
     )
 
 
+def get_significant_states_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return a dict of significant states during a time period as columns."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_columns(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    columns: dict[str, dict[str, list[Any]]] = {}
+    for entity_id, states in _legacy_get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        no_attributes,
+        no_attributes,
+        True,
+    ).items():
+        compressed_states = cast(list[dict[str, Any]], states)
+        columns[entity_id] = {
+            COMPRESSED_STATE_STATE: [
+                state[COMPRESSED_STATE_STATE] for state in compressed_states
+            ],
+            COMPRESSED_STATE_LAST_UPDATED: [
+                state[COMPRESSED_STATE_LAST_UPDATED] for state in compressed_states
+            ],
+        }
+        if not no_attributes:
+            columns[entity_id][COMPRESSED_STATE_ATTRIBUTES] = [
+                state[COMPRESSED_STATE_ATTRIBUTES] for state in compressed_states
+            ]
+    return columns
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -21,7 +21,11 @@ from sqlalchemy import (
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -31,6 +35,7 @@ from ..filters import Filters
 from ..models import (
     LazyState,
     datetime_to_timestamp_or_none,
+    decode_attributes_from_source,
     extract_metadata_ids,
     process_timestamp,
     row_to_compressed_state,
@@ -211,6 +216,85 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if (
+        significant_states := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ) is None:
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = significant_states
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return significant states during UTC period start_time - end_time as columns.
+
+    Each entity maps to a list of states and a list of last updated timestamps,
+    and a list of attributes unless no_attributes is set. Without attributes,
+    consecutive rows with the same state are skipped.
+
+    The rows are never converted to State objects or dicts, which makes this
+    much cheaper for graphs covering a long period.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if (
+            significant_states := _significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ) is None:
+            return {}
+        rows, start_time_ts, entity_id_to_metadata_id = significant_states
+        return _sorted_states_to_columns(
+            rows, start_time_ts, entity_ids, entity_id_to_metadata_id, no_attributes
+        )
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Query the significant states rows sorted by metadata_id and last_updated.
+
+    Returns None if none of the entities are in the database.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +303,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,14 +341,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
+    return (
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -627,6 +707,59 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    no_attributes: bool,
+) -> dict[str, dict[str, list[Any]]]:
+    """Convert SQL results into per entity columns.
+
+    States must be sorted by entity_id and last_updated
+    """
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    columns: dict[str, dict[str, list[Any]]] = {}
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_states: list[str] = []
+        entity_last_updated: list[float | None] = []
+        entity_columns: dict[str, list[Any]] = {
+            COMPRESSED_STATE_STATE: entity_states,
+            COMPRESSED_STATE_LAST_UPDATED: entity_last_updated,
+        }
+        if no_attributes:
+            prev_state: str | None = None
+            for row in group:
+                if (state := row[state_idx]) != prev_state:
+                    entity_states.append(prev_state := state)
+                    # The start time state has a last_updated_ts of 0
+                    entity_last_updated.append(
+                        row[last_updated_ts_idx] or start_time_ts
+                    )
+        else:
+            attr_cache: dict[str, dict[str, Any]] = {}
+            entity_attributes: list[dict[str, Any]] = []
+            entity_columns[COMPRESSED_STATE_ATTRIBUTES] = entity_attributes
+            for row in group:
+                entity_states.append(row[state_idx])
+                entity_last_updated.append(row[last_updated_ts_idx] or start_time_ts)
+                entity_attributes.append(
+                    decode_attributes_from_source(row.attributes, attr_cache)
+                )
+        columns[metadata_id_to_entity_id[metadata_id]] = entity_columns
+
+    # Return the entities in the requested order
+    return {
+        entity_id: columns[entity_id]
+        for entity_id in entity_ids
+        if entity_id in columns
+    }
+
+
 def _sorted_states_to_dict(
     states: Iterable[Row],
     start_time_ts: float | None,
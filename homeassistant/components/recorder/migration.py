@@ -1060,6 +1060,10 @@ def _apply_update(  # noqa: C901
     elif new_version == 41:
         _create_index(session_maker, "event_types", "ix_event_types_event_type")
         _create_index(session_maker, "states_meta", "ix_states_meta_entity_id")
+    elif new_version == 42:
+        # The statistics_daily and statistics_monthly tables are created when
+        # the recorder starts and filled by StatisticsRollupsTask
+        pass
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
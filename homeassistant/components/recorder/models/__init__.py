@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from .context import (
     bytes_to_ulid_or_none,
+    bytes_to_ulid_timestamp_or_none,
     bytes_to_uuid_hex_or_none,
     ulid_to_bytes_or_none,
     uuid_hex_to_bytes_or_none,
@@ -10,6 +11,7 @@ from .context import (
 from .database import DatabaseEngine, DatabaseOptimizer, UnsupportedDialect
 from .event import extract_event_type_ids
 from .state import LazyState, extract_metadata_ids, row_to_compressed_state
+from .state_attributes import decode_attributes_from_source
 from .statistics import (
     CalendarStatisticPeriod,
     FixedStatisticPeriod,
@@ -42,8 +44,10 @@ __all__ = [
     "StatisticResult",
     "UnsupportedDialect",
     "bytes_to_ulid_or_none",
+    "bytes_to_ulid_timestamp_or_none",
     "bytes_to_uuid_hex_or_none",
     "datetime_to_timestamp_or_none",
+    "decode_attributes_from_source",
     "extract_event_type_ids",
     "extract_metadata_ids",
     "process_datetime_to_timestamp",
@@ -33,6 +33,16 @@ def bytes_to_ulid_or_none(_bytes: bytes | None) -> str | None:
         return None
 
 
+def bytes_to_ulid_timestamp_or_none(_bytes: bytes | None) -> float | None:
+    """Return the time an ulid was generated from its bytes.
+
+    The first 48 bits of an ulid are the milliseconds since the epoch.
+    """
+    if _bytes is None or len(_bytes) != 16:
+        return None
+    return int.from_bytes(_bytes[:6], "big") / 1000
+
+
 @lru_cache(maxsize=16)
 def uuid_hex_to_bytes_or_none(uuid_hex: str | None) -> bytes | None:
     """Convert a uuid hex to bytes."""
@@ -0,0 +1,287 @@
+"""Keep the most recent events for each recorded entity in memory."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED, MATCH_ALL
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_time_interval
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_object
+
+from .util import get_instance
+
+if TYPE_CHECKING:
+    from .table_managers.state_attributes import StateAttributesManager
+
+# The number of events kept for each entity
+RECENT_HISTORY_MAX_EVENTS = 32
+# Events older than this are forgotten, and so are entities without newer events
+RECENT_HISTORY_MAX_AGE = timedelta(days=1)
+RECENT_HISTORY_PRUNE_INTERVAL = timedelta(minutes=10)
+
+
+class _EntityRecentHistory:
+    """The most recent events for a single entity."""
+
+    __slots__ = ("events", "complete_after")
+
+    def __init__(self, complete_after: float) -> None:
+        """Initialize the entity recent history."""
+        self.events: deque[tuple[float, Event]] = deque(
+            maxlen=RECENT_HISTORY_MAX_EVENTS
+        )
+        # Every event fired after this timestamp is in events
+        self.complete_after = complete_after
+
+    @callback
+    def async_add(self, time_fired_ts: float, event: Event) -> None:
+        """Add an event, forgetting the oldest one if the buffer is full."""
+        events = self.events
+        if len(events) == RECENT_HISTORY_MAX_EVENTS:
+            self.complete_after = events[0][0]
+        events.append((time_fired_ts, event))
+
+    @callback
+    def async_prune(self, cutoff_ts: float) -> None:
+        """Forget the events fired before cutoff_ts."""
+        events = self.events
+        while events and events[0][0] < cutoff_ts:
+            events.popleft()
+        self.complete_after = max(self.complete_after, cutoff_ts)
+
+
+class RecentHistory:
+    """A bounded ring buffer of recent events for each recorded entity.
+
+    state_changed events are kept for the entity that changed and any other
+    event is kept for the entities in its entity_id. Only events the
+    recorder will write to the database are kept.
+
+    Streams use this to deliver recent history without waiting for the
+    recorder to commit and then querying the database. Events are buffered
+    from the start of the recorder until it stops listening for events.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_entity_filter",
+        "_exclude_event_types",
+        "_state_attributes_manager",
+        "_started",
+        "_entities",
+        "_removed",
+        "_unsubs",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_filter: Callable[[str], bool],
+        exclude_event_types: set[str],
+        state_attributes_manager: StateAttributesManager,
+    ) -> None:
+        """Initialize the recent history."""
+        self._hass = hass
+        self._entity_filter = entity_filter
+        self._exclude_event_types = exclude_event_types
+        self._state_attributes_manager = state_attributes_manager
+        self._started = 0.0
+        self._entities: dict[str, _EntityRecentHistory] = {}
+        # When each entity removed since we started buffering was removed
+        self._removed: dict[str, float] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start buffering events."""
+        if self._unsubs:
+            return
+        self._started = dt_util.utc_to_timestamp(dt_util.utcnow())
+        self._unsubs = [
+            self._hass.bus.async_listen(
+                MATCH_ALL, self._async_event_listener, run_immediately=True
+            ),
+            async_track_time_interval(
+                self._hass,
+                self._async_prune,
+                RECENT_HISTORY_PRUNE_INTERVAL,
+                name="recorder recent history prune",
+                cancel_on_shutdown=True,
+            ),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop buffering events and forget the buffered events."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._entities.clear()
+        self._removed.clear()
+
+    @callback
+    def _async_prune(self, now: datetime) -> None:
+        """Forget old events and the entities without newer events."""
+        cutoff_ts = dt_util.utc_to_timestamp(now - RECENT_HISTORY_MAX_AGE)
+        if cutoff_ts <= self._started:
+            return
+        # Entities without a buffer are covered since we started buffering,
+        # which they no longer are once their old events are forgotten
+        self._started = cutoff_ts
+        entities = self._entities
+        for entity_id, entity in list(entities.items()):
+            entity.async_prune(cutoff_ts)
+            if not entity.events:
+                del entities[entity_id]
+        self._removed = {
+            entity_id: removed_ts
+            for entity_id, removed_ts in self._removed.items()
+            if removed_ts >= cutoff_ts
+        }
+
+    @callback
+    def _async_get_or_create(self, entity_id: str) -> _EntityRecentHistory:
+        """Return the buffer of an entity, creating it if needed."""
+        if (entity := self._entities.get(entity_id)) is None:
+            # The entity did not change since we started buffering,
+            # or since it was removed
+            entity = self._entities[entity_id] = _EntityRecentHistory(
+                self._removed.pop(entity_id, self._started)
+            )
+        return entity
+
+    @callback
+    def _async_event_listener(self, event: Event) -> None:
+        """Add an event to the buffers of the entities it refers to."""
+        if event.event_type in self._exclude_event_types:
+            return
+        if (entity_id := event.data.get(ATTR_ENTITY_ID)) is None:
+            return
+        time_fired_ts = dt_util.utc_to_timestamp(event.time_fired)
+        if event.event_type == EVENT_STATE_CHANGED:
+            if not self._entity_filter(entity_id):
+                return
+            if event.data["new_state"] is None:
+                # Forget removed entities, they are not covered anymore
+                self._entities.pop(entity_id, None)
+                self._removed[entity_id] = time_fired_ts
+                return
+            self._async_get_or_create(entity_id).async_add(time_fired_ts, event)
+            return
+
+        if isinstance(entity_id, str):
+            entity_ids: Iterable[str] = (entity_id,)
+        elif isinstance(entity_id, list):
+            entity_ids = entity_id
+        else:
+            return
+        for event_entity_id in entity_ids:
+            if not isinstance(event_entity_id, str) or not self._entity_filter(
+                event_entity_id
+            ):
+                continue
+            # Only keep events for entities that exist
+            if (
+                event_entity_id not in self._entities
+                and self._hass.states.get(event_entity_id) is None
+            ):
+                continue
+            self._async_get_or_create(event_entity_id).async_add(
+                time_fired_ts, event
+            )
+
+    @callback
+    def async_covers(self, entity_ids: Iterable[str], start_time: datetime) -> bool:
+        """Return if every event after start_time is buffered for the entities."""
+        if not self._unsubs or EVENT_STATE_CHANGED in self._exclude_event_types:
+            return False
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        for entity_id in entity_ids:
+            if not self._entity_filter(entity_id):
+                return False
+            if (entity := self._entities.get(entity_id)) is None:
+                # The entity has not changed since we started buffering,
+                # but events for entities without a state are not kept
+                if (
+                    start_time_ts < self._started
+                    or self._hass.states.get(entity_id) is None
+                ):
+                    return False
+            elif start_time_ts < entity.complete_after:
+                return False
+        return True
+
+    @callback
+    def async_get_events(
+        self, entity_ids: Iterable[str], start_time: datetime, end_time: datetime
+    ) -> list[Event]:
+        """Return the events for the entities fired after start_time until end_time.
+
+        The caller must check the period is covered with async_covers first.
+        """
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        end_time_ts = dt_util.utc_to_timestamp(end_time)
+        events: dict[int, tuple[float, Event]] = {}
+        for entity_id in entity_ids:
+            if (entity := self._entities.get(entity_id)) is None:
+                continue
+            for time_fired_ts, event in entity.events:
+                if start_time_ts < time_fired_ts <= end_time_ts:
+                    # Events for multiple entities are in multiple buffers
+                    events[id(event)] = (time_fired_ts, event)
+        return [event for _, event in sorted(events.values(), key=_time_fired_key)]
+
+    @callback
+    def async_get_state(self, entity_id: str, point_in_time: datetime) -> State | None:
+        """Return the state of an entity at a point in time.
+
+        The caller must check the point in time is covered with async_covers first.
+        """
+        if (entity := self._entities.get(entity_id)) is None:
+            return self._hass.states.get(entity_id)
+        point_in_time_ts = dt_util.utc_to_timestamp(point_in_time)
+        last_event: Event | None = None
+        for time_fired_ts, event in entity.events:
+            if event.event_type != EVENT_STATE_CHANGED:
+                continue
+            if time_fired_ts > point_in_time_ts:
+                if last_event is None:
+                    # The first change after the point in time
+                    # knows the state before it
+                    return event.data["old_state"]
+                break
+            last_event = event
+        if last_event is None:
+            return self._hass.states.get(entity_id)
+        return last_event.data["new_state"]
+
+    @callback
+    def async_get_recorded_attributes(self, state: State) -> dict[str, Any]:
+        """Return the attributes of a state as the recorder writes them.
+
+        Attributes the recorder excludes are stripped, and attributes which
+        are too large or not serializable are not recorded at all.
+        """
+        if not (
+            shared_attrs := self._state_attributes_manager.serialize_from_state(state)
+        ):
+            return {}
+        return json_loads_object(shared_attrs)
+
+
+def _time_fired_key(item: tuple[float, Event]) -> float:
+    """Sort buffered events by the time they were fired."""
+    return item[0]
+
+
+@callback
+def async_get_recent_history(hass: HomeAssistant) -> RecentHistory:
+    """Get the recent history.
+
+    Events are buffered once the recorder starts it with async_start.
+    """
+    return get_instance(hass).recent_history
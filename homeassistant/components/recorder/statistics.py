@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
@@ -56,6 +56,8 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -339,14 +341,117 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+class HourlyStatisticsAccumulator:
+    """Fold 5-minute statistics into a running summary of the hour.
+
+    The summary is only used to compile the hourly statistics if all twelve
+    5-minute periods of the hour were folded into it in order. Otherwise,
+    for example after a restart during the hour, a failed commit or when the
+    short term statistics were modified, it is discarded and the hourly
+    statistics are compiled from the short term statistics in the database.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        self._hour_start_ts: float | None = None
+        self._last_period_ts: float | None = None
+        self._periods = 0
+        self._summary: dict[int, StatisticDataTimestamp] = {}
+        self._means: dict[int, tuple[float, int]] = {}
+
+    def reset(self) -> None:
+        """Discard the summary of the current hour."""
+        self._hour_start_ts = None
+        self._last_period_ts = None
+        self._periods = 0
+        self._summary = {}
+        self._means = {}
+
+    def add_period(
+        self, start: datetime, stats: Iterable[tuple[int, StatisticData]]
+    ) -> None:
+        """Fold the statistics of a 5-minute period into the summary."""
+        start_ts = start.timestamp()
+        hour_start_ts = start.replace(minute=0).timestamp()
+        if hour_start_ts != self._hour_start_ts:
+            self.reset()
+            self._hour_start_ts = hour_start_ts
+        elif self._last_period_ts is not None and start_ts <= self._last_period_ts:
+            # The periods must be folded in order for the last sum to be right
+            self.reset()
+            return
+        self._last_period_ts = start_ts
+        self._periods += 1
+
+        summary = self._summary
+        means = self._means
+        for metadata_id, stat in stats:
+            if (item := summary.get(metadata_id)) is None:
+                item = summary[metadata_id] = {"start_ts": hour_start_ts}
+            if (_mean := stat.get("mean")) is not None:
+                total, count = means.get(metadata_id, (0.0, 0))
+                means[metadata_id] = (total + _mean, count + 1)
+            if (_min := stat.get("min")) is not None and (
+                (current_min := item.get("min")) is None or _min < current_min
+            ):
+                item["min"] = _min
+            if (_max := stat.get("max")) is not None and (
+                (current_max := item.get("max")) is None or _max > current_max
+            ):
+                item["max"] = _max
+            item["last_reset_ts"] = datetime_to_timestamp_or_none(
+                stat.get("last_reset")
+            )
+            if "state" in stat:
+                item["state"] = stat["state"]
+            else:
+                item.pop("state", None)
+            if "sum" in stat:
+                item["sum"] = stat["sum"]
+            else:
+                item.pop("sum", None)
+
+    def hourly_summary(
+        self, start_time: datetime
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the summary of the hour if all its periods were folded in."""
+        if self._hour_start_ts != start_time.timestamp() or self._periods != 12:
+            return None
+        summary = self._summary
+        for metadata_id, (total, count) in self._means.items():
+            summary[metadata_id]["mean"] = total / count
+        self.reset()
+        return summary
+
+
+def _compile_hourly_statistics(
+    session: Session,
+    start: datetime,
+    accumulator: HourlyStatisticsAccumulator | None = None,
+) -> dict[int, StatisticDataTimestamp]:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If the accumulator has folded in all 5-minute statistics of the hour,
+    its summary is used instead of querying the database.
+
+    Returns the summary of the hour by metadata_id.
     """
     start_time = start.replace(minute=0)
+
+    if (
+        accumulator
+        and (accumulated := accumulator.hourly_summary(start_time)) is not None
+    ):
+        session.add_all(
+            Statistics.from_stats_ts(metadata_id, summary_item)
+            for metadata_id, summary_item in accumulated.items()
+        )
+        return accumulated
+
     start_time_ts = start_time.timestamp()
     end_time = start_time + timedelta(hours=1)
     end_time_ts = end_time.timestamp()
@@ -394,6 +499,215 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         Statistics.from_stats_ts(metadata_id, summary_item)
         for metadata_id, summary_item in summary.items()
     )
+    return summary
+
+
+@dataclasses.dataclass(slots=True)
+class StatisticsRollups:
+    """Track which daily and monthly statistics are kept up to date.
+
+    The daily and monthly statistics are only used to answer queries when
+    active is set. While they are rebuilt, the days from compiled_from_ts
+    onwards are already kept up to date.
+    """
+
+    active: bool = False
+    compiled_from_ts: float | None = None
+
+    def is_compiled(self, start_ts: float) -> bool:
+        """Return True if the rollups starting at start_ts are kept up to date."""
+        return self.active or (
+            self.compiled_from_ts is not None and start_ts >= self.compiled_from_ts
+        )
+
+
+def _compile_statistics_rollup(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start_time: datetime,
+    end_time: datetime,
+    metadata_id: int | None,
+) -> None:
+    """Compile daily or monthly statistics for one period.
+
+    Daily statistics are reduced from the hourly statistics, monthly statistics
+    are reduced from the daily statistics. The mean is weighted by the number of
+    hourly means it is computed from.
+    """
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp()
+    source: type[Statistics | StatisticsDaily]
+    if table is StatisticsDaily:
+        source = Statistics
+        mean_columns = (func.avg(Statistics.mean), func.count(Statistics.mean))
+    else:
+        source = StatisticsDaily
+        mean_count = func.sum(StatisticsDaily.mean_count)
+        mean_columns = (
+            func.sum(StatisticsDaily.mean * StatisticsDaily.mean_count)
+            / func.nullif(mean_count, 0),
+            mean_count,
+        )
+
+    filters = [source.start_ts >= start_time_ts, source.start_ts < end_time_ts]
+    delete_query = session.query(table).filter(table.start_ts == start_time_ts)
+    if metadata_id is not None:
+        filters.append(source.metadata_id == metadata_id)
+        delete_query = delete_query.filter(table.metadata_id == metadata_id)
+    delete_query.delete(synchronize_session=False)
+
+    # Compute the period's average, min, max
+    summary: dict[int, StatisticDataTimestamp] = {}
+    mean_counts: dict[int, int | None] = {}
+    for stat in session.execute(
+        select(
+            source.metadata_id,
+            *mean_columns,
+            func.min(source.min),
+            func.max(source.max),
+        )
+        .filter(*filters)
+        .group_by(source.metadata_id)
+    ):
+        metadata_id_, _mean, _mean_count, _min, _max = stat
+        summary[metadata_id_] = {
+            "start_ts": start_time_ts,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+        mean_counts[metadata_id_] = _mean_count
+
+    # Get the period's last sum
+    last = (
+        select(
+            source.metadata_id,
+            source.last_reset_ts,
+            source.state,
+            source.sum,
+            func.row_number()
+            .over(
+                partition_by=source.metadata_id,
+                order_by=source.start_ts.desc(),
+            )
+            .label("rownum"),
+        )
+        .filter(*filters)
+        .subquery()
+    )
+    for stat in session.execute(select(last).filter(last.c.rownum == 1)):
+        metadata_id_, last_reset_ts, state, _sum, _ = stat
+        summary[metadata_id_].update(
+            {
+                "last_reset_ts": last_reset_ts,
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    for metadata_id_, summary_item in summary.items():
+        rollup = table.from_stats_ts(metadata_id_, summary_item)
+        rollup.mean_count = mean_counts[metadata_id_]
+        session.add(rollup)
+
+
+def _compile_statistics_rollups(
+    instance: Recorder,
+    session: Session,
+    start_times: Iterable[datetime],
+    metadata_id: int | None = None,
+) -> None:
+    """Compile the daily and monthly statistics of the days of start_times."""
+    rollups = instance.statistics_rollups
+    days = {
+        day_start
+        for start_time in start_times
+        if rollups.is_compiled(
+            (
+                day_start := dt_util.as_local(start_time).replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+            ).timestamp()
+        )
+    }
+    for day_start in sorted(days):
+        _compile_statistics_rollup(
+            session,
+            StatisticsDaily,
+            day_start,
+            day_start + timedelta(days=1),
+            metadata_id,
+        )
+    for month_start in sorted({day_start.replace(day=1) for day_start in days}):
+        _compile_statistics_rollup(
+            session,
+            StatisticsMonthly,
+            month_start,
+            _find_month_end_time(month_start),
+            metadata_id,
+        )
+
+
+def _update_statistics_rollups(
+    instance: Recorder,
+    session: Session,
+    hour_start: datetime,
+    summary: dict[int, StatisticDataTimestamp],
+) -> None:
+    """Fold the statistics of a compiled hour into its day and month.
+
+    The hour is the newest of its day and month, so its state and sum are the
+    ones of the day and month. The mean of the day and month is weighted by the
+    number of hourly means it is computed from, as when the whole period is
+    compiled.
+    """
+    day_start = dt_util.as_local(hour_start).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    if not summary or not instance.statistics_rollups.is_compiled(
+        day_start.timestamp()
+    ):
+        return
+
+    table: type[StatisticsDaily | StatisticsMonthly]
+    for table, period_start in (
+        (StatisticsDaily, day_start),
+        (StatisticsMonthly, day_start.replace(day=1)),
+    ):
+        period_start_ts = period_start.timestamp()
+        rollups = {
+            rollup.metadata_id: rollup
+            for rollup in session.query(table).filter(
+                table.metadata_id.in_(list(summary)),
+                table.start_ts == period_start_ts,
+            )
+        }
+        for metadata_id, hour in summary.items():
+            hour_mean = hour.get("mean")
+            if (rollup := rollups.get(metadata_id)) is None:
+                rollup = table.from_stats_ts(
+                    metadata_id, {**hour, "start_ts": period_start_ts}
+                )
+                rollup.mean_count = 0 if hour_mean is None else 1
+                session.add(rollup)
+                continue
+            if hour_mean is not None:
+                mean_count = rollup.mean_count or 0
+                rollup.mean = ((rollup.mean or 0.0) * mean_count + hour_mean) / (
+                    mean_count + 1
+                )
+                rollup.mean_count = mean_count + 1
+            if (hour_min := hour.get("min")) is not None:
+                rollup.min = (
+                    hour_min if rollup.min is None else min(rollup.min, hour_min)
+                )
+            if (hour_max := hour.get("max")) is not None:
+                rollup.max = (
+                    hour_max if rollup.max is None else max(rollup.max, hour_max)
+                )
+            rollup.last_reset_ts = hour.get("last_reset_ts")
+            rollup.state = hour.get("state")
+            rollup.sum = hour.get("sum")
 
 
 @retryable_database_job("compile missing statistics")
@@ -408,7 +722,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
     # Commit every 12 hours of data
     commit_interval = 60 / period_size * 12
 
-    with session_scope(
+    with _discard_accumulated_statistics_on_error(instance), session_scope(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
@@ -433,6 +747,21 @@ def compile_missing_statistics(instance: Recorder) -> bool:
     return True
 
 
+@contextlib.contextmanager
+def _discard_accumulated_statistics_on_error(
+    instance: Recorder,
+) -> Generator[None, None, None]:
+    """Discard the accumulated hourly statistics if compiling statistics fails.
+
+    The accumulated statistics may include periods which were never committed.
+    """
+    try:
+        yield
+    except Exception:
+        instance.hourly_statistics_accumulator.reset()
+        raise
+
+
 @retryable_database_job("compile statistics")
 def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -> bool:
     """Compile 5-minute statistics for all integrations with a recorder platform.
@@ -440,7 +769,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     The actual calculation is delegated to the platforms.
     """
     # Return if we already have 5-minute statistics for the requested period
-    with session_scope(
+    with _discard_accumulated_statistics_on_error(instance), session_scope(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
@@ -509,22 +838,29 @@ def _compile_statistics(
         current_metadata.update(compiled.current_metadata)
 
     # Insert collected statistics in the database
+    period_stats: list[tuple[int, StatisticData]] = []
     for stats in platform_stats:
         modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
             session, stats["meta"], current_metadata
         )
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
-        _insert_statistics(
+        if _insert_statistics(
             session,
             StatisticsShortTerm,
             metadata_id,
             stats["stat"],
-        )
+        ):
+            period_stats.append((metadata_id, stats["stat"]))
+
+    accumulator = instance.hourly_statistics_accumulator
+    accumulator.add_period(start, period_stats)
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        hour_start = start.replace(minute=0)
+        summary = _compile_hourly_statistics(session, hour_start, accumulator)
+        _update_statistics_rollups(instance, session, hour_start, summary)
 
     session.add(StatisticsRuns(start=start))
 
@@ -566,8 +902,8 @@ def _insert_statistics(
     table: type[StatisticsBase],
     metadata_id: int,
     statistic: StatisticData,
-) -> None:
-    """Insert statistics in the database."""
+) -> bool:
+    """Insert statistics in the database, return True if they were added."""
     try:
         session.add(table.from_stats(metadata_id, statistic))
     except SQLAlchemyError:
@@ -576,6 +912,8 @@ def _insert_statistics(
             metadata_id,
             statistic,
         )
+        return False
+    return True
 
 
 def _update_statistics(
@@ -649,6 +987,7 @@ def get_metadata(
 
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
+    instance.hourly_statistics_accumulator.reset()
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
 
@@ -959,6 +1298,33 @@ def _reduce_statistics_per_week(
     )
 
 
+def _reduce_daily_statistics_per_week(
+    stats: dict[str, list[StatisticsRow]],
+    mean_counts: dict[str, list[int | None]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce daily statistics to weekly statistics.
+
+    The mean of each week is weighted by the number of hourly means of each day.
+    """
+    result = _reduce_statistics_per_week(stats, types)
+    if "mean" not in types:
+        return result
+    _, _week_start_end_ts = reduce_week_ts_factory()
+    for statistic_id, rows in result.items():
+        totals: dict[float, tuple[float, int]] = {}
+        for day, mean_count in zip(stats[statistic_id], mean_counts[statistic_id]):
+            if (_mean := day.get("mean")) is None or not mean_count:
+                continue
+            week_start = _week_start_end_ts(day["start"])[0]
+            total, count = totals.get(week_start, (0.0, 0))
+            totals[week_start] = (total + _mean * mean_count, count + mean_count)
+        for row in rows:
+            if (week_total := totals.get(row["start"])) is not None:
+                row["mean"] = week_total[0] / week_total[1]
+    return result
+
+
 def _find_month_end_time(timestamp: datetime) -> datetime:
     """Return the end of the month (midnight at the first day of the next month)."""
     # We add 4 days to the end to make sure we are in the next month
@@ -1571,6 +1937,87 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: Literal["day", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return daily, weekly or monthly statistics from the rollup tables.
+
+    Returns None if start_time or end_time is within a day or month, as the
+    partial periods must be reduced from the hourly statistics, or if the
+    rollups were compiled for another time zone.
+    """
+    table: type[StatisticsDaily | StatisticsMonthly] = (
+        StatisticsMonthly if period == "month" else StatisticsDaily
+    )
+    _, period_start_end = (
+        reduce_month_ts_factory() if period == "month" else reduce_day_ts_factory()
+    )
+    for edge_time in (start_time, end_time):
+        if edge_time is None:
+            continue
+        edge_ts = edge_time.timestamp()
+        if period_start_end(edge_ts)[0] != edge_ts:
+            return None
+
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    with_mean_count = period == "week" and "mean" in types
+    if with_mean_count:
+        stmt += lambda q: q.add_columns(StatisticsDaily.mean_count)
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+
+    if not stats:
+        return {}
+
+    if any(
+        period_start_end(start_ts)[0] != start_ts
+        for start_ts in {row.start_ts for row in stats}
+    ):
+        _LOGGER.debug("Rebuilding statistics rollups after a time zone change")
+        get_instance(hass).rebuild_statistics_rollups()
+        return None
+
+    result = _sorted_statistics_to_dict(
+        hass,
+        session,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        table,
+        start_time,
+        units,
+        types,
+    )
+
+    if period == "week":
+        mean_counts: dict[str, list[int | None]] = defaultdict(list)
+        if with_mean_count:
+            metadata_by_id = dict(metadata.values())
+            for row in stats:
+                statistic_id = metadata_by_id[row.metadata_id]["statistic_id"]
+                mean_counts[statistic_id].append(row.mean_count)
+        return _reduce_daily_statistics_per_week(result, mean_counts, types)
+
+    # Days and months are not of equal length
+    for rows in result.values():
+        for statistics_row in rows:
+            statistics_row["end"] = period_start_end(statistics_row["start"])[1]
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1641,37 +2088,61 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if (
+        period in ("day", "week", "month")
+        and get_instance(hass).statistics_rollups.active
+        and (
+            rollups_result := _statistics_rollups_during_period(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                metadata,
+                metadata_ids,
+                cast(Literal["day", "week", "month"], period),
+                units,
+                types,
+            )
+        )
+        is not None
+    ):
+        result = rollups_result
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if not stats:
-        return {}
+        if not stats:
+            return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        session,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        start_time,
-        units,
-        types,
-    )
+        result = _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
+
+    if not result:
+        return {}
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2186,6 +2657,8 @@ def _filter_unique_constraint_integrity_error(
                     ignore = True
 
         if ignore:
+            # The rolled back statistics may have been accumulated
+            instance.hourly_statistics_accumulator.reset()
             _LOGGER.warning(
                 (
                     "Blocked attempt to insert duplicated statistic rows, please report"
@@ -2215,6 +2688,8 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    if table is StatisticsShortTerm:
+        instance.hourly_statistics_accumulator.reset()
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
@@ -2242,6 +2717,28 @@ def import_statistics(
         )
 
 
+@retryable_database_job("compile imported statistics rollups")
+def compile_imported_statistics_rollups(
+    instance: Recorder,
+    statistic_id: str,
+    start_times: Iterable[datetime],
+) -> bool:
+    """Compile the daily and monthly statistics of imported statistics.
+
+    The rollups are compiled in their own session once the import is committed,
+    so a duplicated row blocked while importing is not flushed by the rollup
+    queries.
+    """
+    with session_scope(session=instance.get_session()) as session:
+        if metadata_id := instance.statistics_meta_manager.get(
+            session, statistic_id
+        ):
+            _compile_statistics_rollups(
+                instance, session, start_times, metadata_id[0]
+            )
+    return True
+
+
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
     instance: Recorder,
@@ -2265,6 +2762,7 @@ def adjust_statistics(
         ):
             sum_adjustment = convert(sum_adjustment)
 
+        instance.hourly_statistics_accumulator.reset()
         _adjust_sum_statistics(
             session,
             StatisticsShortTerm,
@@ -2281,6 +2779,29 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # Adjust the days and months after the adjusted one and compile the
+        # adjusted day and month from the adjusted hourly statistics
+        day_start = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        _adjust_sum_statistics(
+            session,
+            StatisticsDaily,
+            metadata[statistic_id][0],
+            day_start + timedelta(days=1),
+            sum_adjustment,
+        )
+        _adjust_sum_statistics(
+            session,
+            StatisticsMonthly,
+            metadata[statistic_id][0],
+            _find_month_end_time(day_start),
+            sum_adjustment,
+        )
+        _compile_statistics_rollups(
+            instance, session, (start_time,), metadata[statistic_id][0]
+        )
+
     return True
 
 
@@ -2341,7 +2862,10 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
+        instance.hourly_statistics_accumulator.reset()
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
 
@@ -2371,6 +2895,85 @@ def async_change_statistics_unit(
     )
 
 
+def statistics_rollups_complete(session: Session) -> bool:
+    """Return True if the daily and monthly statistics cover the hourly statistics.
+
+    The rollups must be rebuilt if the time zone has changed or hourly statistics
+    were added by a version which did not compile the rollups.
+    """
+    oldest_ts, newest_ts = session.execute(
+        select(func.min(Statistics.start_ts), func.max(Statistics.start_ts))
+    ).one()
+    oldest_day_ts, newest_day_ts = session.execute(
+        select(func.min(StatisticsDaily.start_ts), func.max(StatisticsDaily.start_ts))
+    ).one()
+    newest_month_ts = session.execute(
+        select(func.max(StatisticsMonthly.start_ts))
+    ).scalar()
+    if oldest_ts is None:
+        return oldest_day_ts is None and newest_month_ts is None
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    return bool(
+        oldest_day_ts == day_start_end(oldest_ts)[0]
+        and newest_day_ts == day_start_end(newest_ts)[0]
+        and newest_month_ts == month_start_end(newest_ts)[0]
+    )
+
+
+@retryable_database_job("compile statistics rollups")
+def compile_statistics_rollups(instance: Recorder) -> bool:
+    """Rebuild the daily and monthly statistics from the hourly statistics.
+
+    The rollups are rebuilt one month at a time, starting with the newest month.
+    Returns False if there are more months to compile.
+    Returns True when the rollups are active.
+    """
+    rollups = instance.statistics_rollups
+    if rollups.active:
+        return True
+
+    with session_scope(session=instance.get_session()) as session:
+        if rollups.compiled_from_ts is None:
+            session.query(StatisticsDaily).delete(synchronize_session=False)
+            session.query(StatisticsMonthly).delete(synchronize_session=False)
+        oldest_ts, newest_ts = session.execute(
+            select(func.min(Statistics.start_ts), func.max(Statistics.start_ts))
+        ).one()
+        if oldest_ts is None:
+            month_start_ts = None
+        else:
+            if rollups.compiled_from_ts is None:
+                month_end = _find_month_end_time(
+                    dt_util.as_local(dt_util.utc_from_timestamp(newest_ts))
+                )
+            else:
+                month_end = dt_util.as_local(
+                    dt_util.utc_from_timestamp(rollups.compiled_from_ts)
+                )
+            month_start = (month_end - timedelta(days=1)).replace(day=1)
+            day_start = month_start
+            while day_start < month_end:
+                day_end = day_start + timedelta(days=1)
+                _compile_statistics_rollup(
+                    session, StatisticsDaily, day_start, day_end, None
+                )
+                day_start = day_end
+            _compile_statistics_rollup(
+                session, StatisticsMonthly, month_start, month_end, None
+            )
+            month_start_ts = month_start.timestamp()
+
+    if month_start_ts is not None and oldest_ts < month_start_ts:
+        rollups.compiled_from_ts = month_start_ts
+        return False
+
+    _LOGGER.debug("Activating statistics rollups as all months are compiled")
+    rollups.compiled_from_ts = None
+    rollups.active = True
+    return True
+
+
 def cleanup_statistics_timestamp_migration(instance: Recorder) -> bool:
     """Clean up the statistics migration from timestamp to datetime.
 
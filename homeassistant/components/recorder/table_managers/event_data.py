@@ -49,10 +49,32 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        self.load_from_serialized(
+            (
+                shared_event_bytes
+                for event in events
+                if (shared_event_bytes := self.serialize_from_event(event))
+            ),
+            session,
+        )
+
+    def load_from_serialized(
+        self, shared_data_bytes_iter: Iterable[bytes], session: Session
+    ) -> None:
+        """Load the data_ids of already serialized shared_datas into memory.
+
+        Shared datas that are already cached or pending are not looked up again.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        pending = self._pending
         if hashes := {
-            EventData.hash_shared_data_bytes(shared_event_bytes)
-            for event in events
-            if (shared_event_bytes := self.serialize_from_event(event))
+            EventData.hash_shared_data_bytes(shared_data_bytes)
+            for shared_data_bytes in shared_data_bytes_iter
+            if (shared_data := shared_data_bytes.decode("utf-8")) not in id_map
+            and shared_data not in pending
         }:
             self._load_from_hashes(hashes, session)
 
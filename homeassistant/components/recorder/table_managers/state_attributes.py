@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
 
-from homeassistant.core import Event
+from homeassistant.core import Event, State
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
@@ -60,16 +60,50 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             )
             return None
 
+    def serialize_from_state(self, state: State) -> bytes | None:
+        """Serialize the attributes of a state as they are recorded."""
+        try:
+            return StateAttributes.shared_attrs_bytes_from_state(
+                state,
+                self._entity_sources,
+                self._exclude_attributes_by_domain,
+                self.recorder.dialect_name,
+            )
+        except JSON_ENCODE_EXCEPTIONS:
+            return None
+
     def load(self, events: list[Event], session: Session) -> None:
         """Load the shared_attrs to attributes_ids mapping into memory from events.
 
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        self.load_from_serialized(
+            (
+                shared_attrs_bytes
+                for event in events
+                if (shared_attrs_bytes := self.serialize_from_event(event))
+            ),
+            session,
+        )
+
+    def load_from_serialized(
+        self, shared_attrs_bytes_iter: Iterable[bytes], session: Session
+    ) -> None:
+        """Load the attributes_ids of already serialized shared_attrs into memory.
+
+        Shared attrs that are already cached or pending are not looked up again.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        pending = self._pending
         if hashes := {
             StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
-            for event in events
-            if (shared_attrs_bytes := self.serialize_from_event(event))
+            for shared_attrs_bytes in shared_attrs_bytes_iter
+            if (shared_attrs := shared_attrs_bytes.decode("utf-8")) not in id_map
+            and shared_attrs not in pending
         }:
             self._load_from_hashes(hashes, session)
 
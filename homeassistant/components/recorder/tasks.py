@@ -193,6 +193,12 @@ class ImportStatisticsTask(RecorderTask):
         if statistics.import_statistics(
             instance, self.metadata, self.statistics, self.table
         ):
+            if self.table is Statistics:
+                statistics.compile_imported_statistics_rollups(
+                    instance,
+                    self.metadata["statistic_id"],
+                    [stat["start"] for stat in self.statistics],
+                )
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(
@@ -281,6 +287,19 @@ class EventTask(RecorderTask):
         instance._process_one_event(self.event)
 
 
+@dataclass(slots=True)
+class EventBatchTask(RecorderTask):
+    """A batch of consecutive events to be processed together."""
+
+    events: list[Event]
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._process_events(self.events)
+
+
 @dataclass(slots=True)
 class KeepAliveTask(RecorderTask):
     """A keep alive to be sent."""
@@ -361,6 +380,17 @@ class StatisticsTimestampMigrationCleanupTask(RecorderTask):
             instance.queue_task(StatisticsTimestampMigrationCleanupTask())
 
 
+@dataclass(slots=True)
+class StatisticsRollupsTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild the statistics rollups."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollups task."""
+        if not statistics.compile_statistics_rollups(instance):
+            # Schedule a new statistics rollups task if this one didn't finish
+            instance.queue_task(StatisticsRollupsTask())
+
+
 @dataclass(slots=True)
 class AdjustLRUSizeTask(RecorderTask):
     """An object to insert into the recorder queue to adjust the LRU size."""
@@ -167,6 +167,17 @@ class SensorEntity(Entity):
     _last_reset_reported = False
     _sensor_option_display_precision: int | None = None
     _sensor_option_unit_of_measurement: str | None | UndefinedType = UNDEFINED
+    _static_attribute_members = {
+        "_default_to_device_class_name": ("device_class",),
+        "capability_attributes": ("options", "state_class"),
+        "device_class": (),
+        "options": (),
+        "state_class": (),
+    }
+    _static_attribute_sources = Entity._static_attribute_sources | {
+        "_attr_options",
+        "_attr_state_class",
+    }
 
     @callback
     def add_to_platform_start(
@@ -101,6 +101,7 @@ class SwitchEntity(ToggleEntity):
 
     entity_description: SwitchEntityDescription
     _attr_device_class: SwitchDeviceClass | None
+    _static_attribute_members = {"device_class": ()}
 
     @property
     def device_class(self) -> SwitchDeviceClass | None:
@@ -1,6 +1,7 @@
 """Commands part of Websocket API."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 import datetime as dt
 from functools import lru_cache, partial
@@ -10,21 +11,36 @@ from typing import Any, cast
 
 import voluptuous as vol
 
+from homeassistant.auth import EVENT_USER_REMOVED, EVENT_USER_UPDATED
 from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.const import (
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
-from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     EventStateChangedData,
@@ -55,6 +71,9 @@ from .connection import ActiveConnection
 from .messages import construct_event_message, construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_SUBSCRIPTIONS = "websocket_api_entity_subscriptions"
+
+_LOGGER = logging.getLogger(__name__)
 
 
 @callback
@@ -301,25 +320,210 @@ def _send_handle_get_states_response(
     connection.send_message(construct_result_message(msg_id, f"[{joined_states}]"))
 
 
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+class _EntitySubscriptions:
+    """Fan out state changed events to subscribe_entities subscriptions.
+
+    A single state_changed listener is shared by all connections. Subscriptions
+    are indexed by the entity ids they are interested in and read permission
+    checks are cached per user until the permissions or registries change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the entity subscriptions."""
+        self._hass = hass
+        self._all_entities: set[_EntitySubscription] = set()
+        self._by_entity_id: dict[str, set[_EntitySubscription]] = {}
+        self._permissions: dict[
+            str, tuple[AbstractPermissions, bool, dict[str, bool]]
+        ] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_subscribe(self, subscription: _EntitySubscription) -> CALLBACK_TYPE:
+        """Add a subscription, return a callback to remove it."""
+        if not self._unsubs:
+            self._async_listen()
+        if subscription.entity_ids:
+            for entity_id in subscription.entity_ids:
+                self._by_entity_id.setdefault(entity_id, set()).add(subscription)
+        else:
+            self._all_entities.add(subscription)
+        return partial(self._async_unsubscribe, subscription)
+
+    @callback
+    def _async_unsubscribe(self, subscription: _EntitySubscription) -> None:
+        """Remove a subscription."""
+        subscription.async_cancel()
+        if not subscription.entity_ids:
+            self._all_entities.discard(subscription)
+        for entity_id in subscription.entity_ids:
+            if (subscriptions := self._by_entity_id.get(entity_id)) is None:
+                continue
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._by_entity_id[entity_id]
+        if not self._all_entities and not self._by_entity_id:
+            for unsub in self._unsubs:
+                unsub()
+            self._unsubs.clear()
+            self._permissions.clear()
+
+    @callback
+    def _async_listen(self) -> None:
+        """Listen for state changes and events invalidating the permissions."""
+        bus = self._hass.bus
+        self._unsubs = [
+            bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward, run_immediately=True
+            ),
+            *(
+                bus.async_listen(
+                    event_type,
+                    self._async_invalidate_permissions,
+                    run_immediately=True,
+                )
+                for event_type in (
+                    EVENT_USER_UPDATED,
+                    EVENT_USER_REMOVED,
+                    er.EVENT_ENTITY_REGISTRY_UPDATED,
+                    dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                )
+            ),
+        ]
+
+    @callback
+    def _async_invalidate_permissions(self, event: Event) -> None:
+        """Invalidate the cached permission checks."""
+        self._permissions.clear()
+
+    @callback
+    def _async_forward(self, event: EventType[EventStateChangedData]) -> None:
+        """Forward entity state changed events to the subscriptions."""
+        entity_id = event.data["entity_id"]
+        subscriptions = self._all_entities
+        if entity_subscriptions := self._by_entity_id.get(entity_id):
+            subscriptions = subscriptions | entity_subscriptions
+        # Sending a message can close the connection and remove subscriptions
+        for subscription in list(subscriptions):
+            if not self._async_can_read(subscription.user, entity_id):
+                continue
+            # A failing subscription must not stop delivery to the others
+            try:
+                subscription.async_forward(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error forwarding state change of %s to subscription %s",
+                    entity_id,
+                    subscription.msg_id,
+                )
+
+    @callback
+    def _async_can_read(self, user: User, entity_id: str) -> bool:
+        """Return if the user is allowed to read the entity."""
+        # We have to lookup the permissions again because the user might have
+        # changed since the subscription was created.
+        permissions = user.permissions
+        cached = self._permissions.get(user.id)
+        if cached is None or cached[0] is not permissions:
+            cached = self._permissions[user.id] = (
+                permissions,
+                permissions.access_all_entities(POLICY_READ),
+                {},
+            )
+        _, access_all_entities, entity_results = cached
+        if access_all_entities:
+            return True
+        if (allowed := entity_results.get(entity_id)) is None:
+            allowed = entity_results[entity_id] = permissions.check_entity(
+                entity_id, POLICY_READ
+            )
+        return allowed
+
+
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection.
+
+    With a coalesce window, the changes of an entity within the window are
+    merged and sent in a single message when the window ends.
+    """
+
+    __slots__ = (
+        "send_message",
+        "entity_ids",
+        "user",
+        "msg_id",
+        "_loop",
+        "_coalesce_window",
+        "_pending",
+        "_flush_handle",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+        entity_ids: set[str],
+        user: User,
+        msg_id: int,
+        coalesce_window: float = 0,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.entity_ids = entity_ids
+        self.user = user
+        self.msg_id = msg_id
+        self._loop = hass.loop
+        self._coalesce_window = coalesce_window
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_forward(self, event: EventType[EventStateChangedData]) -> None:
+        """Send or queue a state change."""
+        if not self._coalesce_window:
+            self.send_message(messages.cached_state_diff_message(self.msg_id, event))
+            return
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        if (pending := self._pending.get(entity_id)) is not None:
+            self._pending[entity_id] = (pending[0], new_state)
+        else:
+            self._pending[entity_id] = (event.data["old_state"], new_state)
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self._coalesce_window, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the changes queued during the coalesce window."""
+        self._flush_handle = None
+        # Entities added and removed within the window are unknown to the client
+        changes = [
+            change for change in self._pending.values() if change != (None, None)
+        ]
+        self._pending.clear()
+        if changes:
+            self.send_message(
+                messages.coalesced_state_diff_message(self.msg_id, changes)
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending queued changes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+
+
+@callback
+def _async_get_entity_subscriptions(hass: HomeAssistant) -> _EntitySubscriptions:
+    """Return the entity subscriptions shared by all connections."""
+    if (entity_subscriptions := hass.data.get(ENTITY_SUBSCRIPTIONS)) is None:
+        entity_subscriptions = _EntitySubscriptions(hass)
+        hass.data[ENTITY_SUBSCRIPTIONS] = entity_subscriptions
+    return cast(_EntitySubscriptions, entity_subscriptions)
 
 
 @callback
@@ -327,6 +531,8 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        # Merge the changes of an entity within this many milliseconds
+        vol.Optional("coalesce_window"): vol.All(int, vol.Range(min=0, max=60000)),
     }
 )
 def handle_subscribe_entities(
@@ -338,18 +544,17 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        callback(
-            partial(
-                _forward_entity_changes,
-                connection.send_message,
-                entity_ids,
-                connection.user,
-                msg["id"],
-            )
-        ),
-        run_immediately=True,
+    connection.subscriptions[msg["id"]] = _async_get_entity_subscriptions(
+        hass
+    ).async_subscribe(
+        _EntitySubscription(
+            hass,
+            connection.send_message,
+            entity_ids,
+            connection.user,
+            msg["id"],
+            msg.get("coalesce_window", 0) / 1000,
+        )
     )
     connection.send_result(msg["id"])
 
@@ -569,11 +774,10 @@ async def handle_render_template(
             )
             return
 
-        connection.send_message(
-            messages.event_message(
-                msg["id"], {"result": result, "listeners": info.listeners}
-            )
-        )
+        event_data: dict[str, Any] = {"result": result, "listeners": info.listeners}
+        if report_errors:
+            event_data["render_cache"] = info.render_cache
+        connection.send_message(messages.event_message(msg["id"], event_data))
 
     try:
         log_fn = _error_listener if report_errors else None
@@ -42,6 +42,7 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "can_compress",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -64,6 +65,7 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.can_compress = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema]] = self.hass.data[
             const.DOMAIN
@@ -79,6 +81,7 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.can_compress = const.FEATURE_COMPRESSED_MESSAGES in features
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -49,3 +49,8 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COMPRESSED_MESSAGES = "compressed_messages"
+
+# Messages of at least this size are sent as zlib compressed binary frames
+# to clients which support compressed messages.
+COMPRESSED_MESSAGE_MIN_SIZE: Final = 64 * 1024
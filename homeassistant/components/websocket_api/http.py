@@ -7,6 +7,7 @@ from collections.abc import Callable
 import datetime as dt
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 
@@ -19,6 +20,7 @@ from homeassistant.util.json import json_loads
 
 from .auth import AuthPhase, auth_required_message
 from .const import (
+    COMPRESSED_MESSAGE_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
@@ -38,6 +40,11 @@ if TYPE_CHECKING:
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
 
+def _compress_message(message: str) -> bytes:
+    """Compress a message for a binary frame."""
+    return zlib.compress(message.encode())
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -148,7 +155,12 @@ class WebSocketHandler:
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_str(message)
+                    if len(message) >= COMPRESSED_MESSAGE_MIN_SIZE and (
+                        (connection := self._connection) and connection.can_compress
+                    ):
+                        await self._send_compressed(message)
+                    else:
+                        await send_str(message)
                     continue
 
                 messages: list[str] = [message]
@@ -163,7 +175,13 @@ class WebSocketHandler:
                 coalesced_messages = f"[{joined_messages}]"
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_str(coalesced_messages)
+                if (
+                    len(coalesced_messages) >= COMPRESSED_MESSAGE_MIN_SIZE
+                    and connection.can_compress
+                ):
+                    await self._send_compressed(coalesced_messages)
+                else:
+                    await send_str(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -174,6 +192,17 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    async def _send_compressed(self, message: str) -> None:
+        """Send a large message as a zlib compressed binary frame.
+
+        The message is compressed in the executor to avoid blocking the
+        event loop with large payloads like the initial entity states.
+        """
+        compressed = await self._hass.async_add_executor_job(
+            _compress_message, message
+        )
+        await self._wsock.send_bytes(compressed)
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
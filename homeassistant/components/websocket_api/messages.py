@@ -1,6 +1,7 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, Final, cast
@@ -149,6 +150,35 @@ def _state_diff_event(event: Event) -> dict:
     return _state_diff(event_old_state, event_new_state)
 
 
+def coalesced_state_diff_message(
+    iden: int, changes: Iterable[tuple[State | None, State | None]]
+) -> str:
+    """Return an event message with the merged changes of multiple entities.
+
+    Each change is the oldest old state and the newest new state of an entity
+    since the last message was sent.
+    """
+    added: dict[str, dict[str, Any]] = {}
+    changed: dict[str, Any] = {}
+    removed: list[str] = []
+    for old_state, new_state in changes:
+        if new_state is None:
+            if old_state is not None:
+                removed.append(old_state.entity_id)
+        elif old_state is None:
+            added[new_state.entity_id] = new_state.as_compressed_state
+        else:
+            changed.update(_state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE])
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    return message_to_json({"id": iden, "type": "event", "event": event})
+
+
 def _state_diff(
     old_state: State, new_state: State
 ) -> dict[str, dict[str, dict[str, dict[str, str | list[str]]]]]:
@@ -991,13 +991,27 @@ _FilterableJobType = tuple[
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_match_all_listeners",
+        "_entity_id_listeners",
+        "_domain_listeners",
+        "_indexed_listener_targets",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # EVENT_STATE_CHANGED listeners indexed by entity_id and domain
+        # so firing a state change only visits listeners that can match
+        self._entity_id_listeners: dict[str, list[_FilterableJobType]] = {}
+        self._domain_listeners: dict[str, list[_FilterableJobType]] = {}
+        # The callbacks of the indexed listeners, with how many times each
+        # was added, so a callback listening for many entities counts once
+        self._indexed_listener_targets: dict[Callable[..., Any], int] = {}
         self._hass = hass
 
     @callback
@@ -1006,7 +1020,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {
+            key: len(listeners) for key, listeners in self._listeners.items()
+        }
+        if indexed_listener_targets := self._indexed_listener_targets:
+            listeners[EVENT_STATE_CHANGED] = listeners.get(
+                EVENT_STATE_CHANGED, 0
+            ) + len(indexed_listener_targets)
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1046,6 +1067,21 @@ class EventBus:
         listeners = self._listeners.get(event_type, [])
         match_all_listeners = self._match_all_listeners
 
+        if (
+            self._indexed_listener_targets
+            and event_type == EVENT_STATE_CHANGED
+            and event_data is not None
+            and (entity_id := event_data.get("entity_id")) is not None
+        ):
+            if entity_id_listeners := self._entity_id_listeners.get(entity_id):
+                listeners = listeners + entity_id_listeners
+            if self._domain_listeners and (
+                domain_listeners := self._domain_listeners.get(
+                    entity_id.partition(".")[0]
+                )
+            ):
+                listeners = listeners + domain_listeners
+
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -1101,6 +1137,9 @@ class EventBus:
         listener: Callable[[Event], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[Event], bool] | None = None,
         run_immediately: bool = False,
+        *,
+        entity_ids: Iterable[str] | None = None,
+        domains: Iterable[str] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1115,16 +1154,92 @@ class EventBus:
         right away instead of using call_soon. Only use this if
         the callback results in scheduling another task.
 
+        For EVENT_STATE_CHANGED, either entity_ids or domains may be
+        passed to only consider the listener for events of those
+        entities or domains. These listeners are kept in an index so
+        firing a state change does not have to visit them all. A listener
+        callable added for several entities or domains is counted once
+        by async_listeners.
+
         This method must be run in the event loop.
         """
         if event_filter is not None and not is_callback(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         if run_immediately and not is_callback(listener):
             raise HomeAssistantError(f"Event listener {listener} is not a callback")
-        return self._async_listen_filterable_job(
-            event_type,
-            (HassJob(listener, f"listen {event_type}"), event_filter, run_immediately),
+        filterable_job: _FilterableJobType = (
+            HassJob(listener, f"listen {event_type}"),
+            event_filter,
+            run_immediately,
         )
+        if entity_ids is None and domains is None:
+            return self._async_listen_filterable_job(event_type, filterable_job)
+        if event_type != EVENT_STATE_CHANGED:
+            raise HomeAssistantError(
+                f"Only {EVENT_STATE_CHANGED} listeners can filter by entity or domain"
+            )
+        if entity_ids is not None and domains is not None:
+            raise HomeAssistantError("Only one of entity_ids or domains can be passed")
+        if entity_ids is not None:
+            return self._async_listen_indexed_filterable_job(
+                self._entity_id_listeners,
+                {entity_id.lower() for entity_id in entity_ids},
+                filterable_job,
+            )
+        assert domains is not None
+        return self._async_listen_indexed_filterable_job(
+            self._domain_listeners,
+            {domain.lower() for domain in domains},
+            filterable_job,
+        )
+
+    @callback
+    def _async_listen_indexed_filterable_job(
+        self,
+        index: dict[str, list[_FilterableJobType]],
+        keys: set[str],
+        filterable_job: _FilterableJobType,
+    ) -> CALLBACK_TYPE:
+        """Listen for state changes of specific entity_ids or domains."""
+        for key in keys:
+            index.setdefault(key, []).append(filterable_job)
+        target = filterable_job[0].target
+        targets = self._indexed_listener_targets
+        targets[target] = targets.get(target, 0) + 1
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_indexed_listener(index, keys, filterable_job)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        index: dict[str, list[_FilterableJobType]],
+        keys: set[str],
+        filterable_job: _FilterableJobType,
+    ) -> None:
+        """Remove a listener for specific entity_ids or domains.
+
+        This method must be run in the event loop.
+        """
+        try:
+            for key in keys:
+                index[key].remove(filterable_job)
+                if not index[key]:
+                    del index[key]
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+        target = filterable_job[0].target
+        targets = self._indexed_listener_targets
+        if targets[target] == 1:
+            del targets[target]
+        else:
+            targets[target] -= 1
 
     @callback
     def _async_listen_filterable_job(
@@ -1263,7 +1378,14 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # A ReadOnlyDict can never be mutated so it is shared as-is
+        # instead of copied, which lets consecutive states of an entity
+        # with unchanged attributes reference the same attributes dict.
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict  # pylint: disable=unidiomatic-typecheck
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1409,12 +1531,18 @@ class States(UserDict[str, State]):
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    And counters of the changes to each domain:
+    - domain -> number of states set or removed
+    - domain -> number of entities added or removed
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._domain_versions: defaultdict[str, int] = defaultdict(int)
+        self._domain_lifecycle_versions: defaultdict[str, int] = defaultdict(int)
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -1422,13 +1550,18 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        if key not in self.data:
+            self._domain_lifecycle_versions[entry.domain] += 1
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        self._domain_versions[entry.domain] += 1
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
+        self._domain_versions[entry.domain] += 1
+        self._domain_lifecycle_versions[entry.domain] += 1
         super().__delitem__(key)
 
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
@@ -1445,11 +1578,25 @@ class States(UserDict[str, State]):
             return ()
         return self._domain_index[key].values()
 
+    def domain_version(self, key: str, lifecycle: bool = False) -> int:
+        """Get the number of changes to a domain."""
+        if lifecycle:
+            return self._domain_lifecycle_versions.get(key, 0)
+        return self._domain_versions.get(key, 0)
+
 
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_shared_attributes",
+        "_created_attributes",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -1460,6 +1607,19 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._shared_attributes = 0
+        self._created_attributes = 0
+
+    @callback
+    def async_attributes_info(self) -> dict[str, int]:
+        """Return how many written states shared or created an attributes dict.
+
+        This method must be run in the event loop.
+        """
+        return {
+            "shared": self._shared_attributes,
+            "created": self._created_attributes,
+        }
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -1487,6 +1647,17 @@ class StateMachine:
             entity_ids.extend(self._states.domain_entity_ids(domain))
         return entity_ids
 
+    @callback
+    def async_domain_version(self, domain: str, lifecycle: bool = False) -> int:
+        """Return a version of a domain which changes with its states.
+
+        With lifecycle, the version only changes when an entity of the domain
+        is added or removed.
+
+        This method must be run in the event loop.
+        """
+        return self._states.domain_version(domain.lower(), lifecycle)
+
     @callback
     def async_entity_ids_count(
         self, domain_filter: str | Iterable[str] | None = None
@@ -1656,12 +1827,74 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            if same_attr := old_state.attributes == attributes:
+                attributes = old_state.attributes
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
             return
 
+        now, context = self._async_now_and_context(context)
+        self._async_write_state(
+            entity_id, new_state, attributes, old_state, last_changed, now, context
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities at once.
+
+        states is an iterable of (entity_id, state, attributes) tuples. When
+        an entity_id appears more than once only its last write is applied,
+        so bursty reports only produce one state_changed event per entity.
+        All states written by the batch share the same last_updated time
+        and, if none is passed, the same context.
+
+        Every entity_id and state is validated before any state is written,
+        so an invalid entry leaves the state machine unchanged.
+
+        This method must be run in the event loop.
+        """
+        states_data = self._states_data
+        pending: dict[str, tuple[str, Mapping[str, Any]]] = {}
+        for entity_id, new_state, attributes in states:
+            entity_id = entity_id.lower()
+            new_state = validate_state(str(new_state))
+            if entity_id not in states_data and not valid_entity_id(entity_id):
+                raise InvalidEntityFormatError(
+                    f"Invalid entity id encountered: {entity_id}. "
+                    "Format should be <domain>.<object_id>"
+                )
+            pending[entity_id] = (new_state, attributes or {})
+
+        now: datetime.datetime | None = None
+        for entity_id, (new_state, attributes) in pending.items():
+            if (old_state := states_data.get(entity_id)) is None:
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not force_update
+                if old_state.attributes == attributes:
+                    if same_state:
+                        continue
+                    attributes = old_state.attributes
+                last_changed = old_state.last_changed if same_state else None
+
+            if now is None:
+                now, context = self._async_now_and_context(context)
+            assert context is not None
+            self._async_write_state(
+                entity_id, new_state, attributes, old_state, last_changed, now, context
+            )
+
+    @staticmethod
+    def _async_now_and_context(
+        context: Context | None,
+    ) -> tuple[datetime.datetime, Context]:
+        """Return the time to write a state at and its context."""
         if context is None:
             # It is much faster to convert a timestamp to a utc datetime object
             # than converting a utc datetime object to a timestamp since cpython
@@ -1675,11 +1908,27 @@ class StateMachine:
             # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
             # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
             timestamp = time.time()
-            now = dt_util.utc_from_timestamp(timestamp)
-            context = Context(id=ulid_at_time(timestamp))
-        else:
-            now = dt_util.utcnow()
+            return dt_util.utc_from_timestamp(timestamp), Context(
+                id=ulid_at_time(timestamp)
+            )
+        return dt_util.utcnow(), context
 
+    @callback
+    def _async_write_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any],
+        old_state: State | None,
+        last_changed: datetime.datetime | None,
+        now: datetime.datetime,
+        context: Context,
+    ) -> None:
+        """Write a new state to the state machine and fire state_changed."""
+        if old_state is not None and attributes is old_state.attributes:
+            self._shared_attributes += 1
+        else:
+            self._created_attributes += 1
         state = State(
             entity_id,
             new_state,
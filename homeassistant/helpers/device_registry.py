@@ -1,7 +1,7 @@
 """Provide a way to connect entities belonging to one device."""
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Coroutine, ValuesView
 from enum import StrEnum
 import logging
@@ -23,6 +23,12 @@ from . import storage
 from .debounce import Debouncer
 from .frame import report
 from .json import JSON_DUMP, find_paths_unserializable_data
+from .registry import (
+    RegistryIndexType,
+    add_to_index,
+    remove_from_index,
+    update_index,
+)
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -428,10 +434,68 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Maintains two more indexes:
+    - area_id -> device ids
+    - config_entry_id -> device ids
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: RegistryIndexType = defaultdict(dict)
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
+
+    def __setitem__(self, key: str, entry: DeviceEntry) -> None:
+        """Add an item."""
+        old_entry = self.data.get(key)
+        super().__setitem__(key, entry)
+        self._update_indexes(key, old_entry, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        old_entry = self[key]
+        super().__delitem__(key)
+        self._update_indexes(key, old_entry, None)
+
+    def _update_indexes(
+        self, key: str, old_entry: DeviceEntry | None, entry: DeviceEntry | None
+    ) -> None:
+        """Update the area and config entry indexes."""
+        update_index(
+            self._area_id_index,
+            key,
+            old_entry.area_id if old_entry else None,
+            entry.area_id if entry else None,
+        )
+        old_config_entries = old_entry.config_entries if old_entry else set()
+        config_entries = entry.config_entries if entry else set()
+        for config_entry_id in old_config_entries - config_entries:
+            remove_from_index(self._config_entry_id_index, config_entry_id, key)
+        for config_entry_id in config_entries - old_config_entries:
+            add_to_index(self._config_entry_id_index, config_entry_id, key)
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
 
@@ -444,6 +508,7 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
 
     @callback
@@ -772,7 +837,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -873,7 +938,7 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in self.devices.get_devices_for_config_entry_id(config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
@@ -914,9 +979,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in self.devices.get_devices_for_area_id(area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -935,7 +999,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -943,11 +1007,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
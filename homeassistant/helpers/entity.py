@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum, auto
 import functools as ft
+from itertools import repeat
 import logging
 import math
 import sys
@@ -16,8 +17,10 @@ from timeit import default_timer as timer
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Final,
     Literal,
+    NamedTuple,
     NotRequired,
     TypedDict,
     TypeVar,
@@ -44,7 +47,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     EntityCategory,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, State, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     InvalidStateError,
@@ -67,6 +70,7 @@ from .typing import UNDEFINED, EventType, StateType, UndefinedType
 
 if TYPE_CHECKING:
     from .entity_platform import EntityPlatform
+    from .entity_values import EntityValues
 
 
 _T = TypeVar("_T")
@@ -79,6 +83,25 @@ DATA_ENTITY_SOURCE = "entity_info"
 # epsilon to make the string representation readable
 FLOAT_PRECISION = abs(int(math.floor(math.log10(abs(sys.float_info.epsilon))))) - 1
 
+# The capability attributes are cached like the static state attributes
+CAPABILITY_ATTRIBUTES = "capability_attributes"
+
+# Marks a static attribute source the entity didn't set
+_NOT_SET: Final = object()
+
+# The entity member each static state attribute is calculated from
+_STATIC_ATTRIBUTE_MEMBERS = {
+    CAPABILITY_ATTRIBUTES: "capability_attributes",
+    ATTR_UNIT_OF_MEASUREMENT: "unit_of_measurement",
+    ATTR_ASSUMED_STATE: "assumed_state",
+    ATTR_ATTRIBUTION: "attribution",
+    ATTR_DEVICE_CLASS: "device_class",
+    ATTR_ENTITY_PICTURE: "entity_picture",
+    ATTR_ICON: "icon",
+    ATTR_FRIENDLY_NAME: "_friendly_name_internal",
+    ATTR_SUPPORTED_FEATURES: "supported_features",
+}
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -193,6 +216,48 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
+@ft.cache
+def _static_attribute_keys(
+    entity_type: type[Entity],
+) -> tuple[frozenset[str], frozenset[str], tuple[str, ...]]:
+    """Return the static state attributes an entity type can and can't cache.
+
+    Also returns the static attribute sources of the entity type, in the order
+    they are compared with the cached static state attributes.
+    """
+    cacheable = frozenset(
+        key
+        for key, member in _STATIC_ATTRIBUTE_MEMBERS.items()
+        if _is_static_member(entity_type, member)
+    )
+    return (
+        cacheable,
+        frozenset(_STATIC_ATTRIBUTE_MEMBERS) - cacheable,
+        tuple(sorted(entity_type._static_attribute_sources)),
+    )
+
+
+def _is_static_member(entity_type: type[Entity], member: str) -> bool:
+    """Return if a member of an entity type only depends on static sources.
+
+    A member is static if the class which defines it declares it static and
+    each member it depends on is static as well.
+    """
+    for cls in entity_type.__mro__:
+        if member in cls.__dict__:
+            break
+    else:
+        return False
+    static_members: dict[str, tuple[str, ...]] = cls.__dict__.get(
+        "_static_attribute_members", {}
+    )
+    if (dependencies := static_members.get(member)) is None:
+        return False
+    return all(
+        _is_static_member(entity_type, dependency) for dependency in dependencies
+    )
+
+
 class EntityInfo(TypedDict):
     """Entity info."""
 
@@ -201,6 +266,15 @@ class EntityInfo(TypedDict):
     config_entry: NotRequired[str]
 
 
+class _StateWrite(NamedTuple):
+    """A state written by an entity and what it was generated from."""
+
+    state: str
+    attributes: dict[str, Any]
+    customize: EntityValues | None
+    written: State | None
+
+
 class EntityPlatformState(Enum):
     """The platform state of an entity."""
 
@@ -297,6 +371,68 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _platform_state = EntityPlatformState.NOT_ADDED
 
+    # Setting any of these on the entity invalidates the cached static state
+    # attributes, the values the entity set are compared before each write
+    _static_attribute_sources: ClassVar[frozenset[str]] = frozenset(
+        {
+            "_attr_assumed_state",
+            "_attr_attribution",
+            "_attr_capability_attributes",
+            "_attr_device_class",
+            "_attr_entity_picture",
+            "_attr_has_entity_name",
+            "_attr_icon",
+            "_attr_name",
+            "_attr_supported_features",
+            "_attr_translation_key",
+            "_attr_unit_of_measurement",
+            "device_entry",
+            "entity_description",
+            "platform",
+            "registry_entry",
+        }
+    )
+
+    # Members defined by this class which are only calculated from the static
+    # sources and the other members they map to. State attributes calculated
+    # from static members are cached until one of the sources is set.
+    _static_attribute_members: ClassVar[dict[str, tuple[str, ...]]] = {
+        "_default_to_device_class_name": (),
+        "_device_class_name": ("device_class", "has_entity_name"),
+        "_friendly_name_internal": ("has_entity_name", "name", "use_device_name"),
+        "_name_internal": (
+            "_default_to_device_class_name",
+            "_name_translation_key",
+            "has_entity_name",
+        ),
+        "_name_translation_key": ("translation_key",),
+        "assumed_state": (),
+        "attribution": (),
+        "capability_attributes": (),
+        "device_class": (),
+        "entity_picture": (),
+        "has_entity_name": (),
+        "icon": (),
+        "name": ("_device_class_name", "_name_internal"),
+        "supported_features": (),
+        "translation_key": (),
+        "unit_of_measurement": (),
+        "use_device_name": (
+            "_default_to_device_class_name",
+            "_name_translation_key",
+            "name",
+        ),
+    }
+
+    # The last state written to the state machine
+    _last_state_write: _StateWrite | None = None
+
+    # The static attribute sources set by the entity, and the capability
+    # attributes and static state attributes calculated from them
+    _cached_static_attributes: tuple[
+        list[Any], Mapping[str, Any] | None, dict[str, Any]
+    ] | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -703,6 +839,8 @@ class Entity(ABC):
                 await self.async_device_update()
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Update for %s fails", self.entity_id)
+                if self.platform:
+                    self.platform.failed_updates += 1
                 return
         elif not self._async_update_ha_state_reported:
             report_issue = self._suggest_report_issue()
@@ -782,10 +920,22 @@ class Entity(ABC):
     @callback
     def _async_generate_attributes(self) -> tuple[str, dict[str, Any]]:
         """Calculate state string and attribute mapping."""
-        entry = self.registry_entry
-
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        cacheable, uncacheable, source_names = _static_attribute_keys(type(self))
+        # Sources are compared by identity first, which is cheap for unchanged
+        # values; sources only set on the class can't change for an instance
+        sources = list(map(self.__dict__.get, source_names, repeat(_NOT_SET)))
+        if (cached := self._cached_static_attributes) is None or cached[0] != sources:
+            cached = self._cached_static_attributes = (
+                sources,
+                self.capability_attributes
+                if CAPABILITY_ATTRIBUTES in cacheable
+                else None,
+                self._async_calculate_static_attributes(cacheable),
+            )
+        _, capability_attr, static_attr = cached
+        if CAPABILITY_ATTRIBUTES in uncacheable:
+            capability_attr = self.capability_attributes
+        attr = dict(capability_attr) if capability_attr else {}
 
         available = self.available  # only call self.available once per update cycle
         state = self._stringify_state(available)
@@ -793,35 +943,68 @@ class Entity(ABC):
             attr.update(self.state_attributes or {})
             attr.update(self.extra_state_attributes or {})
 
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
+        attr.update(static_attr)
+        if uncacheable:
+            attr.update(self._async_calculate_static_attributes(uncacheable))
+
+        return (state, attr)
+
+    @callback
+    def _async_calculate_static_attributes(
+        self, keys: frozenset[str]
+    ) -> dict[str, Any]:
+        """Calculate the state attributes in keys which don't depend on the state."""
+        attr: dict[str, Any] = {}
+        if not keys:
+            return attr
+
+        entry = self.registry_entry
+
+        if (
+            ATTR_UNIT_OF_MEASUREMENT in keys
+            and (unit_of_measurement := self.unit_of_measurement) is not None
+        ):
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
-        if assumed_state := self.assumed_state:
+        if ATTR_ASSUMED_STATE in keys and (assumed_state := self.assumed_state):
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        if (attribution := self.attribution) is not None:
+        if ATTR_ATTRIBUTION in keys and (attribution := self.attribution) is not None:
             attr[ATTR_ATTRIBUTION] = attribution
 
         if (
-            device_class := (entry and entry.device_class) or self.device_class
-        ) is not None:
+            ATTR_DEVICE_CLASS in keys
+            and (device_class := (entry and entry.device_class) or self.device_class)
+            is not None
+        ):
             attr[ATTR_DEVICE_CLASS] = str(device_class)
 
-        if (entity_picture := self.entity_picture) is not None:
+        if (
+            ATTR_ENTITY_PICTURE in keys
+            and (entity_picture := self.entity_picture) is not None
+        ):
             attr[ATTR_ENTITY_PICTURE] = entity_picture
 
-        if (icon := (entry and entry.icon) or self.icon) is not None:
+        if (
+            ATTR_ICON in keys
+            and (icon := (entry and entry.icon) or self.icon) is not None
+        ):
             attr[ATTR_ICON] = icon
 
         if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
+            ATTR_FRIENDLY_NAME in keys
+            and (name := (entry and entry.name) or self._friendly_name_internal())
+            is not None
+        ):
             attr[ATTR_FRIENDLY_NAME] = name
 
-        if (supported_features := self.supported_features) is not None:
+        if (
+            ATTR_SUPPORTED_FEATURES in keys
+            and (supported_features := self.supported_features) is not None
+        ):
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        return (state, attr)
+        return attr
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -861,9 +1044,25 @@ class Entity(ABC):
                 report_issue,
             )
 
+        customize = hass.data.get(DATA_CUSTOMIZE)
+        force_update = self.force_update
+        if (
+            (last_write := self._last_state_write) is not None
+            and not force_update
+            and last_write.state == state
+            and last_write.customize is customize
+            and last_write.attributes == attr
+            and hass.states.get(entity_id) is last_write.written
+        ):
+            # The state machine still holds the state we wrote last time
+            if self.platform:
+                self.platform.skipped_state_writes += 1
+            return
+
+        generated_attr = attr
         # Overwrite properties that have been set in the config file.
-        if customize := hass.data.get(DATA_CUSTOMIZE):
-            attr.update(customize.get(entity_id))
+        if customize:
+            attr = {**attr, **customize.get(entity_id)}
 
         if (
             self._context_set is not None
@@ -874,14 +1073,18 @@ class Entity(ABC):
             self._context_set = None
 
         try:
-            hass.states.async_set(
-                entity_id, state, attr, self.force_update, self._context
-            )
+            hass.states.async_set(entity_id, state, attr, force_update, self._context)
         except InvalidStateError:
             _LOGGER.exception("Failed to set state, fall back to %s", STATE_UNKNOWN)
             hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
+                entity_id, STATE_UNKNOWN, {}, force_update, self._context
             )
+            self._last_state_write = None
+            return
+
+        self._last_state_write = _StateWrite(
+            state, generated_attr, customize, hass.states.get(entity_id)
+        )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -1250,6 +1453,7 @@ class Entity(ABC):
         return report_issue
 
 
+
 @dataclass(slots=True)
 class ToggleEntityDescription(EntityDescription):
     """A class that describes toggle entities."""
@@ -2,10 +2,15 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
+from collections import deque
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from contextlib import suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
+from math import inf
+import random
 from typing import TYPE_CHECKING, Any, Protocol
 
 import voluptuous as vol
@@ -20,6 +25,7 @@ from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
     CoreState,
+    HassJob,
     HomeAssistant,
     ServiceCall,
     callback,
@@ -39,7 +45,7 @@ from . import (
     translation,
 )
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_at, async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
@@ -56,9 +62,77 @@ PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Platforms polling at least this many entities spread their updates
+POLL_SPREAD_MIN_ENTITIES = 20
+# Fraction of the scan interval the updates of polling entities are spread over
+POLL_SPREAD_FRACTION = 0.5
+# Upper bounds in seconds of the buckets of the poll duration histogram
+POLL_DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, inf)
+# Back off when the mean poll duration of a round exceeds the fastest rounds
+# seen by this factor, and is at least POLL_BACKOFF_MIN_DURATION seconds
+POLL_BACKOFF_FACTOR = 3
+POLL_BACKOFF_MIN_DURATION = 0.1
+# How fast the reference poll duration follows slower rounds
+POLL_REFERENCE_DRIFT = 0.1
+
 _LOGGER = getLogger(__name__)
 
 
+class _PollLimiter:
+    """Limit the number of concurrent polls to a limit which can be changed.
+
+    Unlike replacing a semaphore, lowering the limit also holds back the polls
+    waiting since before the change until enough running polls finished.
+    """
+
+    __slots__ = ("_limit", "_active", "_waiters")
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the poll limiter."""
+        self._limit = limit
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @callback
+    def async_set_limit(self, limit: int) -> None:
+        """Change the limit, letting waiting polls run if it was raised."""
+        self._limit = limit
+        self._async_wake_waiters()
+
+    @callback
+    def _async_wake_waiters(self) -> None:
+        """Let waiting polls run while below the limit."""
+        while self._waiters and self._active < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+
+    async def __aenter__(self) -> None:
+        """Wait until a poll may run."""
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                with suppress(ValueError):
+                    self._waiters.remove(waiter)
+            else:
+                # The poll was let run just before it was cancelled
+                self._active -= 1
+            self._async_wake_waiters()
+            raise
+
+    async def __aexit__(self, *args: object) -> None:
+        """Let the next waiting poll run."""
+        self._active -= 1
+        self._async_wake_waiters()
+
+
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
 
@@ -137,6 +211,28 @@ class EntityPlatform:
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        # Number of state writes skipped because the state was unchanged
+        self.skipped_state_writes = 0
+        # Number of entity updates which raised
+        self.failed_updates = 0
+
+        # Limit of concurrent polls, adapted after every round of polls
+        self.poll_concurrency: int | None = None
+        self._poll_limiter: _PollLimiter | None = None
+        self._max_poll_concurrency: int | None = None
+        # Number of polls by upper bound in POLL_DURATION_BUCKETS
+        self.poll_durations = [0] * len(POLL_DURATION_BUCKETS)
+        self._poll_round_polls = 0
+        self._poll_round_duration = 0.0
+        self._poll_round_failed_updates = 0
+        self._poll_last_round_failures = 0
+        self._poll_reference_duration: float | None = None
+        # Updates of polling entities scheduled in jittered slots
+        self._poll_round_handles: dict[Entity, asyncio.TimerHandle] | None = None
+        self._poll_job = HassJob(
+            self._async_poll, f"EntityPlatform poll {self.domain}.{self.platform_name}"
+        )
+        self._polling_entities: set[Entity] = set()
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -188,6 +284,7 @@ class EntityPlatform:
         if parallel_updates is not None:
             self.parallel_updates = asyncio.Semaphore(parallel_updates)
             self._update_in_sequence = parallel_updates == 1
+            self._max_poll_concurrency = parallel_updates
 
         return self.parallel_updates
 
@@ -527,12 +624,7 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-            name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
-        )
+        self._async_schedule_poll()
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
         """Check if an entity_id already exists.
@@ -774,6 +866,7 @@ class EntityPlatform:
         if self._async_unsub_polling is not None:
             self._async_unsub_polling()
             self._async_unsub_polling = None
+        self._async_cancel_poll_round()
 
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
@@ -791,8 +884,7 @@ class EntityPlatform:
         if self._async_unsub_polling is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+            self.async_unsub_polling()
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -843,6 +935,35 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
+    @callback
+    def _async_schedule_poll(self) -> None:
+        """Schedule the next poll and the round of polls preceding it."""
+        due = self.hass.loop.time() + self.scan_interval.total_seconds()
+        self._async_unsub_polling = async_call_at(self.hass, self._poll_job, due)
+        self._async_schedule_poll_round(due)
+
+    @callback
+    def _async_poll(self, now: datetime) -> None:
+        """Update the polling entities which are due and schedule the next poll.
+
+        Platforms with many polling entities update them in jittered slots
+        spread over the scan interval instead of all at once.
+        """
+        if (handles := self._poll_round_handles) is not None:
+            # Entities whose slot did not come yet are updated now,
+            # they must not be updated again in the next round
+            self._poll_round_handles = None
+            for entity, handle in handles.items():
+                handle.cancel()
+                self._async_poll_scheduled_entity(entity)
+            self._async_adjust_poll_concurrency()
+        else:
+            self.hass.async_create_task(
+                self._update_entity_states(now),
+                f"EntityPlatform poll {self.domain}.{self.platform_name}",
+            )
+        self._async_schedule_poll()
+
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
@@ -871,16 +992,138 @@ class EntityPlatform:
                     # entity being updated, we need to skip updating the
                     # entity.
                     if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
-
-            if tasks := [
-                entity.async_update_ha_state(True)
+                        await self._async_poll_entity(entity)
+            elif tasks := [
+                self._async_poll_entity(entity)
                 for entity in self.entities.values()
                 if entity.should_poll
             ]:
                 await asyncio.gather(*tasks)
 
+            self._async_adjust_poll_concurrency()
+
+    @callback
+    def _async_schedule_poll_round(self, due: float) -> None:
+        """Schedule the round of polls preceding the poll due at due in slots.
+
+        Only platforms with at least POLL_SPREAD_MIN_ENTITIES polling entities
+        spread their polls. The jittered slots precede the next poll, which
+        updates the entities whose slot did not come yet.
+        """
+        entities = [entity for entity in self.entities.values() if entity.should_poll]
+        if len(entities) < POLL_SPREAD_MIN_ENTITIES:
+            return
+
+        loop = self.hass.loop
+        slot = self.scan_interval.total_seconds() * POLL_SPREAD_FRACTION / len(entities)
+        self._poll_round_handles = {
+            entity: loop.call_at(
+                due - slot * (index + random.random()),
+                self._async_poll_scheduled_entity,
+                entity,
+            )
+            for index, entity in enumerate(entities)
+        }
+
+    @callback
+    def _async_cancel_poll_round(self) -> None:
+        """Cancel the scheduled round of polls."""
+        if self._poll_round_handles is None:
+            return
+        for handle in self._poll_round_handles.values():
+            handle.cancel()
+        self._poll_round_handles = None
+
+    @callback
+    def _async_poll_scheduled_entity(self, entity: Entity) -> None:
+        """Update a polling entity in its slot."""
+        if (handles := self._poll_round_handles) is not None:
+            handles.pop(entity, None)
+        if self.entities.get(entity.entity_id) is not entity or not entity.should_poll:
+            # The entity was removed or stopped polling since the round was scheduled
+            return
+        if entity in self._polling_entities:
+            self.logger.warning(
+                "Updating %s %s took longer than the scheduled update interval %s",
+                self.platform_name,
+                entity.entity_id,
+                self.scan_interval,
+            )
+            return
+        self.hass.async_create_task(
+            self._async_poll_entity(entity), f"EntityPlatform poll {entity.entity_id}"
+        )
+
+    async def _async_poll_entity(self, entity: Entity) -> None:
+        """Update a polling entity and record how long the update took."""
+        self._polling_entities.add(entity)
+        try:
+            if (limiter := self._poll_limiter) is None:
+                await self._async_timed_poll(entity)
+            else:
+                async with limiter:
+                    await self._async_timed_poll(entity)
+        finally:
+            self._polling_entities.discard(entity)
+
+    async def _async_timed_poll(self, entity: Entity) -> None:
+        """Update a polling entity, timing the update."""
+        loop = self.hass.loop
+        start = loop.time()
+        await entity.async_update_ha_state(True)
+        duration = loop.time() - start
+        self.poll_durations[bisect_left(POLL_DURATION_BUCKETS, duration)] += 1
+        self._poll_round_polls += 1
+        self._poll_round_duration += duration
+
+    @callback
+    def _async_adjust_poll_concurrency(self) -> None:
+        """Adapt the limit of concurrent polls to the last round of polls.
+
+        The limit is halved when more updates failed than in the round before
+        or when the polls got much slower than the fastest rounds seen,
+        otherwise it is raised by one up to PARALLEL_UPDATES.
+        """
+        polls = self._poll_round_polls
+        duration = self._poll_round_duration
+        failures = self.failed_updates - self._poll_round_failed_updates
+        last_failures = self._poll_last_round_failures
+        self._poll_round_polls = 0
+        self._poll_round_duration = 0.0
+        self._poll_round_failed_updates = self.failed_updates
+        self._poll_last_round_failures = failures
+        if not polls or self._update_in_sequence:
+            return
+
+        mean_duration = duration / polls
+        reference = self._poll_reference_duration
+        if reference is None or mean_duration < reference:
+            self._poll_reference_duration = mean_duration
+        else:
+            self._poll_reference_duration = (
+                reference + (mean_duration - reference) * POLL_REFERENCE_DRIFT
+            )
+
+        max_concurrency = self._max_poll_concurrency or max(
+            1, sum(entity.should_poll for entity in self.entities.values())
+        )
+        concurrency = self.poll_concurrency or max_concurrency
+        if failures > last_failures or (
+            reference is not None
+            and mean_duration >= POLL_BACKOFF_MIN_DURATION
+            and mean_duration > reference * POLL_BACKOFF_FACTOR
+        ):
+            concurrency = max(1, concurrency // 2)
+        else:
+            concurrency = min(concurrency + 1, max_concurrency)
+
+        if concurrency != self.poll_concurrency:
+            self.poll_concurrency = concurrency
+            if self._poll_limiter is None:
+                self._poll_limiter = _PollLimiter(concurrency)
+            else:
+                self._poll_limiter.async_set_limit(concurrency)
+
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
     "current_platform", default=None
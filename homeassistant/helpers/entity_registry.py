@@ -9,7 +9,7 @@ timer.
 """
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Callable, Iterable, Mapping, ValuesView
 from datetime import datetime, timedelta
 from enum import StrEnum
@@ -52,6 +52,7 @@ from homeassistant.util.read_only_dict import ReadOnlyDict
 from . import device_registry as dr, storage
 from .device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from .json import JSON_DUMP, find_paths_unserializable_data
+from .registry import RegistryIndexType, update_index
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -418,9 +419,12 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains five additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - device_id -> entity_ids
+    - area_id -> entity_ids
+    - config_entry_id -> entity_ids
     """
 
     def __init__(self) -> None:
@@ -428,6 +432,9 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: RegistryIndexType = defaultdict(dict)
+        self._area_id_index: RegistryIndexType = defaultdict(dict)
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -436,21 +443,71 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
         data = self.data
-        if key in data:
-            old_entry = data[key]
+        old_entry = data.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         data[key] = entry
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._update_indexes(key, old_entry, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        self._update_indexes(key, entry, None)
         super().__delitem__(key)
 
+    def _update_indexes(
+        self, key: str, old_entry: RegistryEntry | None, entry: RegistryEntry | None
+    ) -> None:
+        """Update the device, area and config entry indexes."""
+        update_index(
+            self._device_id_index,
+            key,
+            old_entry.device_id if old_entry else None,
+            entry.device_id if entry else None,
+        )
+        update_index(
+            self._area_id_index,
+            key,
+            old_entry.area_id if old_entry else None,
+            entry.area_id if entry else None,
+        )
+        update_index(
+            self._config_entry_id_index,
+            key,
+            old_entry.config_entry_id if old_entry else None,
+            entry.config_entry_id if entry else None,
+        )
+
+    def get_entries_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device."""
+        data = self.data
+        return [
+            entry
+            for key in self._device_id_index.get(device_id, ())
+            if not (entry := data[key]).disabled_by or include_disabled_entities
+        ]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
         return self._index.get(key)
@@ -476,6 +533,7 @@ class EntityRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -1137,12 +1195,8 @@ class EntityRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry_id == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry_id):
+            self.async_remove(entry.entity_id)
         for key, deleted_entity in list(self.deleted_entities.items()):
             if config_entry_id != deleted_entity.config_entry_id:
                 continue
@@ -1171,9 +1225,8 @@ class EntityRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self.async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self.async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -1194,12 +1247,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    return registry.entities.get_entries_for_device_id(
+        device_id, include_disabled_entities
+    )
 
 
 @callback
@@ -1207,7 +1257,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -1215,11 +1265,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -1326,10 +1372,7 @@ async def async_migrate_entries(
     """Migrator of unique IDs."""
     ent_reg = async_get(hass)
 
-    for entry in ent_reg.entities.values():
-        if entry.config_entry_id != config_entry_id:
-            continue
-
+    for entry in ent_reg.entities.get_entries_for_config_entry_id(config_entry_id):
         updates = entry_callback(entry)
 
         if updates is not None:
@@ -5,7 +5,7 @@ import asyncio
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import functools as ft
 import logging
 from random import randint
@@ -49,6 +49,7 @@ from .typing import EventType, TemplateVarsType
 
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
 TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
+TRACK_STATE_CHANGE_DISPATCHER = "track_state_change_dispatcher"
 
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
@@ -75,6 +76,18 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Template variables of these types can't change between renders, except the
+# template states whose reads are tracked like any other state
+_IMMUTABLE_VARIABLE_TYPES = (
+    str,
+    int,
+    float,
+    type(None),
+    date,
+    timedelta,
+    State,
+)
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _P = ParamSpec("_P")
 
@@ -299,35 +312,74 @@ def _async_dispatch_entity_id_event(
             )
 
 
-@callback
-def _async_state_change_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["entity_id"] in callbacks
-
-
 @bind_hass
 def _async_track_state_change_event(
     hass: HomeAssistant,
     entity_ids: str | Iterable[str],
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
-    """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        hass,
-        entity_ids,
-        TRACK_STATE_CHANGE_CALLBACKS,
-        TRACK_STATE_CHANGE_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_entity_id_event,
-        _async_state_change_filter,
-        action,
+    """async_track_state_change_event without lowercasing.
+
+    Every tracked entity_id has a single listener in the event bus index
+    of state_changed listeners, so firing a state change only dispatches
+    to the jobs tracking that entity. The listeners share one callable, so
+    the event bus still counts them as one state_changed listener.
+    """
+    if not entity_ids:
+        return _remove_empty_listener
+
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+
+    hass_data = hass.data
+
+    callbacks: dict[
+        str, list[HassJob[[EventType[EventStateChangedData]], Any]]
+    ] = hass_data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
+    listeners: dict[str, CALLBACK_TYPE] = hass_data.setdefault(
+        TRACK_STATE_CHANGE_LISTENER, {}
+    )
+
+    if (dispatcher := hass_data.get(TRACK_STATE_CHANGE_DISPATCHER)) is None:
+        # All entities share the dispatcher so the event bus counts
+        # the trackers as a single state_changed listener
+        dispatcher = hass_data[TRACK_STATE_CHANGE_DISPATCHER] = callback(
+            ft.partial(_async_dispatch_entity_id_event, hass, callbacks)
+        )
+
+    job = HassJob(action, f"track {EVENT_STATE_CHANGED} event {entity_ids}")
+
+    for entity_id in entity_ids:
+        callback_list = callbacks.get(entity_id)
+        if callback_list:
+            callback_list.append(job)
+            continue
+        callbacks[entity_id] = [job]
+        listeners[entity_id] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, dispatcher, entity_ids=(entity_id,)
+        )
+
+    return ft.partial(
+        _remove_state_change_listener, hass, entity_ids, job, callbacks, listeners
     )
 
 
+@callback
+def _remove_state_change_listener(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str],
+    job: HassJob[[EventType[EventStateChangedData]], Any],
+    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    listeners: dict[str, CALLBACK_TYPE],
+) -> None:
+    """Remove a state change listener."""
+    for entity_id in entity_ids:
+        callbacks[entity_id].remove(job)
+        if len(callbacks[entity_id]) == 0:
+            del callbacks[entity_id]
+            listeners.pop(entity_id)()
+
+
 @callback
 def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
@@ -908,6 +960,10 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        # Variables and states the last render of each template depended on
+        self._render_inputs: dict[Template, tuple[Any, ...]] = {}
+        self._render_cache_hits = 0
+        self._render_cache_misses = 0
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -927,9 +983,8 @@ class TrackTemplateResultInfo:
         # Render the super template first
         if super_template is not None:
             template = super_template.template
-            variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_to_info(
+                super_template, strict=strict, log_fn=log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -948,9 +1003,8 @@ class TrackTemplateResultInfo:
             if block_render or track_template_ == super_template:
                 continue
             template = track_template_.template
-            variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_to_info(
+                track_template_, strict=strict, log_fn=log_fn
             )
 
             if info.exception:
@@ -986,6 +1040,42 @@ class TrackTemplateResultInfo:
             "time": bool(self._time_listeners),
         }
 
+    @property
+    def render_cache(self) -> dict[str, int]:
+        """Re-renders which reused the last result or rendered the template."""
+        return {
+            "hits": self._render_cache_hits,
+            "misses": self._render_cache_misses,
+        }
+
+    def _render_to_info(
+        self,
+        track_template_: TrackTemplate,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+    ) -> RenderInfo:
+        """Render the template unless the inputs of the last render are unchanged."""
+        template = track_template_.template
+        variables = track_template_.variables
+        if template in self._info:
+            info = self._info[template]
+            if (inputs := self._render_inputs.get(template)) is not None and inputs == (
+                _freeze_variables(variables),
+                info.inputs_snapshot(),
+            ):
+                self._render_cache_hits += 1
+                return info
+            self._render_cache_misses += 1
+
+        info = template.async_render_to_info(variables, strict=strict, log_fn=log_fn)
+        if (snapshot := info.inputs_snapshot()) is None or (
+            frozen_variables := _freeze_variables(variables)
+        ) is _NOT_FREEZABLE:
+            self._render_inputs.pop(template, None)
+        else:
+            self._render_inputs[template] = (frozen_variables, snapshot)
+        return info
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1074,9 +1164,7 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        self._info[template] = info = self._render_to_info(track_template_)
 
         try:
             result: str | TemplateError = info.result()
@@ -1770,6 +1858,37 @@ def _render_infos_to_track_states(render_infos: Iterable[RenderInfo]) -> TrackSt
     return TrackStates(False, *_entities_domains_from_render_infos(render_infos))
 
 
+_NOT_FREEZABLE = object()
+
+
+def _freeze_variables(value: Any) -> Any:
+    """Return a snapshot of template variables which compares by value.
+
+    The caller may change nested variables between renders, so containers
+    are copied all the way down. Returns _NOT_FREEZABLE if any value may
+    change without the snapshot changing.
+    """
+    if isinstance(value, _IMMUTABLE_VARIABLE_TYPES):
+        return value
+    if isinstance(value, Mapping):
+        items = []
+        for key, item in value.items():
+            if (frozen := _freeze_variables(item)) is _NOT_FREEZABLE:
+                return _NOT_FREEZABLE
+            items.append((key, frozen))
+        return (type(value), tuple(items))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        frozen_items = []
+        for item in value:
+            if (frozen := _freeze_variables(item)) is _NOT_FREEZABLE:
+                return _NOT_FREEZABLE
+            frozen_items.append(frozen)
+        if isinstance(value, (set, frozenset)):
+            return (type(value), frozenset(frozen_items))
+        return (type(value), tuple(frozen_items))
+    return _NOT_FREEZABLE
+
+
 @callback
 def _event_triggers_rerender(
     event: EventType[EventStateChangedData], info: RenderInfo
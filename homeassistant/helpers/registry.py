@@ -0,0 +1,38 @@
+"""Provide helpers shared by the registries."""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Literal
+
+# Maps an indexed value to the keys of the registry entries with that value.
+# The keys are stored in a dict to keep them in insertion order.
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+def add_to_index(index: RegistryIndexType, value: str | None, key: str) -> None:
+    """Add the key of a registry entry to an index."""
+    if value is not None:
+        index[value][key] = True
+
+
+def remove_from_index(index: RegistryIndexType, value: str | None, key: str) -> None:
+    """Remove the key of a registry entry from an index."""
+    if value is None:
+        return
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
+
+
+def update_index(
+    index: RegistryIndexType, key: str, old_value: str | None, value: str | None
+) -> None:
+    """Update an index when a registry entry is added, changed or removed.
+
+    The key keeps its position when the indexed value did not change.
+    """
+    if old_value == value:
+        return
+    remove_from_index(index, old_value, key)
+    add_to_index(index, value, key)
@@ -5,11 +5,13 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from difflib import SequenceMatcher
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, NamedTuple, TypeVar
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
@@ -36,6 +38,14 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+JOURNAL_SUFFIX = ".journal"
+
+# Journal record operations
+JOURNAL_OP_ENVELOPE = "e"
+JOURNAL_OP_SET = "s"
+JOURNAL_OP_DELETE = "d"
+JOURNAL_OP_SPLICE = "l"
+
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
 
@@ -94,8 +104,14 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store appends the changes of each write to a journal next
+        to the snapshot and only rewrites the snapshot once the journal grows
+        larger than it.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,12 +125,25 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journal = journal
+        self._journal_seq = 0
+        # False until the sequence number of the journal on disk is known
+        self._journal_seq_known = False
+        self._journal_size = 0
+        self._snapshot_size = 0
+        # The serialized segments of the data on disk, None if unknown
+        self._journal_segments: _JournalSegments | None = None
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -157,10 +186,9 @@ class Store(Generic[_T]):
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
         else:
+            load = self._load_journaled_data if self._journal else json_util.load_json
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(load, self.path)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -360,6 +388,10 @@ class Store(Generic[_T]):
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if self._journal:
+            self._write_journaled_data(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -369,6 +401,156 @@ class Store(Generic[_T]):
             atomic_writes=self._atomic_writes,
         )
 
+    def _dump_journal_value(self, value: Any) -> bytes:
+        """Serialize a value for the journal."""
+        if self._encoder and self._encoder is not json_helper.JSONEncoder:
+            return json.dumps(value, cls=self._encoder).encode("utf-8")
+        return json_helper.json_bytes(value)
+
+    def _get_journal_segments(self, data: dict[str, Any]) -> _JournalSegments:
+        """Serialize the data into segments which are compared between writes.
+
+        The envelope is a single segment, as is every value of the stored
+        data. Lists, including stored data that is a list, are serialized
+        item by item so a change to a single item is a small splice.
+        """
+        dump = self._dump_journal_value
+        stored = data["data"]
+        envelope = dump({key: value for key, value in data.items() if key != "data"})
+        if isinstance(stored, (list, tuple)):
+            return _JournalSegments(envelope, [dump(item) for item in stored])
+        return _JournalSegments(
+            envelope,
+            {
+                key: [dump(item) for item in value]
+                if isinstance(value, (list, tuple))
+                else dump(value)
+                for key, value in stored.items()
+            },
+        )
+
+    def _load_journaled_data(self, path: str) -> Any:
+        """Load the snapshot and replay the journal records written after it."""
+        self._journal_segments = None
+        data = json_util.load_json(path)
+        if not data:
+            # Without a snapshot there is nothing to replay the journal on
+            return data
+
+        seq: int = data.pop("journal_seq", 0)
+        snapshot_seq = seq
+        self._snapshot_size = os.path.getsize(path)
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                journal = fdesc.read()
+        except FileNotFoundError:
+            journal = b""
+
+        *records, tail = journal.split(b"\n")
+        complete = not tail
+        for record in records:
+            try:
+                record_data = json_util.json_loads(record)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                complete = False
+                break
+            if record_data["seq"] <= snapshot_seq:
+                # Left over from a compaction that did not remove the journal
+                complete = False
+                continue
+            if record_data["seq"] != seq + 1:
+                complete = False
+                break
+            try:
+                _apply_journal_ops(data, record_data["ops"])
+            except (IndexError, KeyError, TypeError, ValueError):
+                complete = False
+                break
+            seq = record_data["seq"]
+
+        if not complete:
+            _LOGGER.warning(
+                "Ignoring incomplete records in the journal of %s at %s; "
+                "This may indicate an unclean shutdown",
+                self.key,
+                self.journal_path,
+            )
+
+        self._journal_seq = seq
+        self._journal_seq_known = True
+        self._journal_size = len(journal)
+        if complete:
+            # An incomplete journal can't be appended to and must be compacted
+            with suppress(TypeError):
+                self._journal_segments = self._get_journal_segments(data)
+        return data
+
+    def _write_journaled_data(self, path: str, data: dict) -> None:
+        """Append the changes to the journal or compact it into a snapshot."""
+        old_segments = self._journal_segments
+        self._journal_segments = None
+        try:
+            segments = self._get_journal_segments(data)
+        except TypeError:
+            # Let the snapshot write report the unserializable data
+            segments = None
+
+        ops = None
+        if old_segments is not None and segments is not None:
+            ops = _diff_journal_segments(old_segments, segments)
+
+        if ops is not None:
+            if not ops:
+                self._journal_segments = segments
+                return
+            record = b'{"seq":%d,"ops":[%b]}\n' % (
+                self._journal_seq + 1,
+                b",".join(ops),
+            )
+            if self._journal_size + len(record) <= self._snapshot_size:
+                _LOGGER.debug(
+                    "Appending journal record for %s to %s",
+                    self.key,
+                    self.journal_path,
+                )
+                try:
+                    fd = os.open(
+                        self.journal_path,
+                        os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                        0o600 if self._private else 0o644,
+                    )
+                    with open(fd, "wb") as fdesc:
+                        fdesc.write(record)
+                        fdesc.flush()
+                        os.fsync(fdesc.fileno())
+                except OSError as error:
+                    _LOGGER.exception("Saving file failed: %s", self.journal_path)
+                    raise WriteError(error) from error
+                self._journal_seq += 1
+                self._journal_size += len(record)
+                self._journal_segments = segments
+                return
+
+        _LOGGER.debug("Compacting journal for %s into %s", self.key, path)
+        if not self._journal_seq_known:
+            # Written before loaded, records on disk may be numbered after ours
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+        self._journal_seq += 1
+        json_helper.save_json(
+            path,
+            {**data, "journal_seq": self._journal_seq},
+            self._private,
+            encoder=self._encoder,
+            atomic_writes=True,
+        )
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._journal_seq_known = True
+        self._journal_size = 0
+        self._snapshot_size = os.path.getsize(path)
+        self._journal_segments = segments
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -380,3 +562,114 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            self._journal_segments = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+class _JournalSegments(NamedTuple):
+    """Serialized segments of stored data."""
+
+    envelope: bytes
+    data: list[bytes] | dict[str, list[bytes] | bytes]
+
+
+def _diff_journal_list(
+    key: bytes, old: list[bytes], new: list[bytes], ops: list[bytes]
+) -> None:
+    """Add splice operations which turn the old list into the new list.
+
+    Splices are added from the end of the list to the start so the indexes
+    of each splice are not shifted by the splices applied before it.
+    """
+    # Most writes change a few items, so only match the changed part
+    start = 0
+    old_end = len(old)
+    new_end = len(new)
+    while start < old_end and start < new_end and old[start] == new[start]:
+        start += 1
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    matcher = SequenceMatcher(
+        None, old[start:old_end], new[start:new_end], autojunk=False
+    )
+    for tag, old_start, old_end, new_start, new_end in reversed(
+        matcher.get_opcodes()
+    ):
+        if tag == "equal":
+            continue
+        old_start += start
+        old_end += start
+        new_start += start
+        new_end += start
+        ops.append(
+            b'["%b",%b,%d,%d,[%b]]'
+            % (
+                JOURNAL_OP_SPLICE.encode(),
+                key,
+                old_start,
+                old_end - old_start,
+                b",".join(new[new_start:new_end]),
+            )
+        )
+
+
+def _diff_journal_segments(
+    old: _JournalSegments, new: _JournalSegments
+) -> list[bytes] | None:
+    """Return the operations which turn the old segments into the new ones.
+
+    Returns None if the changes can't be expressed as journal operations.
+    """
+    ops: list[bytes] = []
+    if old.envelope != new.envelope:
+        ops.append(b'["%b",%b]' % (JOURNAL_OP_ENVELOPE.encode(), new.envelope))
+
+    if isinstance(old.data, list) or isinstance(new.data, list):
+        if not isinstance(old.data, list) or not isinstance(new.data, list):
+            return None
+        if old.data != new.data:
+            _diff_journal_list(b"null", old.data, new.data, ops)
+        return ops
+
+    old_data = old.data
+    new_data = new.data
+    for key in old_data.keys() - new_data.keys():
+        ops.append(
+            b'["%b",%b]' % (JOURNAL_OP_DELETE.encode(), json_helper.json_bytes(key))
+        )
+    for key, value in new_data.items():
+        if (old_value := old_data.get(key)) == value:
+            continue
+        if isinstance(value, list) and isinstance(old_value, list):
+            _diff_journal_list(json_helper.json_bytes(key), old_value, value, ops)
+            continue
+        ops.append(
+            b'["%b",%b,%b]'
+            % (
+                JOURNAL_OP_SET.encode(),
+                json_helper.json_bytes(key),
+                b"[%b]" % b",".join(value) if isinstance(value, list) else value,
+            )
+        )
+    return ops
+
+
+def _apply_journal_ops(data: dict[str, Any], ops: list[list[Any]]) -> None:
+    """Apply the operations of a journal record to loaded data."""
+    for op, *args in ops:
+        if op == JOURNAL_OP_ENVELOPE:
+            data.update(args[0])
+        elif op == JOURNAL_OP_SET:
+            data["data"][args[0]] = args[1]
+        elif op == JOURNAL_OP_DELETE:
+            del data["data"][args[0]]
+        elif op == JOURNAL_OP_SPLICE:
+            key, start, delete_count, items = args
+            target = data["data"] if key is None else data["data"][key]
+            target[start : start + delete_count] = items
+        else:
+            raise ValueError(f"Unknown journal operation {op}")
@@ -13,6 +13,7 @@ from functools import cache, lru_cache, partial, wraps
 import json
 import logging
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -32,14 +33,13 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
-from jinja2.utils import Namespace
+from jinja2.utils import Namespace, _PassArg
 from lru import LRU  # pylint: disable=no-name-in-module
 import orjson
 import voluptuous as vol
@@ -92,6 +92,7 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_TEMPLATE_CACHE = "template.compile_cache"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -99,6 +100,55 @@ _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
 
 _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunction"}
 
+# Globals and filters which can be called by the fast path renderer; these
+# don't depend on the jinja context and return the same result when called
+# outside of jinja.
+_FAST_PATH_GLOBALS = {
+    "bool",
+    "float",
+    "has_value",
+    "int",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "states",
+}
+_FAST_PATH_FILTERS = {
+    "abs",
+    "bool",
+    "float",
+    "int",
+    "is_number",
+    "log",
+    "lower",
+    "multiply",
+    "round",
+    "sqrt",
+    "string",
+    "upper",
+}
+_FAST_PATH_BINOPS: dict[type[nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+    nodes.Mod: operator.mod,
+}
+_FAST_PATH_UNARYOPS: dict[type[nodes.UnaryExpr], Callable[[Any], Any]] = {
+    nodes.Neg: operator.neg,
+    nodes.Pos: operator.pos,
+    nodes.Not: operator.not_,
+}
+_FAST_PATH_COMPARE_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+}
+
 _GROUP_DOMAIN_PREFIX = "group."
 _ZONE_DOMAIN_PREFIX = "zone."
 
@@ -144,6 +194,7 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
@@ -342,6 +393,7 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "cacheable",
     )
 
     def __init__(self, template: Template) -> None:
@@ -360,6 +412,8 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # Cleared if the render depends on data outside the state machine
+        self.cacheable = True
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -372,6 +426,7 @@ class RenderInfo:
             f" entities={self.entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
+            f" cacheable={self.cacheable}"
             f" exception={self.exception}"
             f" is_static={self.is_static}"
             ">"
@@ -406,6 +461,32 @@ class RenderInfo:
             raise self.exception
         return cast(str, self._result)
 
+    def inputs_snapshot(self) -> tuple[Any, ...] | None:
+        """Return the versions of the states the render depended on.
+
+        The result of the render can be reused as long as the snapshot does not
+        change. Domains are compared by their version, which is cheaper than
+        comparing their states. Returns None if the result must not be reused.
+        """
+        if (
+            self.is_static
+            or self.exception is not None
+            or not self.cacheable
+            or self.has_time
+            or self.all_states
+            or self.all_states_lifecycle
+        ):
+            return None
+        states = self.template.hass.states  # type: ignore[union-attr]
+        return (
+            tuple(states.get(entity_id) for entity_id in self.entities),
+            tuple(states.async_domain_version(domain) for domain in self.domains),
+            tuple(
+                states.async_domain_version(domain, lifecycle=True)
+                for domain in self.domains_lifecycle
+            ),
+        )
+
     def _freeze_static(self) -> None:
         self.is_static = True
         self._freeze_sets()
@@ -455,6 +536,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_fast_render",
         "_exc_info",
         "_limited",
         "_strict",
@@ -471,6 +553,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_render: _FastRender | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -565,7 +648,12 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (
+                fast_render := self._fast_render
+            ) is not None and fast_render.names.isdisjoint(kwargs):
+                render_result = fast_render.render(self.template)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -785,6 +873,7 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        self._fast_render = env.fast_render(self.template)
 
         return self._compiled
 
@@ -2107,6 +2196,8 @@ def random_every_time(context, values):
     Unlike Jinja's random filter,
     this is context-dependent to avoid caching the chosen value.
     """
+    if (render_info := _render_info.get()) is not None:
+        render_info.cacheable = False
     return random.choice(values)
 
 
@@ -2196,6 +2287,187 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+class _FastPathUnsupported(Exception):
+    """Raised when a template can't be rendered by the fast path."""
+
+
+class _FastRender:
+    """Render a simple template with plain python closures.
+
+    Only a safe subset of jinja is supported: calls to state lookup functions,
+    arithmetic, comparisons, boolean logic and a few common filters. The
+    closures call the same functions as the jinja template, the result is
+    identical but skips the overhead of setting up a jinja context.
+    """
+
+    __slots__ = ("names", "_parts")
+
+    def __init__(
+        self, names: frozenset[str], parts: list[Callable[[], str]]
+    ) -> None:
+        """Initialize the fast renderer."""
+        self.names = names
+        self._parts = parts
+
+    def render(self, template_str: str) -> str:
+        """Render the template."""
+        with set_template(template_str, "rendering"):
+            return "".join([part() for part in self._parts])
+
+
+def _compile_fast_render(
+    env: TemplateEnvironment, template_str: str
+) -> _FastRender | None:
+    """Compile a simple template to a fast renderer.
+
+    Returns None if the template uses anything outside the supported subset,
+    it will then be rendered by jinja.
+    """
+    try:
+        body = env.parse(template_str).body
+    except jinja2.TemplateError:
+        return None
+    if len(body) != 1 or not isinstance(body[0], nodes.Output):
+        return None
+
+    names: set[str] = set()
+    parts: list[Callable[[], str]] = []
+    try:
+        for node in body[0].nodes:
+            if isinstance(node, nodes.TemplateData):
+                parts.append(partial(str, node.data))
+            else:
+                parts.append(_compile_fast_output(env, node, names))
+    except _FastPathUnsupported:
+        return None
+
+    return _FastRender(frozenset(names), parts)
+
+
+def _compile_fast_output(
+    env: TemplateEnvironment, node: nodes.Node, names: set[str]
+) -> Callable[[], str]:
+    """Compile an output expression, jinja converts the result to a string."""
+    expr = _compile_fast_expr(env, node, names)
+    return lambda: str(expr())
+
+
+def _compile_fast_expr(  # noqa: C901
+    env: TemplateEnvironment, node: nodes.Node, names: set[str]
+) -> Callable[[], Any]:
+    """Compile a jinja expression node to a closure."""
+    if isinstance(node, nodes.Const):
+        value = node.value
+        return lambda: value
+
+    if (binop := _FAST_PATH_BINOPS.get(type(node))) is not None:
+        assert isinstance(node, nodes.BinExpr)
+        left = _compile_fast_expr(env, node.left, names)
+        right = _compile_fast_expr(env, node.right, names)
+        return lambda: binop(left(), right())
+
+    if (unaryop := _FAST_PATH_UNARYOPS.get(type(node))) is not None:
+        assert isinstance(node, nodes.UnaryExpr)
+        operand = _compile_fast_expr(env, node.node, names)
+        return lambda: unaryop(operand())
+
+    if isinstance(node, nodes.And):
+        left = _compile_fast_expr(env, node.left, names)
+        right = _compile_fast_expr(env, node.right, names)
+        return lambda: left() and right()
+
+    if isinstance(node, nodes.Or):
+        left = _compile_fast_expr(env, node.left, names)
+        right = _compile_fast_expr(env, node.right, names)
+        return lambda: left() or right()
+
+    if isinstance(node, nodes.CondExpr) and node.expr2 is not None:
+        test = _compile_fast_expr(env, node.test, names)
+        expr1 = _compile_fast_expr(env, node.expr1, names)
+        expr2 = _compile_fast_expr(env, node.expr2, names)
+        return lambda: expr1() if test() else expr2()
+
+    if isinstance(node, nodes.Compare):
+        return _compile_fast_compare(env, node, names)
+
+    if (
+        isinstance(node, nodes.Call)
+        and isinstance(node.node, nodes.Name)
+        and node.node.name in _FAST_PATH_GLOBALS
+        and node.dyn_args is None
+        and node.dyn_kwargs is None
+    ):
+        func = env.globals[node.node.name]
+        # AllStates resolves any attribute, check the type like jinja does
+        pass_arg = _PassArg.from_obj(func)
+        if pass_arg is _PassArg.context:
+            # Functions which depend on hass ignore the jinja context
+            func = partial(func, None)
+        elif isinstance(pass_arg, _PassArg):
+            raise _FastPathUnsupported
+        names.add(node.node.name)
+        return _compile_fast_call(env, func, node.args, node.kwargs, names)
+
+    if (
+        isinstance(node, nodes.Filter)
+        and node.node is not None
+        and node.name in _FAST_PATH_FILTERS
+        and node.dyn_args is None
+        and node.dyn_kwargs is None
+    ):
+        func = env.filters[node.name]
+        if isinstance(_PassArg.from_obj(func), _PassArg):
+            raise _FastPathUnsupported
+        return _compile_fast_call(
+            env, func, [node.node, *node.args], node.kwargs, names
+        )
+
+    raise _FastPathUnsupported
+
+
+def _compile_fast_call(
+    env: TemplateEnvironment,
+    func: Callable[..., Any],
+    args: list[nodes.Expr],
+    kwargs: list[nodes.Keyword],
+    names: set[str],
+) -> Callable[[], Any]:
+    """Compile a function or filter call to a closure."""
+    arg_exprs = [_compile_fast_expr(env, arg, names) for arg in args]
+    kwarg_exprs = [
+        (kwarg.key, _compile_fast_expr(env, kwarg.value, names)) for kwarg in kwargs
+    ]
+    if not kwarg_exprs:
+        return lambda: func(*[arg() for arg in arg_exprs])
+    return lambda: func(
+        *[arg() for arg in arg_exprs], **{key: arg() for key, arg in kwarg_exprs}
+    )
+
+
+def _compile_fast_compare(
+    env: TemplateEnvironment, node: nodes.Compare, names: set[str]
+) -> Callable[[], Any]:
+    """Compile a (chained) comparison to a closure."""
+    expr = _compile_fast_expr(env, node.expr, names)
+    ops: list[tuple[Callable[[Any, Any], Any], Callable[[], Any]]] = []
+    for operand in node.ops:
+        if (compare_op := _FAST_PATH_COMPARE_OPS.get(operand.op)) is None:
+            raise _FastPathUnsupported
+        ops.append((compare_op, _compile_fast_expr(env, operand.expr, names)))
+
+    def compare() -> Any:
+        left = expr()
+        result: Any = True
+        for compare_op, operand_expr in ops:
+            right = operand_expr()
+            if not (result := compare_op(left, right)):
+                return result
+            left = right
+        return result
+
+    return compare
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2221,6 +2493,9 @@ def make_logging_undefined(
         """Log on undefined variables."""
 
         def _log_message(self) -> None:
+            if (render_info := _render_info.get()) is not None:
+                # Render again to log again
+                render_info.cacheable = False
             _log_fn(logging.WARNING, self._undefined_message)
 
         def _fail_with_undefined_error(self, *args, **kwargs):
@@ -2274,6 +2549,30 @@ def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
 
 
+class CompiledTemplateCache:
+    """Cache compiled templates shared by all template environments.
+
+    Templates with the same source, for example created from the same
+    blueprint, share the compiled code and fast renderer.
+    """
+
+    __slots__ = ("code", "fast_render")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.code: MutableMapping[tuple[str, bool, bool], CodeType] = LRU(
+            COMPILED_TEMPLATE_CACHE_SIZE
+        )
+        self.fast_render: MutableMapping[
+            tuple[str, bool, bool], _FastRender | None
+        ] = LRU(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
+@singleton(_TEMPLATE_CACHE)
+def _get_compiled_template_cache(hass: HomeAssistant) -> CompiledTemplateCache:
+    return CompiledTemplateCache()
+
+
 class HassLoader(jinja2.BaseLoader):
     """An in-memory jinja loader that keeps track of templates that need to be reloaded."""
 
@@ -2315,9 +2614,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | str | None
-        ] = weakref.WeakValueDictionary()
+        self.template_cache = (
+            CompiledTemplateCache()
+            if hass is None
+            else _get_compiled_template_cache(hass)
+        )
+        self._cache_mode = (bool(limited), bool(strict))
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2415,46 +2717,63 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 [Callable[Concatenate[Any, _P], _R]],
                 Callable[Concatenate[Any, _P], _R],
             ] = pass_context,
+            cacheable: bool = True,
         ) -> Callable[Concatenate[Any, _P], _R]:
-            """Wrap function that depend on hass."""
+            """Wrap function that depend on hass.
+
+            Functions which depend on the registries or the configuration
+            are not cacheable, their result is not tracked by RenderInfo.
+            """
+
+            if cacheable:
+
+                @wraps(func)
+                def wrapper(_: Any, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+                    return func(hass, *args, **kwargs)
+
+            else:
 
-            @wraps(func)
-            def wrapper(_: Any, *args: _P.args, **kwargs: _P.kwargs) -> _R:
-                return func(hass, *args, **kwargs)
+                @wraps(func)
+                def wrapper(_: Any, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+                    if (render_info := _render_info.get()) is not None:
+                        render_info.cacheable = False
+                    return func(hass, *args, **kwargs)
 
             return jinja_context(wrapper)
 
-        self.globals["device_entities"] = hassfunction(device_entities)
+        uncacheable = partial(hassfunction, cacheable=False)
+
+        self.globals["device_entities"] = uncacheable(device_entities)
         self.filters["device_entities"] = self.globals["device_entities"]
 
-        self.globals["device_attr"] = hassfunction(device_attr)
+        self.globals["device_attr"] = uncacheable(device_attr)
         self.filters["device_attr"] = self.globals["device_attr"]
 
-        self.globals["is_device_attr"] = hassfunction(is_device_attr)
-        self.tests["is_device_attr"] = hassfunction(is_device_attr, pass_eval_context)
+        self.globals["is_device_attr"] = uncacheable(is_device_attr)
+        self.tests["is_device_attr"] = uncacheable(is_device_attr, pass_eval_context)
 
-        self.globals["config_entry_id"] = hassfunction(config_entry_id)
+        self.globals["config_entry_id"] = uncacheable(config_entry_id)
         self.filters["config_entry_id"] = self.globals["config_entry_id"]
 
-        self.globals["device_id"] = hassfunction(device_id)
+        self.globals["device_id"] = uncacheable(device_id)
         self.filters["device_id"] = self.globals["device_id"]
 
-        self.globals["areas"] = hassfunction(areas)
+        self.globals["areas"] = uncacheable(areas)
         self.filters["areas"] = self.globals["areas"]
 
-        self.globals["area_id"] = hassfunction(area_id)
+        self.globals["area_id"] = uncacheable(area_id)
         self.filters["area_id"] = self.globals["area_id"]
 
-        self.globals["area_name"] = hassfunction(area_name)
+        self.globals["area_name"] = uncacheable(area_name)
         self.filters["area_name"] = self.globals["area_name"]
 
-        self.globals["area_entities"] = hassfunction(area_entities)
+        self.globals["area_entities"] = uncacheable(area_entities)
         self.filters["area_entities"] = self.globals["area_entities"]
 
-        self.globals["area_devices"] = hassfunction(area_devices)
+        self.globals["area_devices"] = uncacheable(area_devices)
         self.filters["area_devices"] = self.globals["area_devices"]
 
-        self.globals["integration_entities"] = hassfunction(integration_entities)
+        self.globals["integration_entities"] = uncacheable(integration_entities)
         self.filters["integration_entities"] = self.globals["integration_entities"]
 
         if limited:
@@ -2512,11 +2831,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         self.globals["expand"] = hassfunction(expand)
         self.filters["expand"] = self.globals["expand"]
-        self.globals["closest"] = hassfunction(closest)
-        self.filters["closest"] = hassfunction(closest_filter)
-        self.globals["distance"] = hassfunction(distance)
-        self.globals["is_hidden_entity"] = hassfunction(is_hidden_entity)
-        self.tests["is_hidden_entity"] = hassfunction(
+        self.globals["closest"] = uncacheable(closest)
+        self.filters["closest"] = uncacheable(closest_filter)
+        self.globals["distance"] = uncacheable(distance)
+        self.globals["is_hidden_entity"] = uncacheable(is_hidden_entity)
+        self.tests["is_hidden_entity"] = uncacheable(
             is_hidden_entity, pass_eval_context
         )
         self.globals["is_state"] = hassfunction(is_state)
@@ -2601,10 +2920,24 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        if not isinstance(source, str):
+            return super().compile(source)
+
+        code_cache = self.template_cache.code
+        key = (source, *self._cache_mode)
+        if (cached := code_cache.get(key)) is None:
+            cached = code_cache[key] = super().compile(source)
 
         return cached
 
+    def fast_render(self, source: str) -> _FastRender | None:
+        """Return the fast renderer for a template, None if not supported."""
+        fast_render_cache = self.template_cache.fast_render
+        key = (source, *self._cache_mode)
+        if (cached := fast_render_cache.get(key, _SENTINEL)) is _SENTINEL:
+            cached = fast_render_cache[key] = _compile_fast_render(self, source)
+
+        return cached  # type: ignore[return-value]
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
@@ -14,6 +14,7 @@ import importlib
 import logging
 import pathlib
 import sys
+from time import monotonic
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,6 +26,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -48,6 +50,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIMES = "integration_import_times"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -171,6 +174,7 @@ def async_setup(hass: HomeAssistant) -> None:
     _async_mount_config_dir(hass)
     hass.data[DATA_COMPONENTS] = {}
     hass.data[DATA_INTEGRATIONS] = {}
+    hass.data[DATA_IMPORT_TIMES] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -621,6 +625,19 @@ class Integration:
 
         return None
 
+    @classmethod
+    def from_manifest_index(
+        cls, hass: HomeAssistant, entry: dict[str, Any]
+    ) -> Integration:
+        """Create an integration from an entry of the manifest index."""
+        integration = cls(
+            hass, entry["pkg_path"], pathlib.Path(entry["file_path"]), entry["manifest"]
+        )
+        if (all_dependencies := entry["all_dependencies"]) is not None:
+            integration._all_dependencies = set(all_dependencies)
+            integration._all_dependencies_resolved = True
+        return integration
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -807,12 +824,25 @@ class Integration:
 
         return self._all_dependencies_resolved
 
+    def manifest_index_entry(self, manifest_mtime: float) -> dict[str, Any]:
+        """Return the entry of the integration in the manifest index."""
+        return {
+            "pkg_path": self.pkg_path,
+            "file_path": str(self.file_path),
+            "manifest": self.manifest,
+            "manifest_mtime": manifest_mtime,
+            "all_dependencies": sorted(self._all_dependencies)
+            if self._all_dependencies_resolved and self._all_dependencies is not None
+            else None,
+        }
+
     def get_component(self) -> ComponentProtocol:
         """Return the component."""
         cache: dict[str, ComponentProtocol] = self.hass.data[DATA_COMPONENTS]
         if self.domain in cache:
             return cache[self.domain]
 
+        start = monotonic()
         try:
             cache[self.domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -825,6 +855,7 @@ class Integration:
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
+        self._add_import_time(monotonic() - start)
         return cache[self.domain]
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -834,6 +865,7 @@ class Integration:
         if full_name in cache:
             return cache[full_name]
 
+        start = monotonic()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ImportError:
@@ -848,12 +880,36 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
+        self._add_import_time(monotonic() - start)
         return cache[full_name]
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    def _add_import_time(self, import_time: float) -> None:
+        """Add time spent importing modules of the integration."""
+        import_times: dict[str, float] = self.hass.data[DATA_IMPORT_TIMES]
+        import_times[self.domain] = import_times.get(self.domain, 0) + import_time
+
+    def pre_import(self, platform_names: Iterable[str]) -> float:
+        """Import the component and platforms ahead of their setup.
+
+        Runs in the executor. The modules only end up in sys.modules, so
+        get_component and get_platform find them without importing in the
+        event loop. Returns the time it took.
+        """
+        start = monotonic()
+        try:
+            importlib.import_module(self.pkg_path)
+            for platform_name in platform_names:
+                self._import_platform(platform_name)
+        except Exception as err:  # pylint: disable=broad-except
+            # The import will be retried, and any error reported,
+            # when the integration is set up
+            _LOGGER.debug("Unable to pre-import %s: %s", self.pkg_path, err)
+        return monotonic() - start
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -875,6 +931,191 @@ def _resolve_integrations_from_root(
     return integrations
 
 
+async def async_pre_import_integrations(
+    hass: HomeAssistant,
+    integrations: Iterable[Integration],
+    import_graph: dict[str, list[str]],
+) -> None:
+    """Import integrations and their platforms concurrently in the executor.
+
+    import_graph maps the domains to the platforms that were imported for
+    them during the previous start. Only built-in integrations in the graph
+    are imported, since their requirements did not change since then.
+    """
+    to_import = [
+        integration
+        for integration in integrations
+        if integration.is_built_in and integration.domain in import_graph
+    ]
+    import_times = await asyncio.gather(
+        *(
+            hass.async_add_executor_job(
+                integration.pre_import, import_graph[integration.domain]
+            )
+            for integration in to_import
+        )
+    )
+    times: dict[str, float] = hass.data[DATA_IMPORT_TIMES]
+    for integration, import_time in zip(to_import, import_times):
+        times[integration.domain] = times.get(integration.domain, 0) + import_time
+
+
+@callback
+def async_get_import_graph(hass: HomeAssistant) -> dict[str, list[str]]:
+    """Return the platforms imported for each built-in integration."""
+    integrations = hass.data[DATA_INTEGRATIONS]
+    import_graph: dict[str, list[str]] = {}
+    for name in hass.data[DATA_COMPONENTS]:
+        domain, _, platform_name = name.partition(".")
+        integration = integrations.get(domain)
+        if not isinstance(integration, Integration) or not integration.is_built_in:
+            continue
+        platform_names = import_graph.setdefault(domain, [])
+        if platform_name:
+            platform_names.append(platform_name)
+    return {
+        domain: sorted(platform_names)
+        for domain, platform_names in import_graph.items()
+    }
+
+
+def _get_manifest_mtime(path: pathlib.Path | None) -> float | None:
+    """Return the modification time of the manifest in an integration directory."""
+    if path is None:
+        return None
+    try:
+        return (path / "manifest.json").stat().st_mtime
+    except OSError:
+        return None
+
+
+def _get_custom_manifest_mtimes(hass: HomeAssistant) -> dict[str, float | None]:
+    """Return the manifest modification time of each custom integration directory."""
+    if hass.config.safe_mode:
+        return {}
+
+    try:
+        import custom_components  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return {}
+
+    mtimes: dict[str, float | None] = {}
+    for path in custom_components.__path__:
+        for entry in pathlib.Path(path).iterdir():
+            if entry.is_dir() and entry.name not in mtimes:
+                mtimes[entry.name] = _get_manifest_mtime(entry)
+    return mtimes
+
+
+def _build_manifest_index(
+    hass: HomeAssistant, integrations: list[Integration]
+) -> dict[str, Any]:
+    """Build the manifest index of the integrations."""
+    entries: dict[str, Any] = {}
+    for integration in integrations:
+        if (manifest_mtime := _get_manifest_mtime(integration.file_path)) is None:
+            continue
+        entries[integration.domain] = integration.manifest_index_entry(
+            manifest_mtime
+        )
+    return {
+        "ha_version": __version__,
+        "custom_components": _get_custom_manifest_mtimes(hass),
+        "integrations": entries,
+    }
+
+
+def _restore_manifest_index(
+    hass: HomeAssistant, index: dict[str, Any]
+) -> dict[str, Integration] | None:
+    """Restore the integrations of the manifest index if it is still valid."""
+    custom_manifest_mtimes = _get_custom_manifest_mtimes(hass)
+    if index["custom_components"] != custom_manifest_mtimes:
+        return None
+
+    entries: dict[str, dict[str, Any]] = index["integrations"]
+    for entry in entries.values():
+        if _get_manifest_mtime(pathlib.Path(entry["file_path"])) != entry[
+            "manifest_mtime"
+        ]:
+            return None
+
+    integrations: dict[str, Integration] = {}
+    custom_dirs: set[str] = set()
+    for domain, entry in entries.items():
+        integration = integrations[domain] = Integration.from_manifest_index(
+            hass, entry
+        )
+        if not integration.is_built_in:
+            _LOGGER.warning(CUSTOM_WARNING, domain)
+            custom_dirs.add(integration.file_path.name)
+
+    if blocked := [
+        name
+        for name, manifest_mtime in custom_manifest_mtimes.items()
+        if manifest_mtime is not None and name not in custom_dirs
+    ]:
+        # Resolve the custom integrations that were not loaded
+        # again to log why they are blocked
+        import custom_components  # pylint: disable=import-outside-toplevel
+
+        integrations.update(
+            _resolve_integrations_from_root(hass, custom_components, blocked)
+        )
+
+    return integrations
+
+
+async def async_get_manifest_index(hass: HomeAssistant) -> dict[str, Any]:
+    """Return an index of the manifests and dependencies of resolved integrations.
+
+    Restoring it with async_restore_manifest_index at the next start avoids
+    reading and parsing the manifests and resolving the dependencies again.
+    """
+    integrations: dict[str, Integration] = {
+        domain: int_or_fut
+        for domain, int_or_fut in hass.data[DATA_INTEGRATIONS].items()
+        # Integration is never subclassed, so we can check for type
+        if type(int_or_fut) is Integration  # noqa: E721
+    }
+    if isinstance(custom := hass.data.get(DATA_CUSTOM_COMPONENTS), dict):
+        for domain, integration in custom.items():
+            integrations.setdefault(domain, integration)
+    return await hass.async_add_executor_job(
+        _build_manifest_index, hass, list(integrations.values())
+    )
+
+
+async def async_restore_manifest_index(
+    hass: HomeAssistant, index: dict[str, Any]
+) -> bool:
+    """Restore the integrations of a manifest index.
+
+    The index is only used when it was built by the same version and the
+    custom integrations and manifests of the integrations did not change.
+    Returns if the index was restored.
+    """
+    if index["ha_version"] != __version__:
+        return False
+
+    integrations = await hass.async_add_executor_job(
+        _restore_manifest_index, hass, index
+    )
+    if integrations is None:
+        return False
+
+    cache = hass.data[DATA_INTEGRATIONS]
+    for domain, integration in integrations.items():
+        cache.setdefault(domain, integration)
+    if DATA_CUSTOM_COMPONENTS not in hass.data:
+        hass.data[DATA_CUSTOM_COMPONENTS] = {
+            domain: integration
+            for domain, integration in integrations.items()
+            if not integration.is_built_in
+        }
+    return True
+
+
 @callback
 def async_get_loaded_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration which is already loaded.
@@ -8,11 +8,14 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import pathlib
 from timeit import default_timer as timer
 from typing import TypeVar
+import zlib
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_STATE_CHANGED, UnitOfPower
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -227,6 +230,50 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_indexed_listeners(hass):
+    """Run a million state changed events with 6000 entity indexed listeners."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**6
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    @core.callback
+    def event_filter(event):
+        """Filter event."""
+        return True
+
+    for idx in range(6000):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            listener,
+            event_filter=event_filter,
+            entity_ids=[f"{entity_id}{idx}"],
+        )
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    start = timer()
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -314,6 +361,238 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+async def _render_simple_templates(hass, fast_path):
+    """Render simple templates 100k times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    hass.states.async_set("sensor.temperature", "21.5")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.dining_room", "on")
+    templates = [
+        Template("{{ states('sensor.temperature') | float * 1.8 + 32 }}", hass),
+        Template(
+            "{{ is_state('light.kitchen', 'on') and "
+            "is_state('light.dining_room', 'on') }}",
+            hass,
+        ),
+    ]
+    for template in templates:
+        template.async_render()
+        if not fast_path:
+            template._fast_render = None  # pylint: disable=protected-access
+
+    start = timer()
+
+    for _ in range(10**5):
+        for template in templates:
+            template.async_render()
+
+    return timer() - start
+
+
+@benchmark
+async def render_simple_templates(hass):
+    """Render simple templates 100k times with the fast path."""
+    return await _render_simple_templates(hass, True)
+
+
+@benchmark
+async def render_simple_templates_jinja(hass):
+    """Render simple templates 100k times with jinja."""
+    return await _render_simple_templates(hass, False)
+
+
+async def _compress_entities_snapshot(hass, compress):
+    """Compress the subscribe_entities snapshot of 5k entities 100 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.messages import (
+        construct_event_message,
+    )
+
+    for idx in range(5000):
+        hass.states.async_set(
+            f"sensor.power_{idx}",
+            str(idx),
+            {
+                "device_class": "power",
+                "friendly_name": f"Power {idx}",
+                "unit_of_measurement": "W",
+            },
+        )
+    joined_states = ",".join(
+        state.as_compressed_state_json for state in hass.states.async_all()
+    )
+    message = construct_event_message(1, f'{{"a":{{{joined_states}}}}}').encode()
+
+    start = timer()
+    for _ in range(100):
+        compress(message)
+    return timer() - start
+
+
+@benchmark
+async def websocket_compress_entities_snapshot(hass):
+    """Compress the subscribe_entities snapshot of 5k entities 100 times.
+
+    Measures the zlib compressed binary frames sent to clients supporting
+    compressed messages.
+    """
+    return await _compress_entities_snapshot(hass, zlib.compress)
+
+
+@benchmark
+async def websocket_compress_entities_snapshot_deflate(hass):
+    """Compress the subscribe_entities snapshot of 5k entities 100 times.
+
+    Measures the permessage-deflate compression aiohttp applies to the text
+    frames sent to clients without support for compressed messages.
+    """
+    compressobj = zlib.compressobj(level=zlib.Z_BEST_SPEED, wbits=-zlib.MAX_WBITS)
+
+    def _deflate(message: bytes) -> bytes:
+        return compressobj.compress(message) + compressobj.flush(zlib.Z_SYNC_FLUSH)
+
+    return await _compress_entities_snapshot(hass, _deflate)
+
+
+@benchmark
+async def resolve_integrations(hass):
+    """Resolve all built-in integrations and their dependencies.
+
+    Measures restoring the manifest index of the previous start, built here
+    by reading the manifests as done at the first start.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import components, loader
+
+    domains = [
+        path.parent.name
+        for base in components.__path__
+        for path in pathlib.Path(base).glob("*/manifest.json")
+    ]
+
+    async def _resolve():
+        integrations = await loader.async_get_integrations(hass, domains)
+        await asyncio.gather(
+            *(
+                integration.resolve_dependencies()
+                for integration in integrations.values()
+                if isinstance(integration, loader.Integration)
+            )
+        )
+
+    loader.async_setup(hass)
+    await _resolve()
+
+    index = await loader.async_get_manifest_index(hass)
+    loader.async_setup(hass)
+    start = timer()
+    await loader.async_restore_manifest_index(hass, index)
+    await _resolve()
+    return timer() - start
+
+
+@benchmark
+async def mqtt_match_subscriptions(hass):
+    """Match 100k distinct topics twice with 10k MQTT subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    trie = SubscriptionTrie()
+    job = core.HassJob(lambda msg: None)
+    for idx in range(9000):
+        trie.add(Subscription(f"zigbee2mqtt/device_{idx}", job))
+    for idx in range(900):
+        trie.add(Subscription(f"tasmota/discovery/{idx}/+", job))
+    for idx in range(100):
+        trie.add(Subscription(f"homeassistant/+/node_{idx}/#", job))
+    topics = [
+        *(f"zigbee2mqtt/device_{idx}" for idx in range(50000)),
+        *(f"tasmota/discovery/{idx % 1000}/config_{idx}" for idx in range(40000)),
+        *(f"homeassistant/sensor/node_{idx % 200}/{idx}" for idx in range(10000)),
+    ]
+
+    start = timer()
+    for _ in range(2):
+        for topic in topics:
+            trie.matching_subscriptions(topic)
+    return timer() - start
+
+
+@benchmark
+async def entity_registry_lookups(hass):
+    """Look up entries of a 20k entity registry by device, area and config entry."""
+    registry = er.EntityRegistry(hass)
+    registry.entities = er.EntityRegistryItems()
+    for idx in range(20000):
+        entity_id = f"sensor.entity_{idx}"
+        registry.entities[entity_id] = er.RegistryEntry(
+            entity_id,
+            str(idx),
+            "benchmark",
+            device_id=f"device_{idx // 10}",
+            area_id=f"area_{idx % 50}",
+            config_entry_id=f"config_entry_{idx % 100}",
+        )
+
+    start = timer()
+    for idx in range(1000):
+        er.async_entries_for_device(registry, f"device_{idx}")
+        er.async_entries_for_area(registry, f"area_{idx % 50}")
+        er.async_entries_for_config_entry(registry, f"config_entry_{idx % 100}")
+    return timer() - start
+
+
+async def _power_sensor_state_writes(hass, cached):
+    """Write a minute of states of 10 power sensors updating 10 times a second."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor import (
+        SensorDeviceClass,
+        SensorEntity,
+        SensorStateClass,
+    )
+
+    class PowerSensor(SensorEntity):
+        """A power sensor as written by a typical energy meter integration."""
+
+        _attr_device_class = SensorDeviceClass.POWER
+        _attr_has_entity_name = True
+        _attr_icon = "mdi:flash"
+        _attr_name = "Power"
+        _attr_native_unit_of_measurement = UnitOfPower.WATT
+        _attr_state_class = SensorStateClass.MEASUREMENT
+
+    sensors = []
+    for idx in range(10):
+        sensor = PowerSensor()
+        sensor.hass = hass
+        sensor.entity_id = f"sensor.power_{idx}"
+        sensors.append(sensor)
+
+    start = timer()
+    for update in range(600):
+        for sensor in sensors:
+            # pylint: disable=protected-access
+            if not cached:
+                sensor._cached_static_attributes = None
+            sensor._attr_native_value = update
+            sensor._async_write_ha_state()
+    return timer() - start
+
+
+@benchmark
+async def power_sensor_state_writes(hass):
+    """Write a minute of states of 10 power sensors with cached static attributes."""
+    return await _power_sensor_state_writes(hass, True)
+
+
+@benchmark
+async def power_sensor_state_writes_uncached(hass):
+    """Write a minute of states of 10 power sensors calculating all attributes."""
+    return await _power_sensor_state_writes(hass, False)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
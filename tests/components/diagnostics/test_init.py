@@ -12,7 +12,7 @@ from homeassistant.setup import async_setup_component
 
 from . import _get_diagnostics_for_config_entry, _get_diagnostics_for_device
 
-from tests.common import MockConfigEntry, mock_platform
+from tests.common import MockConfigEntry, MockEntityPlatform, mock_platform
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 
@@ -84,6 +84,15 @@ async def test_download_diagnostics(
     """Test download diagnostics."""
     config_entry = MockConfigEntry(domain="fake_integration")
     config_entry.add_to_hass(hass)
+    platform = MockEntityPlatform(
+        hass, domain="sensor", platform_name="fake_integration"
+    )
+    platform.config_entry = config_entry
+    platform.skipped_state_writes = 3
+    platform.failed_updates = 1
+    platform.poll_concurrency = 4
+    platform.poll_durations[1] = 5
+    MockEntityPlatform(hass, domain="light", platform_name="fake_integration")
     hass_sys_info = await async_get_system_info(hass)
     hass_sys_info["run_as_root"] = hass_sys_info["user"] == "root"
     del hass_sys_info["user"]
@@ -99,6 +108,23 @@ async def test_download_diagnostics(
             "name": "fake_integration",
             "requirements": [],
         },
+        "entity_platforms": {
+            "sensor": {
+                "skipped_state_writes": 3,
+                "failed_updates": 1,
+                "poll_concurrency": 4,
+                "poll_durations": {
+                    "0.01": 0,
+                    "0.05": 5,
+                    "0.1": 0,
+                    "0.5": 0,
+                    "1.0": 0,
+                    "5.0": 0,
+                    "10.0": 0,
+                    "inf": 0,
+                },
+            }
+        },
         "data": {"config_entry": "info"},
     }
 
@@ -120,6 +146,23 @@ async def test_download_diagnostics(
             "name": "fake_integration",
             "requirements": [],
         },
+        "entity_platforms": {
+            "sensor": {
+                "skipped_state_writes": 3,
+                "failed_updates": 1,
+                "poll_concurrency": 4,
+                "poll_durations": {
+                    "0.01": 0,
+                    "0.05": 5,
+                    "0.1": 0,
+                    "0.5": 0,
+                    "1.0": 0,
+                    "5.0": 0,
+                    "10.0": 0,
+                    "inf": 0,
+                },
+            }
+        },
         "data": {"device": "info"},
     }
 
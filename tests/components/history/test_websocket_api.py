@@ -171,6 +171,125 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+@pytest.mark.parametrize("no_attributes", [True, False])
+async def test_history_during_period_columnar(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    no_attributes: bool,
+) -> None:
+    """Test history_during_period with the columnar format."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state, attributes in (
+        ("on", {"any": "attr"}),
+        ("off", {"any": "attr"}),
+        ("off", {"any": "changed"}),
+        ("on", {"any": "attr"}),
+    ):
+        hass.states.async_set("sensor.test", state, attributes)
+        hass.states.async_set("sensor.other", f"other_{state}", attributes)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    history_request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.test", "sensor.other", "sensor.missing"],
+        "significant_changes_only": False,
+        "no_attributes": no_attributes,
+        "minimal_response": no_attributes,
+    }
+    await client.send_json({"id": 1, **history_request})
+    response = await client.receive_json()
+    assert response["success"]
+    history_states = response["result"]
+
+    await client.send_json({"id": 2, "columnar": True, **history_request})
+    response = await client.receive_json()
+    assert response["success"]
+    columns = response["result"]
+
+    assert list(columns) == ["sensor.test", "sensor.other"]
+    for entity_id, entity_columns in columns.items():
+        assert entity_columns["s"] == [state["s"] for state in history_states[entity_id]]
+        assert entity_columns["lu"] == [
+            state["lu"] for state in history_states[entity_id]
+        ]
+        if no_attributes:
+            assert "a" not in entity_columns
+        else:
+            assert entity_columns["a"] == [
+                state["a"] for state in history_states[entity_id]
+            ]
+    assert columns["sensor.test"]["s"] == (
+        ["on", "off", "on"] if no_attributes else ["on", "off", "off", "on"]
+    )
+
+
+@pytest.mark.parametrize("columnar", [True, False])
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    columnar: bool,
+) -> None:
+    """Test history_during_period downsamples to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for idx in range(60):
+        if idx == 40:
+            # Removed, like an entity of a reloaded integration
+            hass.states.async_remove("sensor.power")
+            await async_recorder_block_till_done(hass)
+        hass.states.async_set("sensor.power", "unavailable" if idx == 30 else idx)
+        hass.states.async_set("sensor.few", idx // 30)
+        hass.states.async_set("sensor.door", "on" if idx % 2 else "off")
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power", "sensor.few", "sensor.door"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "columnar": columnar,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    if columnar:
+        power_states = response["result"]["sensor.power"]["s"]
+        few_states = response["result"]["sensor.few"]["s"]
+        door_states = response["result"]["sensor.door"]["s"]
+    else:
+        power_states = [state["s"] for state in response["result"]["sensor.power"]]
+        few_states = [state["s"] for state in response["result"]["sensor.few"]]
+        door_states = [state["s"] for state in response["result"]["sensor.door"]]
+    assert len(power_states) == 10
+    assert power_states[0] == "0"
+    assert "unavailable" in power_states
+    assert None in power_states
+    assert power_states[-1] == "59"
+    assert few_states == ["0", "1"]
+    assert len(door_states) == 10
+    assert door_states[0] == "off"
+    assert door_states[-1] == "on"
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1908,3 +2027,77 @@ async def test_history_stream_historical_only_with_start_time_state_past(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_stream_from_recent_history(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream uses the recent history instead of the database."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+
+    now = dt_util.utcnow()
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    hass.states.async_set("sensor.two", "on", attributes={"any": "attr"})
+    sensor_two_last_updated = hass.states.get("sensor.two").last_updated
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.history.websocket_api.history.get_significant_states"
+    ) as mock_get_significant_states, patch.object(
+        recorder_mock, "async_block_till_done"
+    ) as mock_block_till_done:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "start_time": now.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": False,
+                "minimal_response": False,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+        assert response["event"]["start_time"] == now.timestamp()
+        assert response["event"]["states"] == {
+            "sensor.one": [
+                {"a": {"any": "attr"}, "lu": now.timestamp(), "s": "on"},
+                {
+                    "a": {"any": "attr"},
+                    "lu": sensor_one_last_updated.timestamp(),
+                    "s": "off",
+                },
+            ],
+            "sensor.two": [
+                {
+                    "a": {"any": "attr"},
+                    "lu": sensor_two_last_updated.timestamp(),
+                    "s": "on",
+                }
+            ],
+        }
+
+        hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+        sensor_two_last_updated = hass.states.get("sensor.two").last_updated
+        response = await client.receive_json()
+        assert response["event"]["states"] == {
+            "sensor.two": [
+                {
+                    "a": {"any": "attr"},
+                    "lu": sensor_two_last_updated.timestamp(),
+                    "s": "off",
+                }
+            ],
+        }
+
+    assert not mock_get_significant_states.called
+    assert not mock_block_till_done.called
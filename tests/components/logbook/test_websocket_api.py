@@ -35,6 +35,7 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+import homeassistant.util.ulid as ulid_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 from tests.components.recorder.common import (
@@ -456,6 +457,57 @@ async def test_get_events_invalid_filters(
     assert response["error"]["code"] == "invalid_format"
 
 
+async def test_get_events_with_context_origin_before_start_time(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events finds context origins from before the start time."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    one_hour_ago = dt_util.utcnow() - timedelta(hours=1)
+    context = core.Context(id=ulid_util.ulid_at_time(one_hour_ago.timestamp()))
+    with freeze_time(one_hour_ago):
+        hass.bus.async_fire(
+            EVENT_AUTOMATION_TRIGGERED,
+            {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+            context=context,
+        )
+        await async_recorder_block_till_done(hass)
+
+    start_time = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": start_time.isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == [
+        {
+            "context_domain": "automation",
+            "context_entity_id": "automation.alarm",
+            "context_event_type": "automation_triggered",
+            "context_message": "triggered",
+            "context_name": "Mock automation",
+            "entity_id": "light.kitchen",
+            "state": "on",
+            "when": ANY,
+        }
+    ]
+
+
 async def test_get_events_with_device_ids(
     recorder_mock: Recorder,
     hass: HomeAssistant,
@@ -1508,7 +1560,7 @@ async def test_subscribe_unsubscribe_logbook_stream_entities(
     assert msg["type"] == "event"
     assert "start_time" in msg["event"]
     assert "end_time" in msg["event"]
-    assert msg["event"]["partial"] is True
+    assert "partial" not in msg["event"]
     assert msg["event"]["events"] == [
         {
             "entity_id": "binary_sensor.is_light",
@@ -1517,16 +1569,6 @@ async def test_subscribe_unsubscribe_logbook_stream_entities(
         }
     ]
 
-    await get_instance(hass).async_block_till_done()
-    await hass.async_block_till_done()
-    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert "start_time" in msg["event"]
-    assert "end_time" in msg["event"]
-    assert "partial" not in msg["event"]
-    assert msg["event"]["events"] == []
-
     hass.states.async_set("light.alpha", STATE_ON)
     hass.states.async_set("light.alpha", STATE_OFF)
     hass.states.async_set("light.small", STATE_OFF, {"effect": "help", "color": "blue"})
@@ -1607,7 +1649,7 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_with_end_time(
     msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
     assert msg["id"] == 7
     assert msg["type"] == "event"
-    assert msg["event"]["partial"] is True
+    assert "partial" not in msg["event"]
     assert msg["event"]["events"] == [
         {
             "entity_id": "binary_sensor.is_light",
@@ -1616,15 +1658,6 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_with_end_time(
         }
     ]
 
-    await get_instance(hass).async_block_till_done()
-    await hass.async_block_till_done()
-
-    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert "partial" not in msg["event"]
-    assert msg["event"]["events"] == []
-
     hass.states.async_set("light.alpha", STATE_ON)
     hass.states.async_set("light.alpha", STATE_OFF)
     hass.states.async_set("light.small", STATE_OFF, {"effect": "help", "color": "blue"})
@@ -2015,13 +2048,6 @@ async def test_logbook_stream_match_multiple_entities(
     # and its not a failure case. This is useful
     # in the frontend so we can tell the user there
     # are no results vs waiting for them to appear
-    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"]["events"] == []
-    assert "partial" in msg["event"]
-    await async_wait_recording_done(hass)
-
     msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
     assert msg["id"] == 7
     assert msg["type"] == "event"
@@ -2129,13 +2155,6 @@ async def test_logbook_stream_match_multiple_entities_one_with_broken_logbook_pl
     # and its not a failure case. This is useful
     # in the frontend so we can tell the user there
     # are no results vs waiting for them to appear
-    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"]["events"] == []
-    assert "partial" in msg["event"]
-    await async_wait_recording_done(hass)
-
     msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
     assert msg["id"] == 7
     assert msg["type"] == "event"
@@ -2699,16 +2718,7 @@ async def test_subscribe_entities_some_have_uom_multiple(
         {"entity_id": "sensor.keep", "state": "off", "when": ANY},
         {"entity_id": "sensor.keep_two", "state": "off", "when": ANY},
     ]
-    assert msg["event"]["partial"] is True
-
-    await get_instance(hass).async_block_till_done()
-    await hass.async_block_till_done()
-
-    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
     assert "partial" not in msg["event"]
-    assert msg["event"]["events"] == []
 
     _cycle_entities()
     await get_instance(hass).async_block_till_done()
@@ -2963,3 +2973,74 @@ async def test_subscribe_all_entities_are_continuous_with_device(
     assert listeners_without_writes(
         hass.bus.async_listeners()
     ) == listeners_without_writes(init_listeners)
+
+
+async def test_logbook_stream_from_recent_history(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook stream uses the recent history instead of the database."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    hass.states.async_set("light.small", STATE_ON)
+    hass.states.async_set("light.other", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    now = dt_util.utcnow()
+    hass.states.async_set("light.small", STATE_OFF)
+    state: State = hass.states.get("light.small")
+    hass.states.async_set("light.other", STATE_OFF)
+    hass.bus.async_fire(
+        logbook.EVENT_LOGBOOK_ENTRY,
+        {
+            ATTR_NAME: "Small light",
+            logbook.ATTR_MESSAGE: "was dimmed",
+            ATTR_ENTITY_ID: "light.small",
+        },
+    )
+    await hass.async_block_till_done()
+
+    websocket_client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.logbook.websocket_api.EventProcessor.get_events"
+    ) as mock_get_events:
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.small"],
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert "partial" not in msg["event"]
+        assert msg["event"]["events"] == [
+            {
+                "entity_id": "light.small",
+                "state": "off",
+                "when": state.last_updated.timestamp(),
+            },
+            {
+                "domain": "light",
+                "entity_id": "light.small",
+                "message": "was dimmed",
+                "name": "Small light",
+                "when": ANY,
+            },
+        ]
+
+        hass.states.async_set("light.small", STATE_ON)
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["event"]["events"] == [
+            {"entity_id": "light.small", "state": "on", "when": ANY}
+        ]
+
+    assert not mock_get_events.called
@@ -13,7 +13,11 @@ import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -1297,6 +1301,60 @@ async def test_subscribe_special_characters(
     assert calls[0].payload == payload
 
 
+def test_subscription_trie() -> None:
+    """Test matching topics with the subscription trie."""
+    trie = SubscriptionTrie()
+    subscriptions = {
+        topic_filter: Subscription(topic_filter, ha.HassJob(lambda msg: None))
+        for topic_filter in (
+            "home/kitchen/temperature",
+            "home/+/temperature",
+            "home/#",
+            "#",
+            "+/+/+",
+            "$SYS/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+    extra = Subscription("home/#", ha.HassJob(lambda msg: None))
+    trie.add(extra)
+
+    def matching(topic: str) -> set[str]:
+        return {sub.topic for sub in trie.matching_subscriptions(topic)}
+
+    assert matching("home/kitchen/temperature") == {
+        "home/kitchen/temperature",
+        "home/+/temperature",
+        "home/#",
+        "#",
+        "+/+/+",
+    }
+    assert len(trie.matching_subscriptions("home")) == 3
+    assert matching("home") == {"home/#", "#"}
+    assert matching("garden/pump") == {"#"}
+    assert matching("$SYS/broker/uptime") == {"$SYS/#"}
+    assert trie.has_subscriptions("home/#")
+    assert len(trie.subscriptions) == 7
+
+    # Removing a subscription does not need to clear cached matches
+    trie.remove(extra)
+    trie.remove(subscriptions["home/kitchen/temperature"])
+    trie.remove(subscriptions["#"])
+    assert matching("home/kitchen/temperature") == {
+        "home/+/temperature",
+        "home/#",
+        "+/+/+",
+    }
+    assert matching("garden/pump") == set()
+    assert not trie.has_subscriptions("home/kitchen/temperature")
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions["#"])
+
+    trie.add(subscriptions["#"])
+    assert matching("garden/pump") == {"#"}
+
+
 @patch("homeassistant.components.mqtt.client.INITIAL_SUBSCRIBE_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.DISCOVERY_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.SUBSCRIBE_COOLDOWN", 0.0)
@@ -10,6 +10,7 @@ from functools import partial
 import importlib
 import sys
 import time
+from types import ModuleType
 from typing import Any, Literal, cast
 from unittest.mock import patch, sentinel
 
@@ -428,5 +429,40 @@ def old_db_schema(schema_version_postfix: str) -> Iterator[None]:
             create_engine_test_for_schema_version_postfix,
             schema_version_postfix=schema_version_postfix,
         ),
+    ), old_db_schema_values_from_event(old_db_schema):
+        yield
+
+
+def _values_from_event(table: Any) -> staticmethod[[Event], dict[str, Any]]:
+    """Return a values_from_event for an old schema table.
+
+    The values are taken from the row its from_event creates.
+    """
+    keys = [column.key for column in table.__table__.columns if not column.primary_key]
+
+    def values_from_event(event: Event) -> dict[str, Any]:
+        row = table.from_event(event)
+        return {key: getattr(row, key) for key in keys}
+
+    return staticmethod(values_from_event)
+
+
+@contextmanager
+def old_db_schema_values_from_event(old_db_schema: ModuleType) -> Iterator[None]:
+    """Let the recorder insert events and states rows with an old schema.
+
+    The old schemas are frozen, so the values_from_event the recorder
+    inserts rows with is patched onto their Events and States tables.
+    """
+    with patch.object(
+        old_db_schema.Events,
+        "values_from_event",
+        _values_from_event(old_db_schema.Events),
+        create=True,
+    ), patch.object(
+        old_db_schema.States,
+        "values_from_event",
+        _values_from_event(old_db_schema.States),
+        create=True,
     ):
         yield
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import sqlite3
 import threading
-from typing import cast
+from typing import Any, cast
 from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -26,6 +26,7 @@ from homeassistant.components.recorder import (
     DOMAIN,
     SQLITE_URL_PREFIX,
     Recorder,
+    core,
     get_instance,
     migration,
     pool,
@@ -342,6 +343,148 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_events_in_batches(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test events queued together are written as one batch."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    batches_before = instance.event_batches
+
+    await async_block_recorder(hass, 0.1)
+    for idx in range(10):
+        hass.states.async_set("test.recorder", str(idx), attributes)
+        hass.bus.async_fire("test_event", {"idx": idx % 2})
+    await async_wait_recording_done(hass)
+
+    assert instance.event_batches == batches_before + 1
+    assert instance.event_stage_timings["serialize"] > 0
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == [
+            str(idx) for idx in range(10)
+        ]
+        assert len({db_state.attributes_id for db_state in db_states}) == 1
+        assert db_states[0].old_state_id is None
+        for old_db_state, db_state in zip(db_states, db_states[1:]):
+            assert db_state.old_state_id == old_db_state.state_id
+        db_events = list(
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "test_event")
+        )
+        assert len(db_events) == 10
+        assert len({db_event.data_id for db_event in db_events}) == 2
+
+
+async def test_saving_events_in_batches_with_failing_event(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an event failing in a batch does not drop the rest of the batch."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    process_event = instance._process_non_state_changed_event_into_session
+    serialize = instance.event_data_manager.serialize_from_event
+
+    def _process_event(event: Event, *args: Any) -> None:
+        if event.data["idx"] == 3:
+            raise ValueError("process failed")
+        process_event(event, *args)
+
+    def _serialize(event: Event) -> bytes | None:
+        if event.data["idx"] == 6:
+            raise ValueError("serialize failed")
+        return serialize(event)
+
+    await async_block_recorder(hass, 0.1)
+    for idx in range(10):
+        hass.states.async_set("test.recorder", str(idx))
+        hass.bus.async_fire("test_event", {"idx": idx})
+    with patch.object(
+        instance, "_process_non_state_changed_event_into_session", _process_event
+    ), patch.object(instance.event_data_manager, "serialize_from_event", _serialize):
+        await async_wait_recording_done(hass)
+
+    assert "process failed" in caplog.text
+    assert "serialize failed" in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 10
+        db_events = list(
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "test_event")
+        )
+        assert len(db_events) == 8
+
+
+async def test_saving_states_retry_relinks_old_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a retried commit links old states to the rows it inserted."""
+    instance = await async_setup_recorder_instance(hass)
+    insert_states_rows = instance._insert_states_rows
+    calls = 0
+
+    def _fail_second_insert(*args: Any) -> list[int]:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return insert_states_rows(*args)
+
+    await async_block_recorder(hass, 0.1)
+    hass.states.async_set("test.recorder", "1")
+    hass.states.async_set("test.recorder", "2")
+    with patch("time.sleep"), patch.object(
+        instance, "_insert_states_rows", _fail_second_insert
+    ):
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert db_states[-1].state == "2"
+        assert db_states[-2].state == "1"
+        assert db_states[-1].old_state_id == db_states[-2].state_id
+
+
+async def test_saving_states_with_multi_row_returning(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states are linked when inserted with multi-row INSERT RETURNING."""
+    instance = await async_setup_recorder_instance(hass)
+
+    with patch.object(
+        instance.engine.dialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        False,
+    ), patch.object(core, "MAX_STATES_ROWS_PER_INSERT", 3):
+        await async_block_recorder(hass, 0.1)
+        for idx in range(5):
+            hass.states.async_set("test.one", str(idx))
+            hass.states.async_set("test.two", str(idx))
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        for entity_id in ("test.one", "test.two"):
+            db_states = list(
+                session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == entity_id)
+                .order_by(States.state_id)
+            )
+            assert [db_state.state for db_state in db_states] == [
+                str(idx) for idx in range(5)
+            ]
+            for old_db_state, db_state in zip(db_states, db_states[1:]):
+                assert db_state.old_state_id == old_db_state.state_id
+
+
 async def test_saving_state_with_intermixed_time_changes(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -378,17 +521,14 @@ def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_pending(*args, **kwargs):
+        if get_instance(hass)._pending_states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
         "flush",
-        side_effect=_throw_if_state_in_session,
+        side_effect=_throw_if_state_pending,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -420,17 +560,14 @@ def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_pending(*args, **kwargs):
+        if get_instance(hass)._pending_states:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
         "flush",
-        side_effect=_throw_if_state_in_session,
+        side_effect=_throw_if_state_pending,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -30,7 +30,11 @@ from homeassistant.core import HomeAssistant
 import homeassistant.util.dt as dt_util
 from homeassistant.util.ulid import bytes_to_ulid, ulid_at_time, ulid_to_bytes
 
-from .common import async_recorder_block_till_done, async_wait_recording_done
+from .common import (
+    async_recorder_block_till_done,
+    async_wait_recording_done,
+    old_db_schema_values_from_event,
+)
 
 from tests.typing import RecorderInstanceGenerator
 
@@ -83,7 +87,7 @@ def db_schema_32():
         core, "EntityIDMigrationTask", core.RecorderTask
     ), patch(
         CREATE_ENGINE_TARGET, new=_create_engine_test
-    ):
+    ), old_db_schema_values_from_event(old_db_schema):
         yield
 
 
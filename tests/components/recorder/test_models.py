@@ -15,6 +15,7 @@ from homeassistant.components.recorder.db_schema import (
 from homeassistant.components.recorder.models import (
     LazyState,
     bytes_to_ulid_or_none,
+    bytes_to_ulid_timestamp_or_none,
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -25,6 +26,7 @@ import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.util import dt as dt_util
+from homeassistant.util.ulid import ulid_at_time
 
 
 def test_from_event_to_db_event() -> None:
@@ -464,3 +466,11 @@ def test_bytes_to_ulid_or_none(caplog: pytest.LogCaptureFixture) -> None:
     assert bytes_to_ulid_or_none(b"invalid") is None
     assert "invalid" in caplog.text
     assert bytes_to_ulid_or_none(None) is None
+
+
+def test_bytes_to_ulid_timestamp_or_none() -> None:
+    """Test bytes_to_ulid_timestamp_or_none."""
+    ulid_bytes = ulid_to_bytes_or_none(ulid_at_time(1677000000.123))
+    assert bytes_to_ulid_timestamp_or_none(ulid_bytes) == 1677000000.123
+    assert bytes_to_ulid_timestamp_or_none(b"invalid") is None
+    assert bytes_to_ulid_timestamp_or_none(None) is None
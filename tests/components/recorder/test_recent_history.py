@@ -0,0 +1,189 @@
+"""The tests for the recorder recent history."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.recent_history import async_get_recent_history
+from homeassistant.const import (
+    ATTR_ATTRIBUTION,
+    ATTR_FRIENDLY_NAME,
+    EVENT_LOGBOOK_ENTRY,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+async def test_recent_history(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the recent history covers the events since the recorder started."""
+    before_start = dt_util.utcnow() - timedelta(seconds=1)
+    recent_history = async_get_recent_history(hass)
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("light.kitchen", "off")
+    freezer.tick(timedelta(seconds=1))
+    after_start = dt_util.utcnow()
+
+    assert recent_history.async_covers(["light.kitchen"], after_start)
+    assert not recent_history.async_covers(["light.kitchen"], before_start)
+    assert not recent_history.async_covers(["light.missing"], after_start)
+    assert recent_history.async_get_state("light.kitchen", after_start).state == "off"
+
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("light.kitchen", "on")
+    on_state = hass.states.get("light.kitchen")
+    hass.bus.async_fire(
+        EVENT_LOGBOOK_ENTRY, {"entity_id": "light.kitchen", "message": "hello"}
+    )
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("light.new", "on")
+    now = dt_util.utcnow()
+
+    assert recent_history.async_covers(["light.kitchen", "light.new"], after_start)
+    assert recent_history.async_get_state("light.kitchen", after_start).state == "off"
+    assert recent_history.async_get_state("light.kitchen", now) is on_state
+    assert recent_history.async_get_state("light.new", after_start) is None
+    events = recent_history.async_get_events(
+        ["light.kitchen", "light.new"], after_start, now
+    )
+    assert [event.event_type for event in events] == [
+        "state_changed",
+        EVENT_LOGBOOK_ENTRY,
+        "state_changed",
+    ]
+    assert recent_history.async_get_events(["light.kitchen"], now, now) == []
+
+    hass.states.async_remove("light.new")
+    assert not recent_history.async_covers(["light.new"], after_start)
+    assert recent_history.async_get_events(["light.new"], after_start, now) == []
+
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("light.new", "off")
+    assert not recent_history.async_covers(["light.new"], after_start)
+    assert recent_history.async_covers(["light.new"], dt_util.utcnow())
+
+
+async def test_recent_history_forgets_oldest_events(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the recent history no longer covers a period once it is full."""
+    with patch(
+        "homeassistant.components.recorder.recent_history.RECENT_HISTORY_MAX_EVENTS",
+        3,
+    ):
+        recent_history = async_get_recent_history(hass)
+        freezer.tick(timedelta(seconds=1))
+        start = dt_util.utcnow()
+        for state in ("1", "2", "3"):
+            freezer.tick(timedelta(seconds=1))
+            hass.states.async_set("sensor.busy", state)
+        assert recent_history.async_covers(["sensor.busy"], start)
+
+        freezer.tick(timedelta(seconds=1))
+        hass.states.async_set("sensor.busy", "4")
+        assert not recent_history.async_covers(["sensor.busy"], start)
+        assert recent_history.async_covers(
+            ["sensor.busy"], start + timedelta(seconds=1)
+        )
+        assert (
+            recent_history.async_get_state(
+                "sensor.busy", start + timedelta(seconds=1)
+            ).state
+            == "1"
+        )
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"exclude": {"entities": ["sensor.excluded"]}}]
+)
+async def test_recent_history_excluded_entities(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the recent history does not cover entities the recorder excludes."""
+    recent_history = async_get_recent_history(hass)
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.excluded", "on")
+    hass.states.async_set("sensor.included", "on")
+    assert recent_history.async_covers(["sensor.included"], start)
+    assert not recent_history.async_covers(["sensor.excluded"], start)
+    assert recent_history.async_get_events(["sensor.excluded"], start, start) == []
+
+
+async def test_recent_history_stops_with_recorder(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the recent history stops when the recorder stops listening."""
+    recent_history = async_get_recent_history(hass)
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on")
+    assert recent_history.async_covers(["light.kitchen"], start)
+
+    recorder_mock._async_stop_queue_watcher_and_event_listener()
+    assert not recent_history.async_covers(["light.kitchen"], start)
+    assert recent_history.async_get_events(["light.kitchen"], start, start) == []
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("light.kitchen", "off")
+    assert recent_history.async_get_events(
+        ["light.kitchen"], start, dt_util.utcnow()
+    ) == []
+
+
+async def test_recent_history_recorded_attributes(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the recorded attributes exclude what the recorder does not write."""
+    recent_history = async_get_recent_history(hass)
+    hass.states.async_set(
+        "light.kitchen",
+        "on",
+        {ATTR_ATTRIBUTION: "Powered by", ATTR_FRIENDLY_NAME: "Kitchen"},
+    )
+    assert recent_history.async_get_recorded_attributes(
+        hass.states.get("light.kitchen")
+    ) == {ATTR_FRIENDLY_NAME: "Kitchen"}
+
+    hass.states.async_set("light.kitchen", "on", {"too_large": "x" * 20000})
+    assert (
+        recent_history.async_get_recorded_attributes(hass.states.get("light.kitchen"))
+        == {}
+    )
+
+
+async def test_recent_history_forgets_old_events(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the recent history forgets old events and entities."""
+    recent_history = async_get_recent_history(hass)
+    # Let the timers scheduled before the time was frozen run
+    await hass.async_block_till_done()
+    with patch(
+        "homeassistant.components.recorder.recent_history.RECENT_HISTORY_MAX_AGE",
+        timedelta(minutes=5),
+    ):
+        start = dt_util.utcnow()
+        hass.states.async_set("light.old", "on")
+        freezer.tick(timedelta(minutes=8))
+        hass.states.async_set("light.recent", "on")
+        assert recent_history.async_covers(["light.old", "light.recent"], start)
+
+        # Pruned every ten minutes since the recorder started
+        freezer.tick(timedelta(minutes=3))
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+    assert not recent_history.async_covers(["light.old"], start)
+    assert not recent_history.async_covers(["light.recent"], start)
+    since = start + timedelta(minutes=7)
+    assert recent_history.async_covers(["light.old", "light.recent"], since)
+    assert recent_history.async_get_state("light.old", since).state == "on"
+    assert recent_history.async_get_state("light.recent", since) is None
+    assert [
+        event.data["entity_id"]
+        for event in recent_history.async_get_events(
+            ["light.old", "light.recent"], since, dt_util.utcnow()
+        )
+    ] == ["light.recent"]
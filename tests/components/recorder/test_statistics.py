@@ -1,6 +1,7 @@
 """The tests for sensor recorder platform."""
 from collections.abc import Callable
 from datetime import timedelta
+import itertools
 from unittest.mock import patch
 
 import pytest
@@ -8,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -221,6 +226,104 @@ def test_compile_hourly_statistics(hass_recorder: Callable[..., HomeAssistant])
     assert stats == {}
 
 
+def test_compile_hourly_statistics_accumulated(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test hourly statistics are compiled from the accumulated 5-minute statistics."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    setup_component(hass, "sensor", {})
+
+    def get_fake_stats(_hass, start, _end):
+        minute = start.minute
+        return statistics.PlatformCompiledStatistics(
+            [
+                {
+                    "meta": {
+                        "has_mean": True,
+                        "has_sum": False,
+                        "name": None,
+                        "source": "recorder",
+                        "statistic_id": "sensor.test1",
+                        "unit_of_measurement": "dogs",
+                    },
+                    "stat": {
+                        "start": start,
+                        "mean": minute,
+                        "min": minute - 1,
+                        "max": minute + 1,
+                    },
+                },
+                {
+                    "meta": {
+                        "has_mean": False,
+                        "has_sum": True,
+                        "name": None,
+                        "source": "recorder",
+                        "statistic_id": "sensor.test2",
+                        "unit_of_measurement": "dogs",
+                    },
+                    "stat": {"start": start, "state": minute, "sum": minute * 2},
+                },
+            ],
+            get_metadata(_hass, statistic_ids={"sensor.test1", "sensor.test2"}),
+        )
+
+    hour_1 = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+    hour_2 = hour_1 + timedelta(hours=1)
+    summary_stmt = statistics._compile_hourly_statistics_summary_mean_stmt
+    with patch(
+        "homeassistant.components.sensor.recorder.compile_statistics",
+        side_effect=get_fake_stats,
+    ), patch.object(
+        statistics,
+        "_compile_hourly_statistics_summary_mean_stmt",
+        wraps=summary_stmt,
+    ) as summary_stmt_mock:
+        for minutes in range(0, 60, 5):
+            do_adhoc_statistics(hass, start=hour_1 + timedelta(minutes=minutes))
+        wait_recording_done(hass)
+        # All periods were accumulated, the database is not queried
+        assert summary_stmt_mock.call_count == 0
+
+        for minutes in range(0, 60, 5):
+            do_adhoc_statistics(hass, start=hour_2 + timedelta(minutes=minutes))
+            if minutes == 30:
+                wait_recording_done(hass)
+                # The hourly statistics are queried from the database if
+                # the accumulated statistics were discarded
+                instance.hourly_statistics_accumulator.reset()
+        wait_recording_done(hass)
+        assert summary_stmt_mock.call_count == 1
+
+    stats = statistics_during_period(hass, hour_1, period="hour")
+    # The accumulated and the queried hourly statistics are the same
+    for hour in (hour_1, hour_2):
+        hour_ts = hour.timestamp()
+        assert {
+            "start": hour_ts,
+            "end": hour_ts + 3600,
+            "mean": pytest.approx(27.5),
+            "min": pytest.approx(-1.0),
+            "max": pytest.approx(56.0),
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        } in stats["sensor.test1"]
+        assert {
+            "start": hour_ts,
+            "end": hour_ts + 3600,
+            "mean": None,
+            "min": None,
+            "max": None,
+            "last_reset": None,
+            "state": pytest.approx(55.0),
+            "sum": pytest.approx(110.0),
+        } in stats["sensor.test2"]
+
+
 @pytest.fixture
 def mock_sensor_statistics():
     """Generate some fake statistics."""
@@ -1700,6 +1803,116 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-12-01 00:00:00+00:00")
+def test_statistics_rollups(
+    hass_recorder: Callable[..., HomeAssistant],
+    timezone,
+) -> None:
+    """Test daily, weekly and monthly statistics are served from the rollups."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    wait_recording_done(hass)
+    assert instance.statistics_rollups.active
+
+    zero = dt_util.utcnow() - timedelta(days=100)
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2022-09-25 00:00:00"))
+    external_statistics = [
+        {
+            "start": period1 + timedelta(hours=5 * i),
+            "last_reset": None,
+            "max": i + 1,
+            "mean": i,
+            "min": i - 1,
+            "state": i % 7,
+            "sum": 2 * i,
+        }
+        for i in range(300)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        # 300 * 5 hours span 63 days and three months
+        assert session.query(StatisticsDaily).count() == 63
+        assert session.query(StatisticsMonthly).count() == 3
+
+    def _assert_rollups_match_hourly_statistics() -> None:
+        for period, (start_time, end_time) in itertools.product(
+            ("day", "week", "month"),
+            (
+                (zero, None),
+                # Partial first and last periods
+                (
+                    period1 + timedelta(days=3, hours=13, minutes=7),
+                    period1 + timedelta(days=40, hours=5),
+                ),
+            ),
+        ):
+            stats = statistics_during_period(
+                hass,
+                start_time,
+                end_time,
+                period=period,
+                statistic_ids={"test:total_energy_import"},
+                types={"change", "max", "mean", "min", "state", "sum"},
+            )
+            instance.statistics_rollups.active = False
+            expected_stats = statistics_during_period(
+                hass,
+                start_time,
+                end_time,
+                period=period,
+                statistic_ids={"test:total_energy_import"},
+                types={"change", "max", "mean", "min", "state", "sum"},
+            )
+            instance.statistics_rollups.active = True
+            assert stats == pytest.approx(expected_stats)
+            assert len(stats["test:total_energy_import"]) > 1
+
+    _assert_rollups_match_hourly_statistics()
+
+    # Adjusting the sum updates the adjusted and later days and months
+    hass.add_job(
+        instance.async_adjust_statistics,
+        "test:total_energy_import",
+        period1 + timedelta(days=20, hours=3),
+        100,
+        "kWh",
+    )
+    wait_recording_done(hass)
+    _assert_rollups_match_hourly_statistics()
+
+    # Rollups compiled for another time zone are rebuilt
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Asia/Kolkata"))
+    with patch.object(instance, "queue_task") as queue_task_mock:
+        statistics_during_period(hass, zero, period="month")
+        assert not instance.statistics_rollups.active
+        # The rollups are rebuilt one month at a time, newest month first
+        for months in (1, 2, 3):
+            assert len(queue_task_mock.mock_calls) == months
+            queue_task_mock.mock_calls[-1].args[0].run(instance)
+            with session_scope(hass=hass, read_only=True) as session:
+                assert session.query(StatisticsMonthly).count() == months
+    assert len(queue_task_mock.mock_calls) == 3
+    assert instance.statistics_rollups.active
+    with session_scope(hass=hass, read_only=True) as session:
+        assert statistics.statistics_rollups_complete(session)
+    _assert_rollups_match_hourly_statistics()
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
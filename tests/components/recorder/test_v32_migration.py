@@ -19,7 +19,7 @@ from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
-from .common import async_wait_recording_done
+from .common import async_wait_recording_done, old_db_schema_values_from_event
 
 from tests.common import async_test_home_assistant
 
@@ -106,7 +106,7 @@ async def test_migrate_times(caplog: pytest.LogCaptureFixture, tmp_path: Path) -
         core, "Events", old_db_schema.Events
     ), patch(
         CREATE_ENGINE_TARGET, new=_create_engine_test
-    ), patch(
+    ), old_db_schema_values_from_event(old_db_schema), patch(
         "homeassistant.components.recorder.Recorder._migrate_events_context_ids",
     ), patch(
         "homeassistant.components.recorder.Recorder._migrate_states_context_ids",
@@ -277,7 +277,7 @@ async def test_migrate_can_resume_entity_id_post_migration(
         core, "Events", old_db_schema.Events
     ), patch(
         CREATE_ENGINE_TARGET, new=_create_engine_test
-    ), patch(
+    ), old_db_schema_values_from_event(old_db_schema), patch(
         "homeassistant.components.recorder.Recorder._migrate_events_context_ids",
     ), patch(
         "homeassistant.components.recorder.Recorder._migrate_states_context_ids",
@@ -4006,6 +4006,68 @@ def test_compile_statistics_hourly_daily_monthly_summary(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_hourly_updates_daily_monthly_summary(
+    hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiled hours are folded into the daily and monthly summary."""
+    # September 1st, 12:00 local time
+    zero = dt_util.utcnow().replace(
+        year=2021, month=9, day=1, hour=18, minute=0, second=0, microsecond=0
+    )
+    with freeze_time(zero):
+        hass = hass_recorder()
+        # Remove this after dropping the use of the hass_recorder fixture
+        hass.config.set_time_zone("America/Regina")
+    instance = get_instance(hass)
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    assert instance.statistics_rollups.active
+    attributes = {
+        "device_class": None,
+        "state_class": "measurement",
+        "unit_of_measurement": "%",
+    }
+    sum_attributes = {
+        "device_class": None,
+        "state_class": "total",
+        "unit_of_measurement": "EUR",
+    }
+
+    # Generate states and 5-minute statistics for three hours
+    start = zero
+    with freeze_time(start) as freezer:
+        for i in range(36):
+            record_states(
+                hass, freezer, start, "sensor.test1", attributes, [i - 10, 2 * i, 5]
+            )
+            record_meter_state(
+                hass, freezer, start, "sensor.test2", sum_attributes, [i]
+            )
+            start += timedelta(minutes=5)
+    wait_recording_done(hass)
+    with patch(
+        "homeassistant.components.recorder.statistics._compile_statistics_rollup"
+    ) as compile_rollup_mock:
+        start = zero
+        for _ in range(36):
+            do_adhoc_statistics(hass, start=start)
+            wait_recording_done(hass)
+            start += timedelta(minutes=5)
+    # The hours are folded in without reducing the whole day and month again
+    compile_rollup_mock.assert_not_called()
+
+    for period in ("day", "month"):
+        stats = statistics_during_period(hass, zero, period=period)
+        instance.statistics_rollups.active = False
+        expected_stats = statistics_during_period(hass, zero, period=period)
+        instance.statistics_rollups.active = True
+        assert stats == pytest.approx(expected_stats)
+        assert len(stats["sensor.test1"]) == 1
+        assert len(stats["sensor.test2"]) == 1
+
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 def record_states(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -10,20 +10,21 @@ import voluptuous as vol
 
 from homeassistant import config_entries, loader
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import commands, const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -31,6 +32,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1128,6 +1130,157 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+
+async def test_subscribe_entities_shared_listener(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe_entities subscriptions share a single state listener."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.other", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True, "light.other": True}}}
+    )
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    clients = [await hass_ws_client(hass) for _ in range(3)]
+    for client, entity_ids in zip(clients, (None, ["light.permitted"], None)):
+        message = {"id": 7, "type": "subscribe_entities"}
+        if entity_ids:
+            message["entity_ids"] = entity_ids
+        await client.send_json(message)
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["type"] == "event"
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "on")
+    for client in (clients[0], clients[2]):
+        msg = await client.receive_json()
+        assert list(msg["event"]["c"]) == ["light.other"]
+    for client in clients:
+        msg = await client.receive_json()
+        assert list(msg["event"]["c"]) == ["light.permitted"]
+
+    # Cached permission checks are invalidated when the permissions change
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.other": True}}})
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.other", "off")
+    for client in (clients[0], clients[2]):
+        msg = await client.receive_json()
+        assert list(msg["event"]["c"]) == ["light.other"]
+
+    await clients[0].send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await clients[0].receive_json()
+    assert msg["success"]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    for client in clients[1:]:
+        await client.send_json(
+            {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+
+
+async def test_subscribe_entities_forward_error(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a subscription failing to forward does not affect the others."""
+    hass.states.async_set("light.permitted", "off")
+    clients = [await hass_ws_client(hass) for _ in range(2)]
+    for client, msg_id in zip(clients, (7, 8)):
+        await client.send_json({"id": msg_id, "type": "subscribe_entities"})
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["type"] == "event"
+
+    async_forward = commands._EntitySubscription.async_forward
+
+    def _async_forward(subscription, event):
+        if subscription.msg_id == 7:
+            raise ValueError("Boom")
+        async_forward(subscription, event)
+
+    with patch.object(commands._EntitySubscription, "async_forward", _async_forward):
+        hass.states.async_set("light.permitted", "on")
+    msg = await clients[1].receive_json()
+    assert msg["id"] == 8
+    assert list(msg["event"]["c"]) == ["light.permitted"]
+    assert (
+        "Error forwarding state change of light.permitted to subscription 7"
+        in caplog.text
+    )
+
+
+async def test_subscribe_entities_coalesce_window(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test changes within the coalesce window are merged in one message."""
+    hass.states.async_set("sensor.power", "100", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.removed", "1")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_window": 250}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"sensor.power", "sensor.removed"}
+
+    for power in range(101, 110):
+        hass.states.async_set("sensor.power", str(power), {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "110", {"unit_of_measurement": "kW"})
+    hass.states.async_remove("sensor.removed")
+    hass.states.async_set("sensor.added", "on")
+    hass.states.async_set("sensor.short_lived", "on")
+    hass.states.async_remove("sensor.short_lived")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(seconds=1))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"sensor.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "sensor.power": {
+                "+": {
+                    "a": {"unit_of_measurement": "kW"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "s": "110",
+                }
+            }
+        },
+        "r": ["sensor.removed"],
+    }
+
+    hass.states.async_set("sensor.power", "111", {"unit_of_measurement": "kW"})
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(seconds=2))
+    hass.states.async_set("sensor.power", "112", {"unit_of_measurement": "kW"})
+    await websocket_client.send_json({"id": 9, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -1309,7 +1462,11 @@ EVENT_UNDEFINED_FILTER = {
                 {"type": "event", "event": EVENT_UNDEFINED_VAR_WARN},
                 {
                     "type": "event",
-                    "event": {"result": "", "listeners": EMPTY_LISTENERS},
+                    "event": {
+                        "result": "",
+                        "listeners": EMPTY_LISTENERS,
+                        "render_cache": {"hits": 0, "misses": 1},
+                    },
                 },
             ],
         ),
@@ -1382,7 +1539,11 @@ async def test_render_template_with_error(
                 {"type": "event", "event": EVENT_UNDEFINED_VAR_WARN},
                 {
                     "type": "event",
-                    "event": {"result": "", "listeners": EMPTY_LISTENERS},
+                    "event": {
+                        "result": "",
+                        "listeners": EMPTY_LISTENERS,
+                        "render_cache": {"hits": 0, "misses": 1},
+                    },
                 },
             ],
         ),
@@ -1614,6 +1775,7 @@ async def test_render_template_strict_with_timeout_and_error_2(
                     "event": {
                         "result": 3.0,
                         "listeners": EMPTY_LISTENERS | {"entities": ["sensor.foo"]},
+                        "render_cache": {"hits": 0, "misses": 2},
                     },
                 },
             ],
@@ -1771,6 +1933,8 @@ async def test_render_template_with_delayed_error(
             "entities": ["sensor.test"],
             "time": False,
         },
+        # The refresh after subscribing reuses the first render
+        "render_cache": {"hits": 1, "misses": 0},
     }
 
     msg = await websocket_client.receive_json()
@@ -3,6 +3,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -16,6 +17,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -431,6 +433,44 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_compressed_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test large messages are sent compressed when the client supports it."""
+    for idx in range(1000):
+        hass.states.async_set(f"sensor.sensor_{idx}", "on", {"index": idx})
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json({"id": 1, "type": "get_states"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert len(json_loads(msg.data)["result"]) == 1000
+
+    await websocket_client.send_json(
+        {
+            "id": 2,
+            "type": "supported_features",
+            "features": {const.FEATURE_COMPRESSED_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 2
+    assert msg["success"] is True
+
+    await websocket_client.send_json({"id": 3, "type": "get_states"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert len(msg.data) < const.COMPRESSED_MESSAGE_MIN_SIZE
+    result = json_loads(zlib.decompress(msg.data))
+    assert result["id"] == 3
+    assert len(result["result"]) == 1000
+
+    # Small messages are not compressed
+    await websocket_client.send_json({"id": 4, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg == {"id": 4, "type": "pong"}
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1877,3 +1877,54 @@ async def test_loading_invalid_configuration_url_from_storage(
         identifiers={("serial", "12:34:56:AB:CD:EF")},
     )
     assert entry.configuration_url == "invalid"
+
+
+async def test_entries_for_area_and_config_entry(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test looking up devices by area and config entry."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+
+    entry1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    entry1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id,
+        identifiers={("bridgeid", "4567")},
+    )
+    entry1 = device_registry.async_update_device(entry1.id, area_id="kitchen")
+
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [entry1]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [entry1]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [entry1, entry2]
+
+    device_registry.async_clear_area_id("kitchen")
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+
+    device_registry.async_clear_config_entry(config_entry_2.entry_id)
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == []
+    assert [
+        device.id
+        for device in dr.async_entries_for_config_entry(
+            device_registry, config_entry_1.entry_id
+        )
+    ] == [entry1.id]
+
+    device_registry.async_remove_device(entry1.id)
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == []
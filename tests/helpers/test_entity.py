@@ -15,6 +15,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -120,11 +121,9 @@ class TestHelpersEntity:
         """Test device class attribute."""
         state = self.hass.states.get(self.entity.entity_id)
         assert state.attributes.get(ATTR_DEVICE_CLASS) is None
-        with patch(
-            "homeassistant.helpers.entity.Entity.device_class", new="test_class"
-        ):
-            self.entity.schedule_update_ha_state()
-            self.hass.block_till_done()
+        self.entity._attr_device_class = "test_class"
+        self.entity.schedule_update_ha_state()
+        self.hass.block_till_done()
         state = self.hass.states.get(self.entity.entity_id)
         assert state.attributes.get(ATTR_DEVICE_CLASS) == "test_class"
 
@@ -894,6 +893,121 @@ async def test_attribution_attribute(hass: HomeAssistant) -> None:
     assert state.attributes.get(ATTR_ATTRIBUTION) == "Home Assistant"
 
 
+async def test_static_attributes_cached(hass: HomeAssistant) -> None:
+    """Test static state attributes are cached until one of their sources is set."""
+    icon_calls = 0
+
+    class StaticIconEntity(entity.Entity):
+        """Entity with a static icon."""
+
+        _static_attribute_members = {"icon": ()}
+
+        @property
+        def icon(self) -> str | None:
+            """Return the icon."""
+            nonlocal icon_calls
+            icon_calls += 1
+            return self._attr_icon
+
+    class DynamicIconEntity(entity.Entity):
+        """Entity with an icon which depends on its state."""
+
+        @property
+        def icon(self) -> str | None:
+            """Return the icon."""
+            return f"mdi:numeric-{self.state}"
+
+    static_entity = StaticIconEntity()
+    static_entity.hass = hass
+    static_entity.entity_id = "hello.static"
+    static_entity._attr_icon = "mdi:flash"
+    static_entity._attr_name = "Static"
+    dynamic_entity = DynamicIconEntity()
+    dynamic_entity.hass = hass
+    dynamic_entity.entity_id = "hello.dynamic"
+
+    for value in (1, 2):
+        static_entity._attr_state = value
+        static_entity.async_write_ha_state()
+        dynamic_entity._attr_state = value
+        dynamic_entity.async_write_ha_state()
+
+    assert icon_calls == 1
+    assert hass.states.get("hello.static").attributes == {
+        ATTR_FRIENDLY_NAME: "Static",
+        ATTR_ICON: "mdi:flash",
+    }
+    assert hass.states.get("hello.dynamic").attributes == {ATTR_ICON: "mdi:numeric-2"}
+
+    static_entity._attr_icon = "mdi:flash-off"
+    static_entity.async_write_ha_state()
+    assert icon_calls == 2
+    assert hass.states.get("hello.static").attributes[ATTR_ICON] == "mdi:flash-off"
+
+    del static_entity._attr_name
+    static_entity.async_write_ha_state()
+    assert icon_calls == 3
+    assert ATTR_FRIENDLY_NAME not in hass.states.get("hello.static").attributes
+
+
+async def test_static_attributes_cached_mixin_sources(hass: HomeAssistant) -> None:
+    """Test sources set as class attributes by a mixin invalidate the cache."""
+
+    class IconMixin:
+        """Mixin setting the icon."""
+
+        _attr_icon = "mdi:flash"
+
+    class MixinEntity(IconMixin, entity.Entity):
+        """Entity with the icon of a mixin."""
+
+    mixin_entity = MixinEntity()
+    mixin_entity.hass = hass
+    mixin_entity.entity_id = "hello.mixin"
+    mixin_entity.async_write_ha_state()
+    assert hass.states.get("hello.mixin").attributes == {ATTR_ICON: "mdi:flash"}
+
+    mixin_entity._attr_icon = "mdi:flash-off"
+    mixin_entity.async_write_ha_state()
+    assert hass.states.get("hello.mixin").attributes == {ATTR_ICON: "mdi:flash-off"}
+    assert MixinEntity._attr_icon == "mdi:flash"
+
+
+async def test_identical_state_writes_skipped(hass: HomeAssistant) -> None:
+    """Test writing the state an entity wrote last time is skipped."""
+    platform = MockEntityPlatform(hass)
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.platform = platform
+    ent.entity_id = "hello.world"
+    ent._attr_state = "on"
+    ent._attr_extra_state_attributes = {"level": 1}
+
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world") is state
+    assert platform.skipped_state_writes == 1
+
+    ent._attr_extra_state_attributes["level"] = 2
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes["level"] == 2
+    assert platform.skipped_state_writes == 1
+
+    # Someone else wrote the state of the entity
+    hass.states.async_set("hello.world", "off")
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == "on"
+    assert platform.skipped_state_writes == 1
+
+    state = hass.states.get("hello.world")
+    ent._attr_force_update = True
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world") is not state
+    assert platform.skipped_state_writes == 1
+
+
 async def test_entity_category_property(hass: HomeAssistant) -> None:
     """Test entity category property."""
     mock_entity1 = entity.Entity()
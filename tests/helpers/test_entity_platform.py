@@ -170,7 +170,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_call_at")
 async def test_set_scan_interval_via_platform(
     mock_track: Mock, hass: HomeAssistant
 ) -> None:
@@ -196,7 +196,7 @@ async def test_set_scan_interval_via_platform(
 
     await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert mock_track.call_args[0][2] - hass.loop.time() == pytest.approx(30, abs=1)
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -516,6 +516,188 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
     assert peak_update_count == 1
 
 
+async def test_polling_spread_over_scan_interval(hass: HomeAssistant) -> None:
+    """Test platforms with many polling entities spread their updates."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    updated = []
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            updated.append(self.entity_id)
+
+    await component.async_add_entities(
+        [
+            AsyncEntity(should_poll=True)
+            for _ in range(entity_platform.POLL_SPREAD_MIN_ENTITIES)
+        ]
+    )
+    now = dt_util.utcnow()
+
+    # The updates are spread over the half of the interval before polls are due
+    async_fire_time_changed(hass, now + timedelta(seconds=9))
+    await hass.async_block_till_done()
+    assert not updated
+
+    async_fire_time_changed(hass, now + timedelta(seconds=14.5))
+    await hass.async_block_till_done()
+    assert 0 < len(updated) < entity_platform.POLL_SPREAD_MIN_ENTITIES
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert len(set(updated)) == len(updated) == entity_platform.POLL_SPREAD_MIN_ENTITIES
+
+    updated.clear()
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert len(set(updated)) == len(updated) == entity_platform.POLL_SPREAD_MIN_ENTITIES
+
+    await component.async_remove_entity(updated[0])
+    updated.clear()
+    async_fire_time_changed(hass, now + timedelta(seconds=60))
+    await hass.async_block_till_done()
+    assert len(updated) == entity_platform.POLL_SPREAD_MIN_ENTITIES - 1
+
+    platform = list(component._platforms.values())[0]
+    await platform.async_reset()
+    updated.clear()
+    async_fire_time_changed(hass, now + timedelta(seconds=80))
+    await hass.async_block_till_done()
+    assert not updated
+
+
+async def test_polling_spread_slot_after_poll(hass: HomeAssistant) -> None:
+    """Test entities whose slot comes after the next poll are updated once."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    updated = []
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            updated.append(self.entity_id)
+
+    await component.async_add_entities(
+        [
+            AsyncEntity(should_poll=True)
+            for _ in range(entity_platform.POLL_SPREAD_MIN_ENTITIES)
+        ]
+    )
+    now = dt_util.utcnow()
+    platform = list(component._platforms.values())[0]
+    handles = platform._poll_round_handles
+    late_entity = next(iter(handles))
+    handles[late_entity].cancel()
+    handles[late_entity] = hass.loop.call_at(
+        hass.loop.time() + 25,
+        platform._async_poll_scheduled_entity,
+        late_entity,
+    )
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert len(set(updated)) == len(updated) == entity_platform.POLL_SPREAD_MIN_ENTITIES
+
+    # The late slot was cancelled, the entity is only updated in the next round
+    updated.clear()
+    async_fire_time_changed(hass, now + timedelta(seconds=25))
+    await hass.async_block_till_done()
+    assert len(set(updated)) == len(updated) == entity_platform.POLL_SPREAD_MIN_ENTITIES
+    await platform.async_reset()
+
+
+async def test_poll_limiter(hass: HomeAssistant) -> None:
+    """Test lowering the limit of concurrent polls holds back waiting polls."""
+    limiter = entity_platform._PollLimiter(2)
+    running = peak = 0
+    release = asyncio.Event()
+
+    async def poll() -> None:
+        nonlocal running, peak
+        async with limiter:
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+    tasks = [asyncio.create_task(poll()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert running == peak == 2
+
+    # Cancelled polls stop waiting without holding back the others
+    tasks[2].cancel()
+    limiter.async_set_limit(1)
+    peak = 0
+    release.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert tasks[2].cancelled()
+    assert peak == 1
+    assert running == 0
+
+    async with limiter:
+        pass
+
+
+async def test_poll_concurrency_adapts(hass: HomeAssistant) -> None:
+    """Test the limit of concurrent polls adapts to failures and latency."""
+    platform = MockEntityPlatform(hass)
+    updating = []
+    peak_update_count = 0
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        fail = False
+
+        async def async_update(self):
+            nonlocal peak_update_count
+            updating.append(self.entity_id)
+            await asyncio.sleep(0)
+            peak_update_count = max(len(updating), peak_update_count)
+            await asyncio.sleep(0)
+            updating.remove(self.entity_id)
+            if self.fail:
+                raise HomeAssistantError("Fake error update")
+
+    entities = [AsyncEntity(should_poll=True) for _ in range(4)]
+    await platform.async_add_entities(entities)
+    assert platform.poll_concurrency is None
+
+    await platform._update_entity_states(dt_util.utcnow())
+    assert peak_update_count == 4
+    assert platform.poll_concurrency == 4
+    assert sum(platform.poll_durations) == 4
+
+    # New failures halve the limit
+    entities[0].fail = entities[1].fail = True
+    await platform._update_entity_states(dt_util.utcnow())
+    assert platform.failed_updates == 2
+    assert platform.poll_concurrency == 2
+
+    # Steady failures raise it again
+    peak_update_count = 0
+    await platform._update_entity_states(dt_util.utcnow())
+    assert peak_update_count == 2
+    assert platform.poll_concurrency == 3
+
+    # Slower polls halve the limit
+    platform._poll_reference_duration = 1e-12
+    with patch.object(entity_platform, "POLL_BACKOFF_MIN_DURATION", 0):
+        await platform._update_entity_states(dt_util.utcnow())
+    assert platform.poll_concurrency == 1
+
+    entities[0].fail = entities[1].fail = False
+    await platform._update_entity_states(dt_util.utcnow())
+    assert platform.poll_concurrency == 2
+    assert platform.failed_updates == 6
+    assert sum(platform.poll_durations) == 20
+
+
 async def test_raise_error_on_update(hass: HomeAssistant) -> None:
     """Test the add entity if they raise an error on update."""
     updates = []
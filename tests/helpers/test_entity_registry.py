@@ -1475,6 +1475,44 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_indexes() -> None:
+    """Test the device, area and config entry indexes of EntityRegistryItems."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        device_id="device",
+        area_id="kitchen",
+        config_entry_id="entry",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        device_id="device",
+        config_entry_id="entry",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device") == [entry1]
+    assert entities.get_entries_for_device_id("device", True) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry") == [entry1, entry2]
+
+    moved_entry1 = attr.evolve(entry1, area_id="garage", config_entry_id=None)
+    entities["test.entity1"] = moved_entry1
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("garage") == [moved_entry1]
+    assert entities.get_entries_for_config_entry_id("entry") == [entry2]
+
+    del entities["test.entity2"]
+    assert entities.get_entries_for_device_id("device", True) == [moved_entry1]
+    assert entities.get_entries_for_config_entry_id("entry") == []
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
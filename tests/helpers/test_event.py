@@ -13,7 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
@@ -537,6 +537,34 @@ async def test_async_track_state_change_event_with_empty_list(
     unsub_single()
 
 
+async def test_async_track_state_change_event_indexed_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test the tracked entities share a single indexed state_changed listener."""
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    calls = []
+
+    @ha.callback
+    def run_callback(event: EventType[EventStateChangedData]) -> None:
+        calls.append(event)
+
+    unsub_light = async_track_state_change_event(
+        hass, ["light.bowl", "light.desk"], run_callback
+    )
+    unsub_bowl = async_track_state_change_event(hass, "light.bowl", run_callback)
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.bowl", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    unsub_light()
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+    unsub_bowl()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+
+
 async def test_async_track_state_added_domain(hass: HomeAssistant) -> None:
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
@@ -3100,6 +3128,119 @@ async def test_track_template_result_refresh_cancel(hass: HomeAssistant) -> None
     assert refresh_runs == ["duck"]
 
 
+async def test_track_template_result_render_cache(hass: HomeAssistant) -> None:
+    """Test refreshing reuses the last render while its inputs are unchanged."""
+    template_entity = Template("{{ states('sensor.a') }}", hass)
+    template_domain = Template(
+        "{{ states.light | map(attribute='state') | list }}", hass
+    )
+    template_random = Template("{{ states('sensor.a') ~ [1, 2] | random }}", hass)
+    template_variables = Template("{{ value }}", hass)
+    variables = {"value": "duck"}
+
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.extend(update.result for update in updates)
+
+    hass.states.async_set("sensor.a", "1")
+    hass.states.async_set("light.a", "on")
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_entity, None),
+            TrackTemplate(template_domain, None, timedelta(0)),
+            TrackTemplate(template_variables, variables),
+        ],
+        refresh_listener,
+    )
+    info.async_refresh()
+    await hass.async_block_till_done()
+    assert refresh_runs == [1, ["on"], "duck"]
+    assert info.render_cache == {"hits": 3, "misses": 0}
+
+    # Unrelated states do not change the inputs
+    hass.states.async_set("sensor.b", "1")
+    await hass.async_block_till_done()
+    info.async_refresh()
+    assert info.render_cache == {"hits": 6, "misses": 0}
+
+    hass.states.async_set("sensor.a", "2")
+    hass.states.async_set("light.b", "off")
+    await hass.async_block_till_done()
+    assert refresh_runs == [1, ["on"], "duck", 2, ["on", "off"]]
+    assert info.render_cache == {"hits": 6, "misses": 2}
+
+    variables["value"] = "goose"
+    info.async_refresh()
+    assert refresh_runs == [1, ["on"], "duck", 2, ["on", "off"], "goose"]
+    assert info.render_cache == {"hits": 8, "misses": 3}
+    info.async_remove()
+
+    # Random values are never reused
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_random, None)], refresh_listener
+    )
+    info.async_refresh()
+    info.async_refresh()
+    assert info.render_cache == {"hits": 0, "misses": 2}
+    info.async_remove()
+
+
+async def test_track_template_result_render_cache_nested_variables(
+    hass: HomeAssistant,
+) -> None:
+    """Test changing nested variables or unknown objects are never reused stale."""
+
+    class Duck:
+        """Object the template reads an attribute of."""
+
+        name = "duck"
+
+    template_nested = Template("{{ trigger.to_state.state ~ trigger.ids[0] }}", hass)
+    template_object = Template("{{ bird.name }}", hass)
+    nested_variables = {"trigger": {"to_state": None, "ids": ["a"]}}
+    bird = Duck()
+
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.extend(update.result for update in updates)
+
+    hass.states.async_set("sensor.a", "1")
+    nested_variables["trigger"]["to_state"] = hass.states.get("sensor.a")
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_nested, nested_variables),
+            TrackTemplate(template_object, {"bird": bird}),
+        ],
+        refresh_listener,
+    )
+    info.async_refresh()
+    assert info.render_cache == {"hits": 1, "misses": 1}
+
+    nested_variables["trigger"]["ids"].append("b")
+    info.async_refresh()
+    assert info.render_cache == {"hits": 1, "misses": 3}
+
+    nested_variables["trigger"]["ids"][0] = "c"
+    bird.name = "goose"
+    info.async_refresh()
+    await hass.async_block_till_done()
+    assert refresh_runs == ["1a", "duck", "1c", "goose"]
+    assert info.render_cache == {"hits": 1, "misses": 5}
+    info.async_remove()
+
+
 async def test_async_track_template_result_multiple_templates(
     hass: HomeAssistant,
 ) -> None:
@@ -733,3 +733,143 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends changes and replays them on load."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    def _read(path: str) -> str:
+        with open(path, encoding="utf-8") as fdesc:
+            return fdesc.read()
+
+    items = [{"id": str(idx), "name": f"Item {idx}"} for idx in range(50)]
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save({"items": items, "deleted": [], "other": 1})
+    snapshot = await hass.async_add_executor_job(_read, store.path)
+    assert json.loads(snapshot)["journal_seq"] == 1
+    assert not os.path.exists(store.journal_path)
+
+    items = [*items[:10], {"id": "10", "name": "Renamed"}, *items[11:]]
+    await store.async_save({"items": items, "deleted": [], "other": 1})
+    # Saving the same data does not append to the journal
+    await store.async_save({"items": items, "deleted": [], "other": 1})
+    assert await hass.async_add_executor_job(_read, store.path) == snapshot
+    journal = await hass.async_add_executor_job(_read, store.journal_path)
+    assert journal == (
+        '{"seq":2,"ops":[["l","items",10,1,[{"id":"10","name":"Renamed"}]]]}\n'
+    )
+
+    # A new store replays the journal on the snapshot and keeps appending to it
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store.async_load() == {"items": items, "deleted": [], "other": 1}
+    items = items[1:] + [{"id": "50", "name": "Item 50"}]
+    await store.async_save({"items": items, "deleted": [{"id": "0"}], "new": True})
+    assert await hass.async_add_executor_job(_read, store.path) == snapshot
+    journal = await hass.async_add_executor_job(_read, store.journal_path)
+    assert len(journal.splitlines()) == 2
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store.async_load() == {
+        "items": items,
+        "deleted": [{"id": "0"}],
+        "new": True,
+    }
+
+    # The journal is compacted into the snapshot once it outgrows it
+    for idx in range(50):
+        items[idx] = {"id": str(idx), "name": "Renamed"}
+        await store.async_save({"items": items, "deleted": [], "new": True})
+    assert os.path.getsize(store.journal_path) <= os.path.getsize(store.path)
+    snapshot = json.loads(await hass.async_add_executor_job(_read, store.path))
+    assert snapshot["journal_seq"] > 4
+    assert snapshot["data"]["items"] != items
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store.async_load() == {"items": items, "deleted": [], "new": True}
+
+    await store.async_remove()
+    assert not os.path.exists(store.path)
+    assert not os.path.exists(store.journal_path)
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_incomplete_record(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an incomplete journal record is ignored and then compacted."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save([{"state": "on"}, {"state": "off"}])
+    await store.async_save([{"state": "on"}, {"state": "unavailable"}])
+
+    def _truncate_journal() -> None:
+        with open(store.journal_path, "a", encoding="utf-8") as fdesc:
+            fdesc.write('{"seq":3,"ops":[["l",null,0,1,')
+
+    await hass.async_add_executor_job(_truncate_journal)
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store.async_load() == [{"state": "on"}, {"state": "unavailable"}]
+    assert "Ignoring incomplete records in the journal" in caplog.text
+
+    await store.async_save([{"state": "off"}, {"state": "unavailable"}])
+    assert not os.path.exists(store.journal_path)
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store.async_load() == [{"state": "off"}, {"state": "unavailable"}]
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_write_before_load(tmpdir: py.path.local) -> None:
+    """Test a journaled store written before loading drops the old journal."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save([{"state": "on"}, {"state": "off"}])
+    await store.async_save([{"state": "on"}, {"state": "unavailable"}])
+    await store.async_save([{"state": "off"}, {"state": "unavailable"}])
+    assert os.path.exists(store.journal_path)
+
+    save_json = storage.json_helper.save_json
+
+    def _save_json_and_crash(*args: Any, **kwargs: Any) -> None:
+        save_json(*args, **kwargs)
+        raise RuntimeError("Interrupted")
+
+    # Interrupted after writing the snapshot, before any cleanup
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    with patch(
+        "homeassistant.helpers.storage.json_helper.save_json",
+        _save_json_and_crash,
+    ), pytest.raises(RuntimeError):
+        await hass.async_add_executor_job(
+            store._write_data,
+            store.path,
+            {
+                "version": MOCK_VERSION,
+                "minor_version": 1,
+                "key": MOCK_KEY,
+                "data": [{"state": "idle"}],
+            },
+        )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store.async_load() == [{"state": "idle"}]
+
+    await hass.async_stop(force=True)
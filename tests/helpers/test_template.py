@@ -4074,26 +4074,26 @@ def test_iif(hass: HomeAssistant) -> None:
 
 
 async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+    """Test compiled templates are kept after the templates are deleted."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
+    cache_key = (template_string, False, False)
     tpl = template.Template(
         (template_string),
     )
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template._NO_HASS_ENV.template_cache.code.get(cache_key)
 
     tpl2 = template.Template(
         (template_string),
     )
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert tpl2._compiled_code is tpl._compiled_code
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template._NO_HASS_ENV.template_cache.code.get(cache_key)
 
 
 def test_is_template_string() -> None:
@@ -4588,3 +4588,122 @@ async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     assert template.CACHED_TEMPLATE_NO_COLLECT_LRU.get_size() == int(
         round(mock_entity_count * template.ENTITY_COUNT_GROWTH_FACTOR)
     )
+
+
+@pytest.mark.parametrize(
+    ("template_str", "fast_path"),
+    [
+        ("{{ states('sensor.temperature') | float * 1.8 + 32 }}", True),
+        ("{{ is_state('light.a', 'on') and is_state('light.b', 'on') }}", True),
+        ("{{ is_state('light.a', 'on') or is_state('light.b', 'on') }}", True),
+        ("{{ not is_state('light.b', 'on') }}", True),
+        ("{{ states('sensor.temperature') | float(0) | round(1) }} °C", True),
+        ("{{ states('sensor.missing') | float(5) // 2 }}", True),
+        ("{{ -(states('sensor.temperature') | int) % 7 }}", True),
+        ("{{ 10 < states('sensor.temperature') | float <= 25 }}", True),
+        ("{{ 'hot' if states('sensor.temperature') | float > 20 else 'cold' }}", True),
+        ("{{ state_attr('light.a', 'brightness') / 255 * 100 }}", True),
+        ("{{ is_state_attr('light.a', 'brightness', 128) }}", True),
+        ("{{ has_value('sensor.missing') }}", True),
+        ("{{ float(states('sensor.temperature')) | multiply(2) }}", True),
+        ("{{ states('sensor.temperature', with_unit=True) | upper }}", True),
+        ("{{ states.sensor.temperature.state | float * 2 }}", False),
+        ("{{ states('sensor.temperature') ~ 'x' }}", False),
+        ("{{ 'on' in states('light.a') }}", False),
+        ("{% if is_state('light.a', 'on') %}yes{% endif %}", False),
+        ("{{ states('sensor.temperature') | float + value }}", False),
+    ],
+)
+async def test_fast_path_render(
+    hass: HomeAssistant, template_str: str, fast_path: bool
+) -> None:
+    """Test simple templates are rendered without jinja with the same result."""
+    hass.states.async_set(
+        "sensor.temperature", "22.25", {"unit_of_measurement": "°C"}
+    )
+    hass.states.async_set("light.a", "on", {"brightness": 128})
+    hass.states.async_set("light.b", "off")
+
+    jinja_tmp = template.Template(template_str, hass)
+    with patch.object(template.TemplateEnvironment, "fast_render", return_value=None):
+        jinja_info = jinja_tmp.async_render_to_info({"value": 1})
+    assert jinja_tmp._fast_render is None
+
+    tmp = template.Template(template_str, hass)
+    with patch(
+        "homeassistant.helpers.template._render_with_context",
+        wraps=template._render_with_context,
+    ) as render_with_jinja:
+        info = tmp.async_render_to_info({"value": 1})
+    assert (tmp._fast_render is not None) is fast_path
+    assert render_with_jinja.called is not fast_path
+
+    assert info.result() == jinja_info.result()
+    assert info.entities == jinja_info.entities
+
+
+async def test_fast_path_render_errors(hass: HomeAssistant) -> None:
+    """Test the fast path raises the same errors as jinja."""
+    hass.states.async_set("sensor.temperature", "unknown")
+    tmp = template.Template("{{ states('sensor.temperature') | float * 2 }}", hass)
+
+    with pytest.raises(
+        TemplateError,
+        match="float got invalid input 'unknown' when rendering template",
+    ):
+        tmp.async_render()
+    assert tmp._fast_render is not None
+
+    limited_tmp = template.Template("{{ states('sensor.temperature') }}", hass)
+    with pytest.raises(
+        TemplateError, match="Use of 'states' is not supported in limited templates"
+    ):
+        limited_tmp.async_render(limited=True)
+
+
+async def test_fast_path_render_shadowed_globals(hass: HomeAssistant) -> None:
+    """Test variables shadowing a global fall back to jinja."""
+    hass.states.async_set("sensor.temperature", "20")
+    tmp = template.Template("{{ states('sensor.temperature') | int + 1 }}", hass)
+
+    assert tmp.async_render() == 21
+    assert tmp._fast_render is not None
+    assert tmp.async_render({"states": lambda entity_id: "5"}) == 6
+
+
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test templates with the same source share the compiled template."""
+    hass.states.async_set("sensor.temperature", "20")
+    source = "{{ states('sensor.temperature') | int + 1 }}"
+    tmp1 = template.Template(source, hass)
+    tmp2 = template.Template(source, hass)
+    limited_tmp = template.Template(source, hass)
+
+    assert tmp1.async_render() == 21
+    assert tmp2.async_render() == 21
+    with pytest.raises(TemplateError):
+        limited_tmp.async_render(limited=True)
+
+    assert tmp1._compiled_code is tmp2._compiled_code
+    assert tmp1._fast_render is tmp2._fast_render
+    assert tmp1._fast_render is not limited_tmp._fast_render
+
+    cache = template._get_compiled_template_cache(hass)
+    assert set(cache.fast_render.keys()) == {
+        (source, False, False),
+        (source, True, False),
+    }
+
+
+async def test_compiled_template_cache_size(hass: HomeAssistant) -> None:
+    """Test the compiled template cache is bounded."""
+    with patch.object(template, "COMPILED_TEMPLATE_CACHE_SIZE", 2):
+        for number in range(4):
+            tmp = template.Template(f"{{{{ {number} + 1 }}}}", hass)
+            assert tmp.async_render() == number + 1
+
+    cache = template._get_compiled_template_cache(hass)
+    assert cache.code.keys() == [
+        ("{{ 3 + 1 }}", False, False),
+        ("{{ 2 + 1 }}", False, False),
+    ]
@@ -11,7 +11,7 @@ import pytest
 from homeassistant import bootstrap, runner
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS, __version__
 from homeassistant.core import HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
@@ -821,6 +821,66 @@ async def test_bootstrap_is_cancellation_safe(
     assert "Error setting up integration cancel_integration" in caplog.text
 
 
+@pytest.mark.parametrize("load_registries", [False])
+@pytest.mark.parametrize(
+    ("ha_version", "pre_imported"), [(__version__, True), ("2023.1.0", False)]
+)
+async def test_pre_import_from_import_graph(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    ha_version: str,
+    pre_imported: bool,
+) -> None:
+    """Test integrations are pre-imported from the graph of the previous start."""
+    hass_storage[bootstrap.STORAGE_IMPORT_GRAPH_KEY] = {
+        "version": bootstrap.STORAGE_IMPORT_GRAPH_VERSION,
+        "data": {"ha_version": ha_version, "integrations": {"group": ["light"]}},
+    }
+
+    with patch(
+        "homeassistant.loader.async_pre_import_integrations"
+    ) as mock_pre_import:
+        await bootstrap._async_set_up_integrations(
+            hass, {"group hello": {}, "homeassistant": {}}
+        )
+
+    assert "group" in hass.config.components
+    assert len(mock_pre_import.mock_calls) == int(pre_imported)
+    if pre_imported:
+        integrations, import_graph = mock_pre_import.mock_calls[0].args[1:]
+        assert "group" in {integration.domain for integration in integrations}
+        assert import_graph == {"group": ["light"]}
+
+    stored = hass_storage[bootstrap.STORAGE_IMPORT_GRAPH_KEY]["data"]
+    assert stored["ha_version"] == __version__
+    assert "group" in stored["integrations"]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_manifest_index(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the manifest index of the previous start is restored."""
+    await bootstrap._async_set_up_integrations(
+        hass, {"group hello": {}, "homeassistant": {}}
+    )
+    index = hass_storage[bootstrap.STORAGE_MANIFEST_INDEX_KEY]["data"]
+    assert "group" in index["integrations"]
+
+    with patch(
+        "homeassistant.loader.async_restore_manifest_index", return_value=True
+    ) as mock_restore, patch(
+        "homeassistant.bootstrap.Store.async_save"
+    ) as mock_save:
+        await bootstrap._async_set_up_integrations(
+            hass, {"group hello": {}, "homeassistant": {}}
+        )
+
+    assert mock_restore.mock_calls[0].args[1] == index
+    # The manifest index did not change, only the import graph is saved
+    assert len(mock_save.mock_calls) == 1
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_bootstrap_empty_integrations(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
@@ -797,6 +797,72 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_indexed_state_changed_listener(hass: HomeAssistant) -> None:
+    """Test state changed listeners indexed by entity_id and domain."""
+    entity_calls = []
+    domain_calls = []
+
+    @ha.callback
+    def entity_listener(event):
+        """Mock entity listener."""
+        entity_calls.append(event)
+
+    @ha.callback
+    def domain_listener(event):
+        """Mock domain listener."""
+        domain_calls.append(event)
+
+    old_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    unsub_entity = hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        entity_listener,
+        entity_ids=["light.Kitchen", "switch.porch"],
+    )
+    unsub_domain = hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        domain_listener,
+        event_filter=ha.callback(lambda event: event.data["new_state"] is not None),
+        domains=["light"],
+    )
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 2
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("switch.porch", "on")
+    hass.states.async_set("switch.garage", "on")
+    hass.states.async_remove("light.bedroom")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in entity_calls] == [
+        "light.kitchen",
+        "switch.porch",
+    ]
+    assert [event.data["entity_id"] for event in domain_calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+
+    unsub_entity()
+    unsub_domain()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == old_count
+
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 2
+    assert len(domain_calls) == 2
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen("test", entity_listener, entity_ids=["light.kitchen"])
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            entity_listener,
+            entity_ids=["light.kitchen"],
+            domains=["light"],
+        )
+
+
 async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     """Test we can call events immediately."""
     calls = []
@@ -1114,6 +1180,118 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.ceiling", "off")
+    bowl = hass.states.get("light.bowl")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [
+            ("sensor.Power", "10", {"unit_of_measurement": "W"}),
+            ("light.bowl", "on", {"brightness": 200}),
+            ("sensor.power", "20", {"unit_of_measurement": "W"}),
+            ("light.ceiling", "off", None),
+            ("sensor.power", "30", {"unit_of_measurement": "W"}),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    # Repeated writes are coalesced and unchanged states are skipped
+    assert [event.data["entity_id"] for event in events] == [
+        "sensor.power",
+        "light.bowl",
+    ]
+    assert events[0].data["old_state"] is None
+    assert events[0].data["new_state"].state == "30"
+    assert events[1].data["old_state"] is bowl
+    assert events[0].context is events[1].context
+
+    power = hass.states.get("sensor.power")
+    bowl2 = hass.states.get("light.bowl")
+    assert power.last_updated == bowl2.last_updated
+    assert bowl2.attributes == {"brightness": 200}
+    assert bowl2.last_changed == bowl.last_changed
+
+    hass.states.async_set_many([])
+    hass.states.async_set_many([("light.ceiling", "off", None)], force_update=True)
+    await hass.async_block_till_done()
+    assert len(events) == 3
+
+
+async def test_statemachine_set_many_invalid(hass: HomeAssistant) -> None:
+    """Test an invalid entry leaves the whole batch unapplied."""
+    hass.states.async_set("light.bowl", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [
+                ("light.bowl", "off", None),
+                ("sensor.power", "10", None),
+                ("invalid_entity_id", "on", None),
+            ]
+        )
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [("light.bowl", "off", None), ("sensor.power", "x" * 256, None)]
+        )
+    await hass.async_block_till_done()
+
+    assert len(events) == 0
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("sensor.power") is None
+
+
+async def test_statemachine_domain_version(hass: HomeAssistant) -> None:
+    """Test the version of a domain changes with its states."""
+    assert hass.states.async_domain_version("light") == 0
+    assert hass.states.async_domain_version("light", lifecycle=True) == 0
+
+    hass.states.async_set("light.bowl", "on")
+    version = hass.states.async_domain_version("light")
+    lifecycle_version = hass.states.async_domain_version("light", lifecycle=True)
+    hass.states.async_set("light.bowl", "off")
+    assert hass.states.async_domain_version("light") > version
+    assert (
+        hass.states.async_domain_version("light", lifecycle=True) == lifecycle_version
+    )
+
+    version = hass.states.async_domain_version("light")
+    hass.states.async_set("switch.ac", "on")
+    assert hass.states.async_domain_version("LIGHT") == version
+
+    hass.states.async_remove("light.bowl")
+    assert hass.states.async_domain_version("light") > version
+    assert hass.states.async_domain_version("light", lifecycle=True) > lifecycle_version
+
+
+async def test_statemachine_shares_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test consecutive states with the same attributes share them."""
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    state = hass.states.get("sensor.power")
+    assert hass.states.async_attributes_info() == {"shared": 0, "created": 1}
+
+    hass.states.async_set("sensor.power", "20", {"unit_of_measurement": "W"})
+    state2 = hass.states.get("sensor.power")
+    assert state2.attributes is state.attributes
+    assert hass.states.async_attributes_info() == {"shared": 1, "created": 1}
+
+    hass.states.async_set_many(
+        [("sensor.power", "30", {"unit_of_measurement": "W"})]
+    )
+    state3 = hass.states.get("sensor.power")
+    assert state3.attributes is state.attributes
+    assert hass.states.async_attributes_info() == {"shared": 2, "created": 1}
+
+    hass.states.async_set("sensor.power", "30", {"unit_of_measurement": "kW"})
+    state4 = hass.states.get("sensor.power")
+    assert state4.attributes is not state.attributes
+    assert state4.attributes == {"unit_of_measurement": "kW"}
+    assert hass.states.async_attributes_info() == {"shared": 2, "created": 2}
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
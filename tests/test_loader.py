@@ -1,4 +1,5 @@
 """Test to verify that we can load components."""
+import importlib
 from unittest.mock import patch
 
 import pytest
@@ -733,3 +734,97 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_pre_import_integrations(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test integrations in the import graph are imported in the executor."""
+    hue_integration = await loader.async_get_integration(hass, "hue")
+    broken_integration = mock_integration(hass, MockModule("broken"))
+    http_integration = await loader.async_get_integration(hass, "http")
+    custom_integration = mock_integration(hass, MockModule("custom"), built_in=False)
+
+    with patch(
+        "homeassistant.loader.importlib.import_module", wraps=importlib.import_module
+    ) as mock_import:
+        await loader.async_pre_import_integrations(
+            hass,
+            [hue_integration, broken_integration, http_integration, custom_integration],
+            {"hue": ["light"], "broken": [], "custom": []},
+        )
+
+    assert {call.args[0] for call in mock_import.call_args_list} == {
+        "homeassistant.components.hue",
+        "homeassistant.components.hue.light",
+        "homeassistant.components.broken",
+    }
+    assert "Unable to pre-import homeassistant.components.broken" in caplog.text
+    assert hass.data[loader.DATA_IMPORT_TIMES].keys() == {"hue", "broken"}
+
+
+async def test_get_import_graph(hass: HomeAssistant) -> None:
+    """Test the import graph contains the imported built-in integrations."""
+    integration = await loader.async_get_integration(hass, "hue")
+    integration.get_component()
+    integration.get_platform("light")
+    mock_integration(hass, MockModule("custom"), built_in=False)
+
+    assert loader.async_get_import_graph(hass) == {"hue": ["light"]}
+    assert hass.data[loader.DATA_IMPORT_TIMES].keys() == {"hue"}
+
+
+async def test_manifest_index(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test restoring the integrations from the manifest index."""
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert await integration.resolve_dependencies()
+    await loader.async_get_integration(hass, "test_package")
+    custom = await loader.async_get_custom_components(hass)
+    index = await loader.async_get_manifest_index(hass)
+
+    assert "test_bad_version" in index["custom_components"]
+    assert index["integrations"]["logbook"]["all_dependencies"] == sorted(
+        integration.all_dependencies
+    )
+    assert "test_package" in index["integrations"]
+    assert index["integrations"]["http"]["manifest"]["domain"] == "http"
+
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    del hass.data[loader.DATA_CUSTOM_COMPONENTS]
+    caplog.clear()
+    with patch(
+        "homeassistant.loader.Integration.resolve_from_root",
+        wraps=loader.Integration.resolve_from_root,
+    ) as mock_resolve:
+        assert await loader.async_restore_manifest_index(hass, index)
+        restored = await loader.async_get_integration(hass, "logbook")
+        restored_custom = await loader.async_get_custom_components(hass)
+
+    # Only the blocked custom integrations are resolved again
+    assert {call.args[2] for call in mock_resolve.mock_calls} == {
+        "test_bad_version",
+        "test_no_version",
+    }
+    assert "does not have a valid version key" in caplog.text
+    assert restored is not integration
+    assert restored.all_dependencies == integration.all_dependencies
+    assert restored.manifest == integration.manifest
+    assert restored_custom.keys() == custom.keys()
+
+
+async def test_manifest_index_changed(hass: HomeAssistant) -> None:
+    """Test the manifest index is not restored once manifests changed."""
+    await loader.async_get_integration(hass, "logbook")
+    index = await loader.async_get_manifest_index(hass)
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+
+    assert not await loader.async_restore_manifest_index(
+        hass, {**index, "ha_version": "2023.1.0"}
+    )
+    index["integrations"]["logbook"]["manifest_mtime"] -= 1
+    assert not await loader.async_restore_manifest_index(hass, index)
+    assert hass.data[loader.DATA_INTEGRATIONS] == {}